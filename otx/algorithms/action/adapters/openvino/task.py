@@ -37,6 +37,7 @@ from otx.algorithms.action.adapters.openvino import (
     model_wrappers,
 )
 from otx.algorithms.action.configs.base import ActionConfig
+from otx.algorithms.common.utils.ir import get_ir_model_data, get_ir_model_paths
 from otx.api.entities.annotation import AnnotationSceneEntity
 from otx.api.entities.datasets import DatasetEntity, DatasetItemEntity
 from otx.api.entities.inference_parameters import (
@@ -183,12 +184,13 @@ class ActionOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IOpti
         if self.model is None:
             raise RuntimeError("load_inferencer failed, model is None")
 
+        model_file, weight_file = get_ir_model_data(self.model)
         return ActionOpenVINOInferencer(
             self.task_type,
             self.hparams,
             self.task_environment.label_schema,
-            self.model.get_data("openvino.xml"),
-            self.model.get_data("openvino.bin"),
+            model_file,
+            weight_file,
         )
 
     # pylint: disable=no-value-for-parameter
@@ -284,12 +286,7 @@ class ActionOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IOpti
             raise RuntimeError("optimize failed, model is None")
 
         with tempfile.TemporaryDirectory() as tempdir:
-            xml_path = os.path.join(tempdir, "model.xml")
-            bin_path = os.path.join(tempdir, "model.bin")
-            with open(xml_path, "wb") as f:
-                f.write(self.model.get_data("openvino.xml"))
-            with open(bin_path, "wb") as f:
-                f.write(self.model.get_data("openvino.bin"))
+            xml_path, bin_path = get_ir_model_paths(self.model, tempdir)
 
             model_config = ADDict({"model_name": "openvino_model", "model": xml_path, "weights": bin_path})
 
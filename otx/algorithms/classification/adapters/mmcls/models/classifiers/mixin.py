@@ -3,16 +3,13 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
-from collections import defaultdict
-from typing import Any, Dict, List
-
 import datumaro as dm
 import numpy as np
-import pandas as pd
 
 from otx.algorithms.common.utils.logger import get_logger
 from otx.api.entities.dataset_item import DatasetItemEntityWithID
 from otx.core.data.noisy_label_detection import (
+    LossDynamicsStore,
     LossDynamicsTracker,
     LossDynamicsTrackingMixin,
 )
@@ -36,7 +33,7 @@ class MultiClassClsLossDynamicsTracker(LossDynamicsTracker):
 
     def __init__(self) -> None:
         super().__init__()
-        self._loss_dynamics: Dict[Any, List] = defaultdict(list)
+        self._loss_dynamics = LossDynamicsStore()
 
     def _convert_anns(self, item: DatasetItemEntityWithID):
         labels = [
@@ -52,25 +49,16 @@ class MultiClassClsLossDynamicsTracker(LossDynamicsTracker):
         label_ids = np.squeeze(outputs["label_ids"])
         loss_dyns = outputs["loss_dyns"]
 
-        for entity_id, label_id, loss_dyn in zip(entity_ids, label_ids, loss_dyns):
-            self._loss_dynamics[(entity_id, label_id)].append((iter, loss_dyn))
+        self._loss_dynamics.append(iter, list(zip(entity_ids, np.atleast_1d(label_ids))), loss_dyns)
 
     def export(self, output_path: str) -> None:
         """Export loss dynamics statistics to Datumaro format."""
-        df = pd.DataFrame.from_dict(
-            {
-                k: (np.array([iter for iter, _ in arr]), np.array([value for _, value in arr]))
-                for k, arr in self._loss_dynamics.items()
-            },
-            orient="index",
-            columns=["iters", "loss_dynamics"],
-        )
-
-        for (entity_id, label_id), row in df.iterrows():
+        for (entity_id, label_id), iters, values in self._loss_dynamics.group_by_key():
+            attrs = {"iters": iters, "loss_dynamics": values.astype(np.float32)}
             item = self._export_dataset.get(entity_id, "train")
             for ann in item.annotations:
                 if isinstance(ann, dm.Label) and ann.label == self.otx_label_map[label_id]:
-                    ann.attributes = row.to_dict()
+                    ann.attributes = attrs
 
         self._export_dataset.export(output_path, format="datumaro")
 
@@ -12,6 +12,7 @@ from otx.algorithms.common.adapters.mmdeploy.utils.utils import (
     sync_batchnorm_2_batchnorm,
 )
 from otx.algorithms.common.utils.logger import get_logger
+from otx.core.file import get_cache_dir
 
 logger = get_logger()
 
@@ -73,4 +74,5 @@ class ClassificationExporter(Exporter):
             output_names=["logits"],
             opset_version=opset_version,
             export_type=export_type,
+            cache_dir=get_cache_dir("export"),
         )
@@ -19,14 +19,16 @@ import json
 import logging
 import os
 import tempfile
+import threading
 import time
 import warnings
-from typing import Any, Dict, List, Optional, Tuple, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
 from zipfile import ZipFile
 
 import numpy as np
 from addict import Dict as ADDict
-from compression.api import DataLoader
 from compression.engines.ie_engine import IEEngine
 from compression.graph import load_model, save_model
 from compression.graph.model_utils import compress_model_weights, get_nodes_by_type
@@ -38,8 +40,11 @@ from otx.algorithms.classification.utils import (
     get_cls_deploy_config,
     get_cls_inferencer_configuration,
 )
+from otx.algorithms.common.utils.calibration import CalibrationDataLoader
+from otx.algorithms.common.utils.ir import get_ir_model_data, get_ir_model_paths
 from otx.algorithms.common.utils.utils import get_default_async_reqs_num
 from otx.api.entities.annotation import AnnotationSceneEntity
+from otx.api.entities.dataset_item import DatasetItemEntity
 from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.explain_parameters import ExplainParameters
 from otx.api.entities.inference_parameters import (
@@ -76,6 +81,7 @@ from otx.api.usecases.tasks.interfaces.optimization_interface import (
     OptimizationType,
 )
 from otx.api.utils.dataset_utils import add_saliency_maps_to_dataset_item
+from otx.core.file import get_cache_dir
 
 try:
     from openvino.model_zoo.model_api.adapters import OpenvinoAdapter, create_core
@@ -179,29 +185,6 @@ class ClassificationOpenVINOInferencer(BaseInferencer):
         return self.model.infer_sync(image)
 
 
-class OTXOpenVinoDataLoader(DataLoader):
-    """DataLoader implementation for ClassificationOpenVINOTask."""
-
-    def __init__(self, dataset: DatasetEntity, inferencer: BaseInferencer):
-        super().__init__(config=None)
-        self.dataset = dataset
-        self.inferencer = inferencer
-
-    def __getitem__(self, index: int):
-        """Get item from dataset."""
-
-        image = self.dataset[index].numpy
-        annotation = self.dataset[index].annotation_scene
-        inputs, metadata = self.inferencer.pre_process(image)
-
-        return (index, annotation), inputs, metadata
-
-    def __len__(self):
-        """Get length of dataset."""
-
-        return len(self.dataset)
-
-
 class ClassificationOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IExplainTask, IOptimizationTask):
     """Task implementation for OTXClassification using OpenVINO backend."""
 
@@ -217,11 +200,12 @@ class ClassificationOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTas
         if self.model is None:
             raise RuntimeError("load_inferencer failed, model is None")
 
+        model_file, weight_file = get_ir_model_data(self.model)
         return ClassificationOpenVINOInferencer(
             self.hparams,
             self.task_environment.label_schema,
-            self.model.get_data("openvino.xml"),
-            self.model.get_data("openvino.bin"),
+            model_file,
+            weight_file,
             num_requests=get_default_async_reqs_num(),
         )
 
@@ -299,24 +283,36 @@ class ClassificationOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTas
 
         return dataset
 
+    # pylint: disable-msg=too-many-locals
     def explain(
         self,
         dataset: DatasetEntity,
         explain_parameters: Optional[ExplainParameters] = None,
     ) -> DatasetEntity:
-        """Explain function of ClassificationOpenVINOTask."""
+        """Explain function of ClassificationOpenVINOTask.
+
+        With async inference, images are decoded and saliency maps are post-processed by a pool of threads
+        while the infer requests run. Processed saliency maps are kept at the model output resolution
+        and resized to the image resolution only when they are read.
+        """
 
         update_progress_callback = default_progress_callback
         process_saliency_maps = False
         explain_predicted_classes = True
+        enable_async_inference = True
+        prediction_store = None
         if explain_parameters is not None:
             update_progress_callback = explain_parameters.update_progress  # type: ignore
             process_saliency_maps = explain_parameters.process_saliency_maps
             explain_predicted_classes = explain_parameters.explain_predicted_classes
+            enable_async_inference = explain_parameters.enable_async_inference
+            prediction_store = explain_parameters.prediction_store
 
-        dataset_size = len(dataset)
-        for i, dataset_item in enumerate(dataset, 1):
-            predicted_scene, _, saliency_map, _, _ = self.inferencer.predict(dataset_item.numpy)
+        labels = self.task_environment.get_labels()
+
+        def add_explanation(
+            dataset_item: DatasetItemEntity, predicted_scene: AnnotationSceneEntity, saliency_map: Optional[np.ndarray]
+        ):
             if saliency_map is None:
                 raise RuntimeError(
                     "There is no Saliency Map in OpenVINO IR model output. "
@@ -329,12 +325,69 @@ class ClassificationOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTas
                 dataset_item=dataset_item,
                 saliency_map=saliency_map,
                 model=self.model,
-                labels=self.task_environment.get_labels(),
+                labels=labels,
                 predicted_scored_labels=item_labels,
                 explain_predicted_classes=explain_predicted_classes,
                 process_saliency_maps=process_saliency_maps,
+                lazy_process_saliency_maps=True,
+                prediction_store=prediction_store,
             )
-            update_progress_callback(int(i / dataset_size * 100))
+
+        dataset_size = len(dataset)
+        if not enable_async_inference:
+            for i, dataset_item in enumerate(dataset, 1):
+                predicted_scene, _, saliency_map, _, _ = self.inferencer.predict(dataset_item.numpy)
+                add_explanation(dataset_item, predicted_scene, saliency_map)
+                update_progress_callback(int(i / dataset_size * 100))
+            return dataset
+
+        num_workers = get_default_async_reqs_num()
+        # Bounds the number of images being decoded, inferred or post-processed at once
+        slots = threading.Semaphore(2 * num_workers)
+        errors: List[Exception] = []
+        num_callback_exceptions = len(self.inferencer.callback_exceptions)
+
+        def check_errors():
+            if errors:
+                raise errors[0]
+            if len(self.inferencer.callback_exceptions) > num_callback_exceptions:
+                raise self.inferencer.callback_exceptions[num_callback_exceptions]
+
+        with ThreadPoolExecutor(max_workers=num_workers) as pool:
+
+            def post_process(id: int, predicted_scene: AnnotationSceneEntity, aux_data: tuple):
+                # Called by the infer requests, so that the heavy work is moved to the pool
+                saliency_map = aux_data[1]
+
+                def run():
+                    try:
+                        add_explanation(dataset[id], predicted_scene, saliency_map)
+                    except Exception as e:  # pylint: disable=broad-except
+                        errors.append(e)
+                    finally:
+                        slots.release()
+
+                pool.submit(run)
+
+            def enqueue(pending_image: Tuple[int, Future]):
+                id, image = pending_image
+                self.inferencer.enqueue_prediction(image.result(), id, post_process)
+                update_progress_callback(int((id + 1) / dataset_size * 100))
+
+            pending_images: Deque[Tuple[int, Future]] = deque()
+            try:
+                for i, dataset_item in enumerate(dataset):
+                    while not slots.acquire(timeout=0.1):
+                        check_errors()
+                    check_errors()
+                    pending_images.append((i, pool.submit(lambda item=dataset_item: item.numpy)))
+                    if len(pending_images) > num_workers:
+                        enqueue(pending_images.popleft())
+                while pending_images:
+                    enqueue(pending_images.popleft())
+            finally:
+                self.inferencer.await_all()
+        check_errors()
         return dataset
 
     def evaluate(self, output_resultset: ResultSetEntity, evaluation_metric: Optional[str] = None):
@@ -393,18 +446,18 @@ class ClassificationOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTas
             raise ValueError("POT is the only supported optimization type for OpenVino models")
 
         dataset = dataset.get_subset(Subset.TRAINING)
-        data_loader = OTXOpenVinoDataLoader(dataset, self.inferencer)
+        data_loader = CalibrationDataLoader(
+            dataset,
+            self.inferencer,
+            self.hparams.pot_parameters.stat_subset_size,
+            cache_dir=get_cache_dir("calibration"),
+        )
 
         if self.model is None:
             raise RuntimeError("optimize failed, model is None")
 
         with tempfile.TemporaryDirectory() as tempdir:
-            xml_path = os.path.join(tempdir, "model.xml")
-            bin_path = os.path.join(tempdir, "model.bin")
-            with open(xml_path, "wb") as f:
-                f.write(self.model.get_data("openvino.xml"))
-            with open(bin_path, "wb") as f:
-                f.write(self.model.get_data("openvino.bin"))
+            xml_path, bin_path = get_ir_model_paths(self.model, tempdir)
 
             model_config = ADDict({"model_name": "openvino_model", "model": xml_path, "weights": bin_path})
 
@@ -418,7 +471,6 @@ class ClassificationOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTas
 
         engine_config = ADDict({"device": "CPU"})
 
-        stat_subset_size = self.hparams.pot_parameters.stat_subset_size
         preset = self.hparams.pot_parameters.preset.name.lower()
 
         algorithms = [
@@ -427,8 +479,8 @@ class ClassificationOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTas
                 "params": {
                     "target_device": "ANY",
                     "preset": preset,
-                    "stat_subset_size": min(stat_subset_size, len(data_loader)),
-                    "shuffle_data": True,
+                    "stat_subset_size": len(data_loader),
+                    "shuffle_data": False,
                 },
             }
         ]
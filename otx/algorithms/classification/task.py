@@ -18,7 +18,7 @@ import io
 import json
 import os
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import torch
@@ -47,6 +47,7 @@ from otx.api.entities.inference_parameters import (
 from otx.api.entities.inference_parameters import (
     default_progress_callback as default_infer_progress_callback,
 )
+from otx.api.entities.label import LabelEntity
 from otx.api.entities.metadata import FloatMetadata, FloatType
 from otx.api.entities.metrics import (
     CurveMetric,
@@ -73,7 +74,10 @@ from otx.api.entities.train_parameters import (
 from otx.api.serialization.label_mapper import label_schema_to_bytes
 from otx.api.usecases.evaluation.metrics_helper import MetricsHelper
 from otx.api.usecases.tasks.interfaces.export_interface import ExportType
-from otx.api.utils.dataset_utils import add_saliency_maps_to_dataset_item
+from otx.api.utils.dataset_utils import (
+    add_feature_vector_to_dataset_item,
+    add_saliency_maps_to_dataset_item,
+)
 from otx.api.utils.labels_utils import get_empty_label
 from otx.cli.utils.multi_gpu import is_multigpu_child_process
 
@@ -101,7 +105,12 @@ class OTXClassificationTask(OTXTask, ABC):
 
         self._multilabel = False
         self._hierarchical = False
-        self._hierarchical_info = None
+        self._hierarchical_info: Optional[Dict[str, Any]] = None
+        # labels and hierarchical info the tables were built for, index to label table of each multiclass head
+        # and index to label table of the multilabel classes
+        self._hierarchical_label_tables: Optional[
+            Tuple[List[LabelEntity], Dict[str, Any], List[List[Optional[LabelEntity]]], List[Optional[LabelEntity]]]
+        ] = None
         self._selfsl = False
         self._set_train_mode()
 
@@ -163,13 +172,20 @@ class OTXClassificationTask(OTXTask, ABC):
         update_progress_callback = default_infer_progress_callback
         process_saliency_maps = False
         explain_predicted_classes = True
+        prediction_store = None
         if inference_parameters is not None:
             update_progress_callback = inference_parameters.update_progress  # type: ignore
             process_saliency_maps = inference_parameters.process_saliency_maps
             explain_predicted_classes = inference_parameters.explain_predicted_classes
+            prediction_store = inference_parameters.prediction_store
 
         self._add_predictions_to_dataset(
-            prediction_results, dataset, update_progress_callback, process_saliency_maps, explain_predicted_classes
+            prediction_results,
+            dataset,
+            update_progress_callback,
+            process_saliency_maps,
+            explain_predicted_classes,
+            prediction_store,
         )
         return dataset
 
@@ -291,10 +307,12 @@ class OTXClassificationTask(OTXTask, ABC):
         update_progress_callback = default_infer_progress_callback
         process_saliency_maps = False
         explain_predicted_classes = True
+        prediction_store = None
         if explain_parameters is not None:
             update_progress_callback = explain_parameters.update_progress  # type: ignore
             process_saliency_maps = explain_parameters.process_saliency_maps
             explain_predicted_classes = explain_parameters.explain_predicted_classes
+            prediction_store = explain_parameters.prediction_store
 
         self._add_explanations_to_dataset(
             predictions,
@@ -303,6 +321,7 @@ class OTXClassificationTask(OTXTask, ABC):
             update_progress_callback,
             process_saliency_maps,
             explain_predicted_classes,
+            prediction_store,
         )
         logger.info("Explain completed")
         return dataset
@@ -332,33 +351,42 @@ class OTXClassificationTask(OTXTask, ABC):
         update_progress_callback,
         process_saliency_maps=False,
         explain_predicted_classes=True,
+        prediction_store=None,
     ):
         """Loop over dataset again to assign predictions.Convert from MMClassification format to OTX format."""
 
         dataset_size = len(dataset)
         pos_thr = 0.5
-        for i, (dataset_item, prediction_items) in enumerate(zip(dataset, prediction_results)):
-            prediction_item, feature_vector, saliency_map = prediction_items
-            if any(np.isnan(prediction_item)):
-                logger.info("Nan in prediction_item.")
+        prediction_results = list(prediction_results)
+        if not prediction_results:
+            return
+        predictions = np.stack([np.asarray(prediction[0]).reshape(-1) for prediction in prediction_results])
+        for row in np.flatnonzero(np.isnan(predictions).any(axis=1)):
+            logger.info(f"Nan in prediction_item {row}.")
+
+        batch_labels = self._get_batch_labels(predictions, pos_thr)
+        # Margin between the two most confident classes
+        top_probs = np.partition(predictions, -2, axis=1)[:, -2:]
+        active_scores = (top_probs[:, 1] - top_probs[:, 0]).tolist()
 
-            item_labels = self._get_item_labels(prediction_item, pos_thr)
+        for i, (dataset_item, prediction_items) in enumerate(zip(dataset, prediction_results)):
+            _, feature_vector, saliency_map = prediction_items
+            item_labels = batch_labels[i]
 
             dataset_item.append_labels(item_labels)
 
-            probs = TensorEntity(name="probabilities", numpy=prediction_item.reshape(-1))
+            probs = TensorEntity(name="probabilities", numpy=predictions[i])
             dataset_item.append_metadata_item(probs, model=self._task_environment.model)
 
-            top_idxs = np.argpartition(prediction_item, -2)[-2:]
-            top_probs = prediction_item[top_idxs]
             active_score_media = FloatMetadata(
-                name="active_score", value=top_probs[1] - top_probs[0], float_type=FloatType.ACTIVE_SCORE
+                name="active_score", value=active_scores[i], float_type=FloatType.ACTIVE_SCORE
             )
             dataset_item.append_metadata_item(active_score_media, model=self._task_environment.model)
 
             if feature_vector is not None:
-                active_score = TensorEntity(name="representation_vector", numpy=feature_vector.reshape(-1))
-                dataset_item.append_metadata_item(active_score, model=self._task_environment.model)
+                add_feature_vector_to_dataset_item(
+                    dataset_item, feature_vector, self._task_environment.model, prediction_store
+                )
 
             if saliency_map is not None:
                 add_saliency_maps_to_dataset_item(
@@ -369,53 +397,94 @@ class OTXClassificationTask(OTXTask, ABC):
                     predicted_scored_labels=item_labels,
                     explain_predicted_classes=explain_predicted_classes,
                     process_saliency_maps=process_saliency_maps,
+                    prediction_store=prediction_store,
                 )
             update_progress_callback(int(i / dataset_size * 100))
 
+    def _get_hierarchical_label_tables(
+        self,
+    ) -> Tuple[List[List[Optional[LabelEntity]]], List[Optional[LabelEntity]]]:
+        """Get the index to LabelEntity tables of the multiclass heads and of the multilabel classes.
+
+        The tables are built once per label set, so that decoding a prediction never searches the labels by name.
+        """
+        info = self._hierarchical_info
+        assert info is not None
+        tables = self._hierarchical_label_tables
+        if tables is None or tables[0] is not self._labels or tables[1] is not info:
+            label_by_name: Dict[str, LabelEntity] = {}
+            for label in self._labels:
+                label_by_name.setdefault(label.name, label)
+            num_multiclass_heads = info["num_multiclass_heads"]
+            head_labels = [
+                [label_by_name.get(name) for name in info["all_groups"][head_idx]]
+                for head_idx in range(num_multiclass_heads)
+            ]
+            multilabel_labels = [
+                label_by_name.get(info["all_groups"][num_multiclass_heads + logit_idx][0])
+                for logit_idx in range(info["num_multilabel_classes"])
+            ]
+            tables = (self._labels, info, head_labels, multilabel_labels)
+            self._hierarchical_label_tables = tables
+        return tables[2], tables[3]
+
     # pylint: disable=too-many-locals
-    def _get_item_labels(self, prediction_item, pos_thr):
-        item_labels = []
+    def _get_batch_labels(self, predictions: np.ndarray, pos_thr: float) -> List[List[ScoredLabel]]:
+        """Get the predicted labels of each row of a (num_items, num_logits) prediction matrix."""
+        num_items = len(predictions)
+        batch_labels: List[List[ScoredLabel]] = [[] for _ in range(num_items)]
 
         if self._multilabel:
-            if max(prediction_item) < pos_thr:
+            is_empty = predictions.max(axis=1) < pos_thr
+            rows, cls_idxs = np.nonzero((predictions > pos_thr) & ~is_empty[:, None])
+            for row, cls_idx, prob in zip(rows.tolist(), cls_idxs.tolist(), predictions[rows, cls_idxs].tolist()):
+                batch_labels[row].append(ScoredLabel(self._labels[cls_idx], probability=prob))
+            for row in np.flatnonzero(is_empty):
                 logger.info("Confidence is smaller than pos_thr, empty_label will be appended to item_labels.")
-                item_labels.append(ScoredLabel(self._empty_label, probability=1.0))
-            else:
-                for cls_idx, pred_item in enumerate(prediction_item):
-                    if pred_item > pos_thr:
-                        cls_label = ScoredLabel(self._labels[cls_idx], probability=float(pred_item))
-                        item_labels.append(cls_label)
+                batch_labels[row].append(ScoredLabel(self._empty_label, probability=1.0))
 
         elif self._hierarchical:
-            for head_idx in range(self._hierarchical_info["num_multiclass_heads"]):
-                logits_begin, logits_end = self._hierarchical_info["head_idx_to_logits_range"][str(head_idx)]
-                head_logits = prediction_item[logits_begin:logits_end]
-                head_pred = np.argmax(head_logits)  # Assume logits already passed softmax
-                label_str = self._hierarchical_info["all_groups"][head_idx][head_pred]
-                otx_label = next(x for x in self._labels if x.name == label_str)
-                item_labels.append(ScoredLabel(label=otx_label, probability=float(head_logits[head_pred])))
-
-            if self._hierarchical_info["num_multilabel_classes"]:
-                head_logits = prediction_item[self._hierarchical_info["num_single_label_classes"] :]
-                for logit_idx, logit in enumerate(head_logits):
-                    if logit > pos_thr:  # Assume logits already passed sigmoid
-                        label_str_idx = self._hierarchical_info["num_multiclass_heads"] + logit_idx
-                        label_str = self._hierarchical_info["all_groups"][label_str_idx][0]
-                        otx_label = next(x for x in self._labels if x.name == label_str)
-                        item_labels.append(ScoredLabel(label=otx_label, probability=float(logit)))
-            item_labels = self._task_environment.label_schema.resolve_labels_probabilistic(item_labels)
-            if not item_labels:
-                logger.info("item_labels is empty.")
-                item_labels.append(ScoredLabel(self._empty_label, probability=1.0))
+            info = self._hierarchical_info
+            assert info is not None
+            head_labels, multilabel_labels = self._get_hierarchical_label_tables()
+            for head_idx, labels in enumerate(head_labels):
+                logits_begin, logits_end = info["head_idx_to_logits_range"][str(head_idx)]
+                head_logits = predictions[:, logits_begin:logits_end]
+                head_preds = head_logits.argmax(axis=1)  # Assume logits already passed softmax
+                head_probs = head_logits[np.arange(num_items), head_preds]
+                for row, (head_pred, prob) in enumerate(zip(head_preds.tolist(), head_probs.tolist())):
+                    otx_label = self._get_table_label(labels, head_pred)
+                    batch_labels[row].append(ScoredLabel(label=otx_label, probability=prob))
+
+            if multilabel_labels:
+                head_logits = predictions[:, info["num_single_label_classes"] :]
+                rows, logit_idxs = np.nonzero(head_logits > pos_thr)  # Assume logits already passed sigmoid
+                probs = head_logits[rows, logit_idxs]
+                for row, logit_idx, prob in zip(rows.tolist(), logit_idxs.tolist(), probs.tolist()):
+                    otx_label = self._get_table_label(multilabel_labels, logit_idx)
+                    batch_labels[row].append(ScoredLabel(label=otx_label, probability=prob))
+
+            label_schema = self._task_environment.label_schema
+            for row, item_labels in enumerate(batch_labels):
+                item_labels = label_schema.resolve_labels_probabilistic(item_labels)
+                if not item_labels:
+                    logger.info("item_labels is empty.")
+                    item_labels.append(ScoredLabel(self._empty_label, probability=1.0))
+                batch_labels[row] = item_labels
 
         else:
-            label_idx = prediction_item.argmax()
-            cls_label = ScoredLabel(
-                self._labels[label_idx],
-                probability=float(prediction_item[label_idx]),
-            )
-            item_labels.append(cls_label)
-        return item_labels
+            label_idxs = predictions.argmax(axis=1)
+            probs = predictions[np.arange(num_items), label_idxs]
+            for row, (label_idx, prob) in enumerate(zip(label_idxs.tolist(), probs.tolist())):
+                batch_labels[row].append(ScoredLabel(self._labels[label_idx], probability=prob))
+        return batch_labels
+
+    @staticmethod
+    def _get_table_label(labels, index):
+        otx_label = labels[index]
+        if otx_label is None:
+            raise ValueError(f"Predicted label {index} of the hierarchical heads is not in the label schema.")
+        return otx_label
 
     def _add_explanations_to_dataset(
         self,
@@ -425,11 +494,17 @@ class OTXClassificationTask(OTXTask, ABC):
         update_progress_callback,
         process_saliency_maps,
         explain_predicted_classes,
+        prediction_store=None,
     ):
         """Loop over dataset again and assign saliency maps."""
         dataset_size = len(dataset)
-        for i, (dataset_item, prediction_item, saliency_map) in enumerate(zip(dataset, predictions, saliency_maps)):
-            item_labels = self._get_item_labels(prediction_item, pos_thr=0.5)
+        predictions = list(predictions)
+        batch_labels = []
+        if predictions:
+            batch_labels = self._get_batch_labels(
+                np.stack([np.asarray(prediction_item).reshape(-1) for prediction_item in predictions]), pos_thr=0.5
+            )
+        for i, (dataset_item, item_labels, saliency_map) in enumerate(zip(dataset, batch_labels, saliency_maps)):
             add_saliency_maps_to_dataset_item(
                 dataset_item=dataset_item,
                 saliency_map=saliency_map,
@@ -438,6 +513,7 @@ class OTXClassificationTask(OTXTask, ABC):
                 predicted_scored_labels=item_labels,
                 explain_predicted_classes=explain_predicted_classes,
                 process_saliency_maps=process_saliency_maps,
+                prediction_store=prediction_store,
             )
             update_progress_callback(int(i / dataset_size * 100))
 
@@ -15,6 +15,7 @@
 # and limitations under the License.
 
 from .adaptive_training_hook import AdaptiveTrainSchedulingHook
+from .batch_augment_hook import BatchRandAugmentHook
 from .cancel_hook import CancelInterfaceHook, CancelTrainingHook
 from .checkpoint_hook import (
     CheckpointHookWithValResults,
@@ -52,6 +53,7 @@ from .unbiased_teacher_hook import UnbiasedTeacherHook
 
 __all__ = [
     "AdaptiveTrainSchedulingHook",
+    "BatchRandAugmentHook",
     "CancelInterfaceHook",
     "CancelTrainingHook",
     "CheckpointHookWithValResults",
@@ -0,0 +1,112 @@
+"""Module for BatchRandAugmentHook applying RandAugment ops to collated training batches."""
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import random
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import torch
+from mmcv.parallel import DataContainer
+from mmcv.runner import HOOKS, BaseRunner, Hook
+
+from otx.algorithms.common.adapters.mmcv.pipelines.transforms.augments import (
+    BatchAugments,
+)
+
+PARAMETER_MAX = 10
+
+
+@HOOKS.register_module()
+class BatchRandAugmentHook(Hook):
+    """Hook applying RandAugment to each collated training batch with BatchAugments.
+
+    Ops are sampled per sample as OTXRandAugment does, restricted to the ops of BatchAugments,
+    i.e. without autocontrast, equalize and cutout. The batch is expected to be normalized by
+    `img_norm_cfg`, so it is turned back into uint8 images, augmented and normalized again in place.
+    Use it instead of a per-sample RandAugment step in the train pipeline:
+
+    >>> custom_hooks = [dict(type="BatchRandAugmentHook", num_aug=2, magnitude=10, **img_norm_cfg)]
+
+    Args:
+        num_aug (int): Number of ops drawn per sample, each applied with probability `prob`. Defaults to 2.
+        magnitude (int): Maximum magnitude of the ops, from 1 to 10. Defaults to 10.
+        mean (Sequence[float]): Mean of the normalization of the images. Defaults to (0, 0, 0).
+        std (Sequence[float]): Std of the normalization of the images. Defaults to (1, 1, 1).
+        to_rgb (bool): Whether the normalized images are in RGB order rather than BGR. Defaults to True.
+        prob (float): Probability to apply each drawn op. Defaults to 0.5.
+    """
+
+    # name, max value and bias of the magnitude, whether the value is an int and whether its sign is random
+    OPS = (
+        ("brightness", 0.9, 0.05, False, False),
+        ("color", 0.9, 0.05, False, False),
+        ("contrast", 0.9, 0.05, False, False),
+        ("identity", 0, 0, False, False),
+        ("posterize", 4, 4, True, False),
+        ("rotate", 30, 0, True, True),
+        ("sharpness", 0.9, 0.05, False, False),
+        ("shear_x", 0.3, 0, False, True),
+        ("shear_y", 0.3, 0, False, True),
+        ("solarize", 256, 0, True, False),
+        ("translate_x_rel", 0.3, 0, False, True),
+        ("translate_y_rel", 0.3, 0, False, True),
+    )
+
+    def __init__(
+        self,
+        num_aug: int = 2,
+        magnitude: int = 10,
+        mean: Sequence[float] = (0.0, 0.0, 0.0),
+        std: Sequence[float] = (1.0, 1.0, 1.0),
+        to_rgb: bool = True,
+        prob: float = 0.5,
+    ):
+        assert num_aug >= 1
+        assert 1 <= magnitude <= PARAMETER_MAX
+        self.num_aug = num_aug
+        self.magnitude = magnitude
+        self.mean = np.array(mean, dtype=np.float32)
+        self.std = np.array(std, dtype=np.float32)
+        self.to_rgb = to_rgb
+        self.prob = prob
+
+    def sample_ops(self, num_samples: int) -> List[List[Tuple[str, float]]]:
+        """Draw the (op name, parameter) list of each sample."""
+        ops = []
+        for _ in range(num_samples):
+            sample_ops = []
+            for name, max_value, bias, is_int, is_signed in random.choices(self.OPS, k=self.num_aug):
+                level = random.randint(1, max(self.magnitude - 1, 1))
+                if random.random() >= self.prob or name == "identity":
+                    continue
+                value = level * max_value / PARAMETER_MAX
+                value = (int(value) if is_int else value) + bias
+                if is_signed and random.random() < 0.5:
+                    value = -value
+                if name == "solarize":
+                    # OTXRandAugment inverts the pixels from 256 - value
+                    value = 256 - value
+                sample_ops.append((name, value))
+            ops.append(sample_ops)
+        return ops
+
+    def augment(self, imgs: torch.Tensor) -> None:
+        """Apply RandAugment in place to a normalized (N, 3, H, W) batch."""
+        array = imgs.detach().permute(0, 2, 3, 1).cpu().numpy() * self.std + self.mean
+        array = np.clip(np.rint(array), 0, 255).astype(np.uint8)
+        if not self.to_rgb:
+            array = np.ascontiguousarray(array[..., ::-1])
+        array = BatchAugments.apply(array, self.sample_ops(len(array)))
+        if not self.to_rgb:
+            array = array[..., ::-1]
+        normalized = (array.astype(np.float32) - self.mean) / self.std
+        imgs.copy_(torch.from_numpy(normalized).permute(0, 3, 1, 2))
+
+    def before_train_iter(self, runner: BaseRunner):
+        """Augment the images of the batch, which the runner trains on right after."""
+        imgs = runner.data_batch["img"]
+        batches = imgs.data if isinstance(imgs, DataContainer) else [imgs]
+        for batch in batches:
+            self.augment(batch)
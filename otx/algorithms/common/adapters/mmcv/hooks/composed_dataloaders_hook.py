@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
-from typing import List, Sequence, Union
+from typing import List, Optional, Sequence, Union
 
 from mmcv.runner import HOOKS, Hook
 from torch.utils.data import DataLoader
@@ -19,14 +19,23 @@ class ComposedDataLoadersHook(Hook):
     """Composed dataloader hook, which makes a composed dataloader which can combine multiple data loaders.
 
     Especially used for semi-supervised learning to aggregate a unlabeled dataloader and a labeled dataloader.
+
+    Args:
+        data_loaders (Union[Sequence[DataLoader], DataLoader]): Loaders added to the runner's data loader.
+        ratios (Optional[List[int]]): Number of batches taken from each added loader per step. See ComposedDL.
+        num_prefetch (int): Number of steps the loaders are pulled ahead concurrently. See ComposedDL.
     """
 
     def __init__(
         self,
         data_loaders: Union[Sequence[DataLoader], DataLoader],
+        ratios: Optional[List[int]] = None,
+        num_prefetch: int = 0,
     ):
         self.data_loaders: List[DataLoader] = []
         self.composed_loader = None
+        self.ratios = ratios
+        self.num_prefetch = num_prefetch
 
         self.add_dataloaders(data_loaders)
 
@@ -44,7 +53,9 @@ class ComposedDataLoadersHook(Hook):
         """Create composedDL before running epoch."""
         if self.composed_loader is None:
             logger.info("Creating ComposedDL " f"(runner's -> {runner.data_loader}, " f"hook's -> {self.data_loaders})")
-            self.composed_loader = ComposedDL([runner.data_loader, *self.data_loaders])
+            self.composed_loader = ComposedDL(
+                [runner.data_loader, *self.data_loaders], ratios=self.ratios, num_prefetch=self.num_prefetch
+            )
         # Per-epoch replacement: train-only loader -> train loader + additional loaders
         # (It's similar to local variable in epoch. Need to update every epoch...)
         runner.data_loader = self.composed_loader
@@ -9,6 +9,7 @@ import torch
 from mmcv.parallel import is_module_wrapper
 from mmcv.runner import HOOKS, Hook
 
+from otx.algorithms.common.adapters.torch.utils import ema_update_
 from otx.algorithms.common.utils.logger import get_logger
 
 logger = get_logger()
@@ -135,11 +136,9 @@ class DualModelEMAHook(Hook):
 
     def _ema_model(self):
         momentum = min(self.momentum, 1.0)
-        with torch.no_grad():
-            for name, src_param in self.src_params.items():
-                dst_param = self.dst_params[name]
-                # dst_param.data.mul_(1 - momentum).add_(src_param.data, alpha=momentum)
-                dst_param.data.copy_(dst_param.data * (1 - momentum) + src_param.data * momentum)
+        src_tensors = [src_param.data for src_param in self.src_params.values()]
+        dst_tensors = [self.dst_params[name].data for name in self.src_params]
+        ema_update_(dst_tensors, src_tensors, momentum)
 
     def _diff_model(self):
         diff_sum = 0.0
@@ -9,6 +9,7 @@ import torch
 from mmcv.runner import HOOKS, Hook
 from torch import nn
 
+from otx.algorithms.common.adapters.torch.utils import ema_update_
 from otx.algorithms.common.utils.logger import get_logger
 
 logger = get_logger()
@@ -108,13 +109,12 @@ class ModelEmaV2(nn.Module):
         """Forward."""
         return
 
-    def _update(self, update_fn):
-        with torch.no_grad():
-            for ema_v, model_v in zip(self.dst_model.values(), self.src_model.values()):
-                if self.device is not None:
-                    model_v = model_v.to(device=self.device)
-                ema_v.copy_(update_fn(ema_v, model_v))
-
     def update(self):
         """Update."""
-        self._update(update_fn=lambda e, m: self.decay * e + (1.0 - self.decay) * m)
+        src_tensors = list(self.src_model.values())
+        if self.device is not None:
+            # issue all transfers before updating, so that copies from GPU overlap with each other
+            src_tensors = [model_v.to(device=self.device, non_blocking=True) for model_v in src_tensors]
+            if any(model_v.is_cuda for model_v in self.src_model.values()):
+                torch.cuda.synchronize()
+        ema_update_(list(self.dst_model.values()), src_tensors, 1.0 - self.decay)
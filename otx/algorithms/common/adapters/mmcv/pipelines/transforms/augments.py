@@ -1,11 +1,14 @@
-"""Module for defining Augments and CythonArguments class used for classification task."""
+"""Module for defining Augments, CythonArguments and BatchAugments class used for classification task."""
 # Copyright (C) 2022 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 #
 
 import random
-from typing import Union
+from collections import defaultdict
+from typing import Any, Dict, List, Sequence, Tuple, Union
 
+import cv2
+import numpy as np
 from numpy import ndarray as CvImage
 from PIL import Image, ImageEnhance, ImageOps
 from PIL.Image import Image as PILImage
@@ -213,3 +216,259 @@ class CythonAugments(Augments):
         if Image.isImageType(src):
             return pil_aug.blend(src, dst, weight)
         raise NotImplementedError(f"Unknown type: {type(src)}")
+
+
+BatchParams = Union[float, Sequence[float], np.ndarray]
+
+
+class BatchAugments:
+    """BatchAugments class that implements the augmentations of CythonAugments on a collated batch.
+
+    Every op takes a uint8 array of shape (N, H, W, 3) in RGB order and a parameter per sample,
+    either a scalar shared by all samples or a sequence of N values, and returns a new array.
+    Parameters are turned into per-sample lookup tables or kernels at once, which OpenCV applies without any
+    PIL conversion.
+    Geometric ops are expressed as 3x3 affine matrices, so that several of them are applied with a single
+    warp per sample.
+    BatchRandAugmentHook applies RandAugment with these ops to the training batches.
+    """
+
+    GEOMETRIC_OPS = ("rotate", "shear_x", "shear_y", "translate_x_rel", "translate_y_rel")
+    PIXEL_OPS = ("solarize", "posterize", "color", "contrast", "brightness", "sharpness")
+
+    @staticmethod
+    def _params(values: BatchParams, num_samples: int, dtype=np.float32) -> np.ndarray:
+        params = np.asarray(values, dtype=dtype)
+        if params.ndim == 0:
+            return np.full(num_samples, params, dtype=dtype)
+        assert params.shape == (num_samples,), f"Expected {num_samples} parameters, but got {params.shape}."
+        return params
+
+    @staticmethod
+    def _truncate(values: np.ndarray) -> np.ndarray:
+        """Convert values to uint8 as the Cython ops do, i.e. clipping to [0, 255] and truncating."""
+        return np.clip(values, 0, 255).astype(np.uint8)
+
+    @staticmethod
+    def _apply_luts(imgs: CvImage, luts: np.ndarray) -> CvImage:
+        """Apply a 256-entry lookup table per sample."""
+        result = np.empty_like(imgs)
+        for img, lut, dst in zip(imgs, luts, result):
+            cv2.LUT(img, lut, dst=dst)
+        return result
+
+    @staticmethod
+    def _linear_luts(factors: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+        """Return lookup tables of (value * factor + offset) per sample."""
+        values = np.arange(256, dtype=np.float32)
+        return BatchAugments._truncate(values * factors[:, None] + offsets[:, None])
+
+    @staticmethod
+    def solarize(imgs: CvImage, threshold: BatchParams) -> CvImage:
+        """Apply solarize for a batch of images."""
+        thresholds = BatchAugments._params(threshold, len(imgs), np.int32)
+        values = np.arange(256, dtype=np.int32)
+        luts = np.where(values < thresholds[:, None], values, 255 - values).astype(np.uint8)
+        return BatchAugments._apply_luts(imgs, luts)
+
+    @staticmethod
+    def posterize(imgs: CvImage, bits_to_keep: BatchParams) -> CvImage:
+        """Apply posterize for a batch of images."""
+        bits = np.minimum(BatchAugments._params(bits_to_keep, len(imgs), np.int32), 8)
+        masks = (~((1 << (8 - bits)) - 1)) & 0xFF
+        luts = (np.arange(256, dtype=np.int32) & masks[:, None]).astype(np.uint8)
+        return BatchAugments._apply_luts(imgs, luts)
+
+    @staticmethod
+    def color(imgs: CvImage, factor: BatchParams) -> CvImage:
+        """Apply color for a batch of images.
+
+        Unlike the Cython op, the result is rounded and the grey image comes from OpenCV,
+        so that pixels may differ by one.
+        """
+        factors = BatchAugments._params(factor, len(imgs))
+        result = np.empty_like(imgs)
+        for img, img_factor, dst in zip(imgs, factors, result):
+            grey = cv2.cvtColor(cv2.cvtColor(img, cv2.COLOR_RGB2GRAY), cv2.COLOR_GRAY2RGB)
+            cv2.addWeighted(img, float(img_factor), grey, float(1 - img_factor), 0, dst=dst)
+        return result
+
+    @staticmethod
+    def contrast(imgs: CvImage, factor: BatchParams) -> CvImage:
+        """Apply contrast for a batch of images.
+
+        The mean grey level comes from OpenCV, so that pixels may differ by one from the Cython op.
+        """
+        factors = BatchAugments._params(factor, len(imgs))
+        means = np.array([cv2.cvtColor(img, cv2.COLOR_RGB2GRAY).sum() // (img.size // 3) for img in imgs])
+        means = means.astype(np.float32)
+        return BatchAugments._apply_luts(imgs, BatchAugments._linear_luts(factors, means * (1 - factors)))
+
+    @staticmethod
+    def brightness(imgs: CvImage, factor: BatchParams) -> CvImage:
+        """Apply brightness for a batch of images."""
+        factors = BatchAugments._params(factor, len(imgs))
+        return BatchAugments._apply_luts(imgs, BatchAugments._linear_luts(factors, np.zeros_like(factors)))
+
+    @staticmethod
+    def sharpness(imgs: CvImage, factor: BatchParams) -> CvImage:
+        """Apply sharpness for a batch of images, leaving the border pixels as they are.
+
+        Unlike the Cython op, the result is rounded, so that pixels may differ by one.
+        """
+        factors = BatchAugments._params(factor, len(imgs))
+        # 3x3 smoothing kernel of PIL: 1 / 13 around and 5 / 13 at the center
+        smooth_kernel = np.full((3, 3), 1 / 13, dtype=np.float32)
+        smooth_kernel[1, 1] = 5 / 13
+        identity_kernel = np.zeros((3, 3), dtype=np.float32)
+        identity_kernel[1, 1] = 1
+        result = imgs.copy()
+        for img, img_factor, dst in zip(imgs, factors, result):
+            kernel = smooth_kernel * (1 - img_factor) + identity_kernel * img_factor
+            dst[1:-1, 1:-1] = cv2.filter2D(img, -1, kernel)[1:-1, 1:-1]
+        return result
+
+    @staticmethod
+    def rotate_matrix(degree: BatchParams, size: Tuple[int, int], num_samples: int) -> np.ndarray:
+        """Return (N, 3, 3) matrices rotating images of size (width, height) around their center."""
+        angles = np.deg2rad(BatchAugments._params(degree, num_samples, np.float64))
+        center_x, center_y = size[0] / 2, size[1] / 2
+        cos, sin = np.cos(angles), np.sin(angles)
+        matrices = np.tile(np.eye(3), (num_samples, 1, 1))
+        matrices[:, 0, 0] = cos
+        matrices[:, 0, 1] = sin
+        matrices[:, 0, 2] = (1 - cos) * center_x - sin * center_y
+        matrices[:, 1, 0] = -sin
+        matrices[:, 1, 1] = cos
+        matrices[:, 1, 2] = sin * center_x + (1 - cos) * center_y
+        return matrices
+
+    @staticmethod
+    def shear_x_matrix(factor: BatchParams, num_samples: int) -> np.ndarray:
+        """Return (N, 3, 3) matrices shearing images along the x axis."""
+        matrices = np.tile(np.eye(3), (num_samples, 1, 1))
+        matrices[:, 0, 1] = -BatchAugments._params(factor, num_samples, np.float64)
+        return matrices
+
+    @staticmethod
+    def shear_y_matrix(factor: BatchParams, num_samples: int) -> np.ndarray:
+        """Return (N, 3, 3) matrices shearing images along the y axis."""
+        matrices = np.tile(np.eye(3), (num_samples, 1, 1))
+        matrices[:, 1, 0] = -BatchAugments._params(factor, num_samples, np.float64)
+        return matrices
+
+    @staticmethod
+    def translate_matrix(pixels_x: BatchParams, pixels_y: BatchParams, num_samples: int) -> np.ndarray:
+        """Return (N, 3, 3) matrices moving images by -pixels, as the PIL affine transform does."""
+        matrices = np.tile(np.eye(3), (num_samples, 1, 1))
+        matrices[:, 0, 2] = -BatchAugments._params(pixels_x, num_samples, np.float64)
+        matrices[:, 1, 2] = -BatchAugments._params(pixels_y, num_samples, np.float64)
+        return matrices
+
+    @staticmethod
+    def warp_affine(
+        imgs: CvImage, matrices: np.ndarray, resample: Resampling = Resampling.BILINEAR, skip_identity: bool = True
+    ) -> CvImage:
+        """Warp every image of a batch with its (3, 3) matrix mapping source to destination coordinates."""
+        flags = {
+            Resampling.NEAREST: cv2.INTER_NEAREST,
+            Resampling.BOX: cv2.INTER_NEAREST,
+            Resampling.BICUBIC: cv2.INTER_CUBIC,
+            Resampling.LANCZOS: cv2.INTER_LANCZOS4,
+        }.get(resample, cv2.INTER_LINEAR)
+        size = (imgs.shape[2], imgs.shape[1])
+        result = imgs.copy()
+        identity = np.eye(3)
+        for img, matrix, dst in zip(imgs, matrices, result):
+            if skip_identity and np.allclose(matrix, identity):
+                continue
+            cv2.warpAffine(img, matrix[:2], size, dst=dst, flags=flags)
+        return result
+
+    @staticmethod
+    def rotate(imgs: CvImage, degree: BatchParams, resample: Resampling = Resampling.BILINEAR) -> CvImage:
+        """Apply rotate for a batch of images."""
+        size = (imgs.shape[2], imgs.shape[1])
+        return BatchAugments.warp_affine(imgs, BatchAugments.rotate_matrix(degree, size, len(imgs)), resample)
+
+    @staticmethod
+    def shear_x(imgs: CvImage, factor: BatchParams, resample: Resampling = Resampling.BILINEAR) -> CvImage:
+        """Apply shear_x for a batch of images."""
+        return BatchAugments.warp_affine(imgs, BatchAugments.shear_x_matrix(factor, len(imgs)), resample)
+
+    @staticmethod
+    def shear_y(imgs: CvImage, factor: BatchParams, resample: Resampling = Resampling.BILINEAR) -> CvImage:
+        """Apply shear_y for a batch of images."""
+        return BatchAugments.warp_affine(imgs, BatchAugments.shear_y_matrix(factor, len(imgs)), resample)
+
+    @staticmethod
+    def translate_x_rel(imgs: CvImage, pct: BatchParams, resample: Resampling = Resampling.BILINEAR) -> CvImage:
+        """Apply translate_x_rel for a batch of images."""
+        pixels = BatchAugments._params(pct, len(imgs), np.float64) * imgs.shape[2]
+        return BatchAugments.warp_affine(imgs, BatchAugments.translate_matrix(pixels, 0, len(imgs)), resample)
+
+    @staticmethod
+    def translate_y_rel(imgs: CvImage, pct: BatchParams, resample: Resampling = Resampling.BILINEAR) -> CvImage:
+        """Apply translate_y_rel for a batch of images."""
+        pixels = BatchAugments._params(pct, len(imgs), np.float64) * imgs.shape[1]
+        return BatchAugments.warp_affine(imgs, BatchAugments.translate_matrix(0, pixels, len(imgs)), resample)
+
+    @staticmethod
+    def _op_matrix(name: str, value: float, size: Tuple[int, int]) -> np.ndarray:
+        if name == "rotate":
+            return BatchAugments.rotate_matrix(value, size, 1)[0]
+        if name == "shear_x":
+            return BatchAugments.shear_x_matrix(value, 1)[0]
+        if name == "shear_y":
+            return BatchAugments.shear_y_matrix(value, 1)[0]
+        if name == "translate_x_rel":
+            return BatchAugments.translate_matrix(value * size[0], 0, 1)[0]
+        if name == "translate_y_rel":
+            return BatchAugments.translate_matrix(0, value * size[1], 1)[0]
+        raise ValueError(f"Unknown geometric op: {name}")
+
+    @staticmethod
+    def apply(
+        imgs: CvImage,
+        ops: Sequence[Sequence[Tuple[str, float]]],
+        resample: Resampling = Resampling.BILINEAR,
+    ) -> CvImage:
+        """Apply a list of (op name, parameter) per sample to a collated batch, e.g. sampled by RandAugment.
+
+        The ops of a sample are applied in order. Each run of consecutive geometric ops is composed into a single
+        matrix and applied with one warp. Each step groups the samples drawing the same pixel op, or a warp,
+        so that every group is processed by one call.
+        """
+        assert len(ops) == len(imgs), f"Expected ops for {len(imgs)} samples, but got {len(ops)}."
+        size = (imgs.shape[2], imgs.shape[1])
+        # Per sample, a list of steps which are either ("warp", matrix) or (pixel op name, parameter)
+        steps: List[List[Tuple[str, Any]]] = []
+        for sample_ops in ops:
+            sample_steps: List[Tuple[str, Any]] = []
+            for name, value in sample_ops:
+                if name in BatchAugments.GEOMETRIC_OPS:
+                    matrix = BatchAugments._op_matrix(name, value, size)
+                    if sample_steps and sample_steps[-1][0] == "warp":
+                        sample_steps[-1] = ("warp", matrix @ sample_steps[-1][1])
+                    else:
+                        sample_steps.append(("warp", matrix))
+                elif name in BatchAugments.PIXEL_OPS:
+                    sample_steps.append((name, value))
+                else:
+                    raise ValueError(f"Unknown op: {name}")
+            steps.append(sample_steps)
+
+        result = imgs.copy()
+        for step in range(max((len(sample_steps) for sample_steps in steps), default=0)):
+            groups: Dict[str, Tuple[List[int], List[Any]]] = defaultdict(lambda: ([], []))
+            for sample_idx, sample_steps in enumerate(steps):
+                if step < len(sample_steps):
+                    name, value = sample_steps[step]
+                    groups[name][0].append(sample_idx)
+                    groups[name][1].append(value)
+            for name, (indices, values) in groups.items():
+                if name == "warp":
+                    result[indices] = BatchAugments.warp_affine(result[indices], np.stack(values), resample)
+                else:
+                    result[indices] = getattr(BatchAugments, name)(result[indices], values)
+        return result
@@ -1,11 +1,11 @@
-"""Algorithm to find a proper batch size which is fit to current GPU device for tasks using mmcv."""
+"""Algorithm to find a proper batch size which is fit to current device for tasks using mmcv."""
 
 # Copyright (C) 2023 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
 from copy import deepcopy
 from math import sqrt
-from typing import Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 import numpy as np
 
@@ -37,8 +37,36 @@ def _set_value_at_dict_in_dict(target: Dict, key_path: str, value):
     target[keys[-1]] = value
 
 
-def adapt_batch_size(train_func: Callable, cfg, datasets: List, validate: bool = False, not_increase: bool = True):
-    """Decrease batch size if default batch size isn't fit to current GPU device.
+def _get_deepcopy_memo(cfg) -> Dict[int, Any]:
+    """Get a deepcopy memo which makes copies of the config share the objects other than containers and primitives.
+
+    The config can hold heavy objects such as datasets, which trainings with a config copy don't need to copy.
+
+    Args:
+        cfg: Configuration to copy.
+    """
+    memo: Dict[int, Any] = {}
+    stack = list(cfg.values())
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif not isinstance(value, (str, bytes, int, float, bool, type(None))):
+            memo[id(value)] = value
+    return memo
+
+
+def adapt_batch_size(
+    train_func: Callable,
+    cfg,
+    datasets: List,
+    validate: bool = False,
+    not_increase: bool = True,
+    mem_budget: Optional[int] = None,
+):
+    """Decrease batch size if default batch size isn't fit to current device.
 
     This function just setup for single iteration training to reduce time for adapting.
     The core part of adapting batch size is done in adapt_batch_size in the torch.utils package.
@@ -51,10 +79,12 @@ def adapt_batch_size(train_func: Callable, cfg, datasets: List, validate: bool =
         datasets (List): List of datasets.
         validate (bool): Whether do vlidation or not.
         not_increase (bool) : Whether adapting batch size to larger value than default value or not.
+        mem_budget (Optional[int]): Memory in bytes the training may use. Defaults to the whole device memory.
     """
+    deepcopy_memo = _get_deepcopy_memo(cfg)
 
     def train_func_single_iter(batch_size):
-        copied_cfg = deepcopy(cfg)
+        copied_cfg = deepcopy(cfg, dict(deepcopy_memo))
         _set_batch_size(copied_cfg, batch_size)
 
         # setup for training a single iter to reduce time
@@ -98,6 +128,7 @@ def adapt_batch_size(train_func: Callable, cfg, datasets: List, validate: bool =
         train_func=train_func_single_iter,
         default_bs=default_bs,
         max_bs=len(datasets[0]),
+        mem_budget=mem_budget,
     )
     if not_increase:
         new_batch_size = bs_search_algo.auto_decrease_batch_size()
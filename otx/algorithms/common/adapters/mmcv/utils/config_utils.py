@@ -16,9 +16,11 @@
 
 import copy
 import glob
+import hashlib
 import multiprocessing
 import os
 import os.path as osp
+import pickle
 import platform
 import shutil
 import sys
@@ -26,8 +28,9 @@ import tempfile
 import warnings
 from collections.abc import Mapping
 from importlib import import_module
-from typing import Any, Callable, Dict, List, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+import mmcv
 import torch
 from mmcv import Config, ConfigDict
 from mmcv.utils.config import BASE_KEY, DEPRECATION_KEY
@@ -36,21 +39,55 @@ from mmcv.utils.path import check_file_exist
 
 from otx.algorithms.common.utils.logger import get_logger
 from otx.api.entities.datasets import DatasetEntity
+from otx.core.file import evict_cache, get_cache_dir
 
 from ._config_utils_get_configs_by_keys import get_configs_by_keys
 from ._config_utils_get_configs_by_pairs import get_configs_by_pairs
 
 logger = get_logger()
 
+CONFIG_CACHE_SIZE = 64 * 1024**2
+
+# (file path, use_predefined_variables) -> (dependencies, cfg_dict, cfg_text) of the configs parsed by this process
+_parsed_configs: Dict[Tuple[str, bool], Tuple[List[Tuple[str, int, int]], dict, str]] = {}
+
+
+def _get_file_stamps(filenames: List[str]) -> List[Tuple[str, int, int]]:
+    stamps = []
+    for filename in filenames:
+        stat = os.stat(filename)
+        stamps.append((filename, stat.st_mtime_ns, stat.st_size))
+    return stamps
+
+
+def _is_up_to_date(dependencies: List[Tuple[str, int, int]]) -> bool:
+    try:
+        return _get_file_stamps([filename for filename, _, _ in dependencies]) == dependencies
+    except OSError:
+        return False
+
+
+def _is_owned(path: str) -> bool:
+    """Returns True if the file is owned by the current user, so that unpickling it can't run someone else's code."""
+    if not hasattr(os, "getuid"):
+        return True
+    return os.stat(path).st_uid == os.getuid()
+
 
 # TODO: refactor Config
 class MPAConfig(Config):
-    """A class that extends the base `Config` class, adds additional functionality for loading configuration files."""
+    """A class that extends the base `Config` class, adds additional functionality for loading configuration files.
+
+    Parsed configuration files are cached in memory, keyed by the file path and the predefined-variable flag,
+    and validated with the modification times of the file and its bases. They are also cached on disk in
+    ``cache_dir`` if it is set, or if the "config" cache is enabled with the ``OTX_CACHES`` environment variable.
+    The disk cache is bounded to ``CONFIG_CACHE_SIZE`` bytes and only entries written by the current user are loaded.
+    """
+
+    cache_dir: Optional[str] = None
 
     @staticmethod
-    def _file2dict(
-        filename, use_predefined_variables=True
-    ):  # pylint: disable=too-many-locals, too-many-branches, too-many-statements
+    def _file2dict(filename, use_predefined_variables=True):
         """Static method that loads the configuration file and returns a dictionary of its contents.
 
         :param filename: str, the path of the configuration file to be loaded.
@@ -60,8 +97,67 @@ class MPAConfig(Config):
                  and a string representation of the configuration file.
         :raises: IOError if the file type is not supported.
         """
+        cfg_dict, cfg_text, _ = MPAConfig._file2dict_cached(filename, use_predefined_variables)
+        return cfg_dict, cfg_text
+
+    @staticmethod
+    def _file2dict_cached(filename, use_predefined_variables=True):
+        """Load the configuration file from the caches if it's up to date, otherwise parse and cache it.
+
+        :return: tuple of dictionary, string and the stamps of the files the configuration depends on.
+        """
         filename = osp.abspath(osp.expanduser(filename))
         check_file_exist(filename)
+        key = (filename, use_predefined_variables)
+
+        cached = _parsed_configs.get(key)
+        cache_dir = MPAConfig.cache_dir if MPAConfig.cache_dir is not None else get_cache_dir("config")
+        cache_path = None
+        if cached is None and cache_dir is not None:
+            cache_key = hashlib.sha1(f"{filename}|{use_predefined_variables}|{mmcv.__version__}".encode()).hexdigest()
+            cache_path = osp.join(cache_dir, f"{cache_key}.pkl")
+            if osp.exists(cache_path) and _is_owned(cache_path):
+                try:
+                    with open(cache_path, "rb") as f:
+                        cached = pickle.load(f)
+                except Exception:  # pylint: disable=broad-except
+                    cached = None
+        if cached is not None and _is_up_to_date(cached[0]):
+            _parsed_configs[key] = cached
+            dependencies, cfg_dict, cfg_text = cached
+            return copy.deepcopy(cfg_dict), cfg_text, dependencies
+
+        cfg_dict, cfg_text, base_dependencies = MPAConfig._parse_file(filename, use_predefined_variables)
+        dependencies = _get_file_stamps([filename]) + base_dependencies
+        try:
+            cached = (dependencies, copy.deepcopy(cfg_dict), cfg_text)
+        except Exception:  # pylint: disable=broad-except
+            # e.g. a python config holding a module
+            return cfg_dict, cfg_text, dependencies
+        _parsed_configs[key] = cached
+        if cache_path is not None:
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(cache_dir, mode=0o700, exist_ok=True)  # type: ignore[arg-type]
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(cached, f)
+                os.replace(tmp_path, cache_path)
+                evict_cache(cache_dir, CONFIG_CACHE_SIZE)  # type: ignore[arg-type]
+            except Exception:  # pylint: disable=broad-except
+                logger.debug(f"Failed to cache the parsed config {filename}")
+                if osp.exists(tmp_path):
+                    os.remove(tmp_path)
+        return cfg_dict, cfg_text, dependencies
+
+    @staticmethod
+    def _parse_file(
+        filename, use_predefined_variables=True
+    ):  # pylint: disable=too-many-locals, too-many-branches, too-many-statements
+        """Parse the configuration file and its bases.
+
+        :return: tuple of dictionary, string and the stamps of the base files the configuration depends on.
+        :raises: IOError if the file type is not supported.
+        """
         extender = osp.splitext(filename)[1]
         if extender not in [".py", ".json", ".yaml", ".yml"]:
             raise IOError("Only py/yml/yaml/json type are supported now!")
@@ -88,8 +184,6 @@ class MPAConfig(Config):
                     # delete imported module
                     del sys.modules[temp_module_name]
                 elif filename.endswith((".yml", ".yaml", ".json")):
-                    import mmcv
-
                     cfg_dict = mmcv.load(temp_config_file.name)
 
         # check deprecation information
@@ -107,6 +201,7 @@ class MPAConfig(Config):
             # Setting encoding explicitly to resolve coding issue on windows
             cfg_text += f.read()
 
+        dependencies: List[Tuple[str, int, int]] = []
         if BASE_KEY in cfg_dict:
             cfg_dir = osp.dirname(filename)
             base_filename = cfg_dict.pop(BASE_KEY)
@@ -115,7 +210,8 @@ class MPAConfig(Config):
             cfg_dict_list = []
             cfg_text_list = []
             for f in base_filename:
-                _cfg_dict, _cfg_text = MPAConfig._file2dict(osp.join(cfg_dir, f))
+                _cfg_dict, _cfg_text, _dependencies = MPAConfig._file2dict_cached(osp.join(cfg_dir, f))
+                dependencies.extend(_dependencies)
                 cfg_dict_list.append(_cfg_dict)
                 cfg_text_list.append(_cfg_text)
 
@@ -146,7 +242,7 @@ class MPAConfig(Config):
             cfg_text_list.append(cfg_text)
             cfg_text = "\n".join(cfg_text_list)
 
-        return cfg_dict, cfg_text
+        return cfg_dict, cfg_text, dependencies
 
     @staticmethod
     def fromfile(filename, use_predefined_variables=True, import_custom_modules=True):
@@ -3,19 +3,27 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import hashlib
+import inspect
+import json
 import os
+import shutil
 import time
 from collections.abc import Mapping
 from copy import deepcopy
-from functools import partial
+from functools import lru_cache, partial
+from importlib.metadata import PackageNotFoundError, version
 from subprocess import CalledProcessError
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import mmcv
 import numpy as np
 import torch
 from mmcv.parallel import collate, scatter
 
+from otx.algorithms.common.utils.logger import get_logger
+from otx.core.file import evict_cache
+
 from .utils.mmdeploy import (
     is_mmdeploy_enabled,
     mmdeploy_init_model_helper,
@@ -24,9 +32,49 @@ from .utils.mmdeploy import (
 from .utils.onnx import prepare_onnx_for_openvino
 from .utils.utils import numpy_2_list
 
+logger = get_logger()
+
+EXPORT_CACHE_SIZE = 2 * 1024**3
+
+# distributions whose versions change the traced graph of an exported model
+EXPORT_PACKAGES = ("otx", "torch", "mmcv-full", "mmcls", "mmdet", "mmsegmentation", "mmdeploy")
+
 # pylint: disable=too-many-locals
 
 
+@lru_cache(maxsize=None)
+def _get_package_versions() -> Dict[str, Optional[str]]:
+    versions: Dict[str, Optional[str]] = {}
+    for package in EXPORT_PACKAGES:
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+
+def _get_source_paths(model_type: type) -> List[str]:
+    """Get the source files of the exporter and of the model classes which are not part of torch."""
+    paths = {os.path.abspath(__file__), os.path.abspath(inspect.getfile(prepare_onnx_for_openvino))}
+    for cls in inspect.getmro(model_type):
+        module = inspect.getmodule(cls)
+        if module is None or module.__name__.split(".")[0] in ("builtins", "torch"):
+            continue
+        try:
+            path = os.path.abspath(inspect.getfile(cls))
+        except TypeError:
+            continue
+        # classes defined interactively have no source file
+        if os.path.isfile(path):
+            paths.add(path)
+    return sorted(paths)
+
+
+def _get_source_hash(path: str) -> str:
+    with open(path, "rb") as source_file:
+        return hashlib.sha1(source_file.read()).hexdigest()
+
+
 class NaiveExporter:
     """NaiveExporter for non-mmdeploy export."""
 
@@ -37,7 +85,7 @@ class NaiveExporter:
         cfg: mmcv.Config,
         input_data: Dict[Any, Any],
         *,
-        precision: str = "FP32",
+        precision: Union[str, Sequence[str]] = "FP32",
         model_name: str = "model",
         input_names: Optional[List[str]] = None,
         output_names: Optional[List[str]] = None,
@@ -45,27 +93,71 @@ class NaiveExporter:
         dynamic_axes: Optional[Dict[Any, Any]] = None,
         mo_transforms: str = "",
         export_type: str = "OPENVINO",
-    ):
-        """Function for exporting to openvino."""
+        cache_dir: Optional[str] = None,
+    ) -> Dict[str, float]:
+        """Function for exporting to openvino.
+
+        If ``cache_dir`` is given, the traced ONNX model is cached there keyed by the model weights, the model
+        and test pipeline configs, the opset, the input shape, the versions of the exporting packages and the
+        source code of the model and exporter, so exporting unchanged weights again skips tracing. The cache
+        is bounded to ``EXPORT_CACHE_SIZE`` bytes, evicting the least recently used models first.
+        If ``precision`` is a sequence, the IR of every precision is generated from a single trace
+        into ``output_dir/<precision>`` while the ONNX model is written to ``output_dir``.
+
+        Returns:
+            Dict[str, float]: elapsed seconds of the build, trace and mo phases.
+        """
+        timings: Dict[str, float] = {}
+        start_time = time.perf_counter()
         input_data = scatter(collate([input_data], samples_per_gpu=1), [-1])[0]
 
         model = model_builder(cfg)
         model = model.cpu().eval()
         dynamic_axes = dynamic_axes if dynamic_axes else dict()
-
-        onnx_path = NaiveExporter.torch2onnx(
-            output_dir,
-            model,
-            input_data,
-            model_name=model_name,
-            input_names=input_names,
-            output_names=output_names,
-            opset_version=opset_version,
-            dynamic_axes=dynamic_axes,
-        )
+        timings["build"] = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        onnx_path = os.path.join(output_dir, model_name + ".onnx")
+        cached_onnx_path = None
+        if cache_dir is not None:
+            cache_key = NaiveExporter.get_cache_key(
+                model,
+                cfg,
+                input_data,
+                input_names=input_names,
+                output_names=output_names,
+                opset_version=opset_version,
+                dynamic_axes=dynamic_axes,
+            )
+            cached_onnx_path = os.path.join(cache_dir, cache_key, "model.onnx")
+
+        if cached_onnx_path is not None and os.path.exists(cached_onnx_path):
+            logger.info(f"Reuse the traced ONNX model cached in {os.path.dirname(cached_onnx_path)}")
+            shutil.copyfile(cached_onnx_path, onnx_path)
+            os.utime(os.path.dirname(cached_onnx_path))
+        else:
+            onnx_path = NaiveExporter.torch2onnx(
+                output_dir,
+                model,
+                input_data,
+                model_name=model_name,
+                input_names=input_names,
+                output_names=output_names,
+                opset_version=opset_version,
+                dynamic_axes=dynamic_axes,
+            )
+            if cached_onnx_path is not None:
+                os.makedirs(os.path.dirname(cached_onnx_path), exist_ok=True)
+                # copy under a temporary name first so that concurrent exports never read a partial file
+                tmp_path = f"{cached_onnx_path}.{os.getpid()}.tmp"
+                shutil.copyfile(onnx_path, tmp_path)
+                os.replace(tmp_path, cached_onnx_path)
+                evict_cache(cache_dir, EXPORT_CACHE_SIZE)  # type: ignore[arg-type]
+        timings["trace"] = time.perf_counter() - start_time
 
         if "ONNX" in export_type:
-            return
+            logger.info(f"Export timings: build {timings['build']:.2f}s, trace {timings['trace']:.2f}s")
+            return timings
 
         def get_normalize_cfg(cfg):
             def _get_normalize_cfg(cfg_):
@@ -96,17 +188,65 @@ class NaiveExporter:
         if normalize_cfg.get("to_rgb", False):
             mo_args["reverse_input_channels"] = None
 
-        if precision == "FP16":
-            mo_args["compress_to_fp16"] = None
         if mo_transforms:
             mo_args["transform"] = mo_transforms
 
-        NaiveExporter.onnx2openvino(
-            output_dir,
-            onnx_path,
-            model_name=model_name,
-            **mo_args,
+        start_time = time.perf_counter()
+        precisions = [precision] if isinstance(precision, str) else list(precision)
+        for precision_ in precisions:
+            target_dir = output_dir if isinstance(precision, str) else os.path.join(output_dir, precision_)
+            os.makedirs(target_dir, exist_ok=True)
+            target_mo_args = dict(mo_args)
+            if precision_ == "FP16":
+                target_mo_args["compress_to_fp16"] = None
+            NaiveExporter.onnx2openvino(
+                target_dir,
+                onnx_path,
+                model_name=model_name,
+                **target_mo_args,
+            )
+        timings["mo"] = time.perf_counter() - start_time
+        logger.info(
+            f"Export timings: build {timings['build']:.2f}s, trace {timings['trace']:.2f}s, mo {timings['mo']:.2f}s"
         )
+        return timings
+
+    @staticmethod
+    def get_cache_key(
+        model: torch.nn.Module,
+        cfg: mmcv.Config,
+        input_data: Dict[Any, Any],
+        *,
+        input_names: Optional[List[str]] = None,
+        output_names: Optional[List[str]] = None,
+        opset_version: int = 11,
+        dynamic_axes: Optional[Dict[Any, Any]] = None,
+    ) -> str:
+        """Get the key of the export cache from the model weights, configs and tracing options."""
+        weights_hash = hashlib.sha1()
+        for name, tensor in model.state_dict().items():
+            tensor = tensor.detach().cpu()
+            weights_hash.update(f"{name}:{tensor.dtype}:{tuple(tensor.shape)}".encode())
+            weights_hash.update(tensor.contiguous().numpy().tobytes())
+
+        imgs = input_data.get("img")
+        imgs = imgs if isinstance(imgs, (list, tuple)) else [imgs]
+        options = {
+            "weights": weights_hash.hexdigest(),
+            "model_type": type(model).__name__,
+            # builders may patch the forward for mixed precision without touching the config
+            "fp16_enabled": any(getattr(module, "fp16_enabled", False) for module in model.modules()),
+            "model": cfg.get("model"),
+            "pipeline": cfg.data.test.get("pipeline"),
+            "input_shapes": [tuple(getattr(img, "shape", ())) for img in imgs],
+            "input_names": input_names,
+            "output_names": output_names,
+            "opset_version": opset_version,
+            "dynamic_axes": dynamic_axes,
+            "versions": _get_package_versions(),
+            "code": [_get_source_hash(path) for path in _get_source_paths(type(model))],
+        }
+        return hashlib.sha1(json.dumps(options, sort_keys=True, default=str).encode()).hexdigest()
 
     @staticmethod
     def torch2onnx(
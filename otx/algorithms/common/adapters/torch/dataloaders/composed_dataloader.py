@@ -3,39 +3,173 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import queue
+import threading
+import time
+from typing import Any, List, Optional
+
 from otx.algorithms.common.utils.logger import get_logger
 
 logger = get_logger()
 
 
+def _empty_loader_error(loader) -> RuntimeError:
+    return RuntimeError(f"ComposedDL can't restart {loader} since it yields no batch")
+
+
+class _LoaderPrefetcher(threading.Thread):
+    """Background thread pulling batches from a data loader into a bounded queue.
+
+    Args:
+        loader: Data loader to pull batches from.
+        num_prefetch (int): Maximum number of batches pulled ahead of the consumer.
+        restart (bool): If True, the loader is restarted when exhausted. Otherwise, the thread stops.
+    """
+
+    _END = object()
+
+    def __init__(self, loader, num_prefetch: int, restart: bool):
+        super().__init__(daemon=True)
+        self._loader = loader
+        self._restart = restart
+        self._queue: queue.Queue = queue.Queue(maxsize=num_prefetch)
+        self._stop_event = threading.Event()
+
+    def run(self):
+        """Pull batches until the loader is exhausted or the prefetcher is stopped."""
+        try:
+            iterator = iter(self._loader)
+            # batches pulled since the loader was (re)started, an empty loader would be restarted forever
+            num_batches = 0
+            while not self._stop_event.is_set():
+                try:
+                    batch = next(iterator)
+                except StopIteration:
+                    if not self._restart:
+                        break
+                    if num_batches == 0:
+                        raise _empty_loader_error(self._loader) from None
+                    iterator = iter(self._loader)
+                    num_batches = 0
+                    continue
+                num_batches += 1
+                self._put(batch)
+        except Exception as e:  # pylint: disable=broad-except
+            self._put(e)
+            return
+        self._put(self._END)
+
+    def _put(self, item: Any):
+        while not self._stop_event.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def get(self):
+        """Return the next batch, re-raising errors of the loader in the consumer thread."""
+        item = self._queue.get()
+        if item is self._END:
+            raise StopIteration
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def stop(self):
+        """Stop pulling batches."""
+        self._stop_event.set()
+
+
 class CDLIterator:
-    """Iterator for aligning the number of batches as many as samples in the first iterator."""
+    """Iterator for aligning the number of batches as many as samples in the first iterator.
+
+    The first loader drives the epoch. The other loaders are restarted independently whenever they are exhausted.
+    If ``num_prefetch`` of the composed loader is positive, every loader is pulled by its own background thread,
+    so that the loaders load their batches concurrently.
+    """
 
     def __init__(self, cdl):
         self._cdl = cdl
         self._index = 0
-        self._cdl_iter = [iter(dl) for dl in self._cdl.loaders]
+        self._cdl_iter: List[Any] = []
+        self._prefetchers: List[_LoaderPrefetcher] = []
+        if cdl.num_prefetch > 0:
+            for i, loader in enumerate(cdl.loaders):
+                num_prefetch = cdl.num_prefetch if i == 0 else cdl.num_prefetch * cdl.ratios[i - 1]
+                prefetcher = _LoaderPrefetcher(loader, num_prefetch, restart=i > 0)
+                prefetcher.start()
+                self._prefetchers.append(prefetcher)
+        else:
+            self._cdl_iter = [iter(dl) for dl in self._cdl.loaders]
+        self.wait_times = [0.0] * len(self._cdl.loaders)
+        cdl.wait_times = self.wait_times
+
+    def _next_batch(self, i: int):
+        start = time.perf_counter()
+        try:
+            if self._prefetchers:
+                return self._prefetchers[i].get()
+            try:
+                return next(self._cdl_iter[i])
+            except StopIteration:
+                if i == 0:
+                    raise
+                self._cdl_iter[i] = iter(self._cdl.loaders[i])
+            try:
+                return next(self._cdl_iter[i])
+            except StopIteration:
+                raise _empty_loader_error(self._cdl.loaders[i]) from None
+        finally:
+            self.wait_times[i] += time.perf_counter() - start
 
     def __next__(self):
         """Generate the next batch."""
         if self._index < self._cdl.max_iter:
-            batches = {}
-            for i, iterator in enumerate(self._cdl_iter):
-                if i == 0:
-                    batches = next(iterator)
-                else:
-                    try:
-                        batches[f"extra_{i-1}"] = next(iterator)
-                    except StopIteration:
-                        self._cdl_iter[1] = iter(self._cdl.loaders[1])
-                        batches[f"extra_{i-1}"] = next(self._cdl_iter[1])
+            try:
+                batches = self._next_batch(0)
+                for i, ratio in enumerate(self._cdl.ratios, 1):
+                    if ratio == 1:
+                        batches[f"extra_{i-1}"] = self._next_batch(i)
+                    else:
+                        batches[f"extra_{i-1}"] = [self._next_batch(i) for _ in range(ratio)]
+            except Exception:
+                self.close()
+                raise
             self._index += 1
             return batches
+        self.close()
         raise StopIteration
 
+    def close(self):
+        """Stop the background threads and log how long each loader kept the training waiting."""
+        if self._prefetchers:
+            for prefetcher in self._prefetchers:
+                prefetcher.stop()
+            self._prefetchers = []
+        if self._index > 0:
+            wait_times = ", ".join(f"{wait_time:.2f}s" for wait_time in self.wait_times)
+            logger.info(f"ComposedDL waited for the loaders: {wait_times} over {self._index} iterations")
+
+    def __del__(self):
+        """Stop the background threads if the iterator is dropped before the end of the epoch."""
+        for prefetcher in self._prefetchers:
+            prefetcher.stop()
+
 
 class ComposedDL:
-    """Composed dataloader for combining two or more loaders together."""
+    """Composed dataloader for combining two or more loaders together.
+
+    Args:
+        loaders (list): Data loaders. The first one defines the length of an epoch and its batch is returned
+            with the batches of the other loaders added under the ``extra_{i}`` keys.
+        ratios (Optional[List[int]]): Number of batches taken from each extra loader per step, e.g. ``[2]`` for
+            1 labeled : 2 unlabeled batches. Defaults to 1 per loader. A ratio larger than 1 puts a list of batches
+            under ``extra_{i}`` instead of a single batch. The semi-supervised models of OTX only accept a single
+            batch, so ratios larger than 1 are only meant for models which handle the list themselves.
+        num_prefetch (int): If positive, the loaders are pulled concurrently by background threads,
+            each one up to this many steps ahead. Defaults to 0, pulling the loaders in sequence at each step.
+    """
 
     class DummySampler:
         """Dummy sampler class to relay set_epoch() call to the list of data loaders in the CDL."""
@@ -49,11 +183,19 @@ class ComposedDL:
             for loader in loaders:
                 loader.sampler.set_epoch(epoch)
 
-    def __init__(self, loaders=None):
+    def __init__(self, loaders=None, ratios: Optional[List[int]] = None, num_prefetch: int = 0):
         if loaders is None:
             loaders = []
         self.loaders = loaders
         self.max_iter = len(self.loaders[0])
+        if ratios is None:
+            ratios = [1] * (len(loaders) - 1)
+        if len(ratios) != len(loaders) - 1 or any(ratio < 1 for ratio in ratios):
+            raise ValueError(f"Expected a positive ratio for each of the {len(loaders) - 1} extra loaders: {ratios}")
+        self.ratios = ratios
+        self.num_prefetch = num_prefetch
+        # Seconds spent waiting for each loader during the last epoch
+        self.wait_times = [0.0] * len(self.loaders)
         logger.info(f"possible max iterations = {self.max_iter}")
         self._sampler = ComposedDL.DummySampler(self)
 
@@ -34,6 +34,12 @@ class BalancedSampler(Sampler):  # pylint: disable=too-many-instance-attributes
             self.dataset = dataset
         self.img_indices = self.dataset.img_indices
         self.num_cls = len(self.img_indices.keys())
+        # CSR-style class to image index, built once and reused by every epoch
+        self.cls_lengths = np.array([len(cls_indices) for cls_indices in self.img_indices.values()], dtype=np.int64)
+        self.cls_offsets = np.cumsum(self.cls_lengths) - self.cls_lengths
+        self.cls_indices = np.concatenate(
+            [np.asarray(cls_indices, dtype=np.int64) for cls_indices in self.img_indices.values()]
+        )
         self.data_length = len(self.dataset)
         self.num_replicas = num_replicas
         self.rank = rank
@@ -78,16 +84,11 @@ class BalancedSampler(Sampler):  # pylint: disable=too-many-instance-attributes
 
     def __iter__(self):
         """Iter."""
-        indices = []
-        for _ in range(self.repeat):
-            for _ in range(self.num_trials):
-                indice = np.concatenate(
-                    [np.random.choice(self.img_indices[cls_indices], 1) for cls_indices in self.img_indices.keys()]
-                )
-                indices.append(indice)
-
-        indices = np.concatenate(indices)
-        indices = indices.astype(np.int64).tolist()
+        if np.any(self.cls_lengths == 0):
+            raise ValueError("Required at least one sample per class")
+        # one sample per class for each trial, drawn for the whole epoch at once
+        choices = np.random.randint(0, self.cls_lengths, size=(self.repeat * self.num_trials, self.num_cls))
+        indices = self.cls_indices[self.cls_offsets + choices].reshape(-1).tolist()
 
         if self.num_replicas > 1:
             if not self.drop_last:
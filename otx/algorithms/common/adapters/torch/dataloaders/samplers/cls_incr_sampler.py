@@ -37,14 +37,14 @@ class ClsIncrSampler(Sampler):  # pylint: disable=too-many-instance-attributes
         self.dataset, self.repeat = unwrap_dataset(dataset)
 
         if hasattr(self.dataset, "img_indices"):
-            self.new_indices = self.dataset.img_indices["new"]
-            self.old_indices = self.dataset.img_indices["old"]
+            self.new_indices = np.asarray(self.dataset.img_indices["new"], dtype=np.int64)
+            self.old_indices = np.asarray(self.dataset.img_indices["old"], dtype=np.int64)
         else:
             raise TypeError(f"{self.dataset} type does not have img_indices")
 
         if not len(self.new_indices) > 0:
             self.new_indices = self.old_indices
-            self.old_indices = []
+            self.old_indices = np.array([], dtype=np.int64)
 
         old_new_ratio = np.sqrt(len(self.old_indices) / len(self.new_indices))
 
@@ -86,15 +86,15 @@ class ClsIncrSampler(Sampler):  # pylint: disable=too-many-instance-attributes
 
     def __iter__(self):
         """Iter."""
-        indices = []
-        for _ in range(self.repeat):
-            for _ in range(int(self.data_length / (1 + self.old_new_ratio))):
-                indice = np.concatenate(
-                    [np.random.choice(self.new_indices, 1), np.random.choice(self.old_indices, self.old_new_ratio)]
-                )
-                indices.append(indice)
-
-        indices = np.concatenate(indices)
+        # one new sample and old_new_ratio old samples for each trial, drawn for the whole epoch at once
+        num_trials = self.repeat * int(self.data_length / (1 + self.old_new_ratio))
+        indices = np.concatenate(
+            [
+                np.random.choice(self.new_indices, (num_trials, 1)),
+                np.random.choice(self.old_indices, (num_trials, self.old_new_ratio)),
+            ],
+            axis=1,
+        ).reshape(-1)
         if not self.drop_last:
             num_extra = int(
                 np.ceil(self.data_length * self.repeat / self.samples_per_gpu)
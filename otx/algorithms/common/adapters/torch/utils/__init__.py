@@ -4,5 +4,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from .bs_search_algo import BsSearchAlgo
+from .ema import ema_update_
 
-__all__ = ["BsSearchAlgo"]
+__all__ = ["BsSearchAlgo", "ema_update_"]
@@ -1,10 +1,13 @@
-"""Algorithm to find a proper batch size which is fit to current GPU device."""
+"""Algorithm to find a proper batch size which is fit to current device."""
 
 # Copyright (C) 2023 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Callable, Dict, Tuple
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
 
+import psutil
 import torch
 
 from otx.algorithms.common.utils.logger import get_logger
@@ -12,16 +15,63 @@ from otx.algorithms.common.utils.logger import get_logger
 logger = get_logger()
 
 
+def _get_process_tree_rss() -> int:
+    """Get RSS of the current process and its children such as dataloader workers."""
+    process = psutil.Process()
+    rss = process.memory_info().rss
+    for child in process.children(recursive=True):
+        try:
+            rss += child.memory_info().rss
+        except psutil.Error:  # child exited meanwhile
+            continue
+    return rss
+
+
+class _PeakRssMonitor:
+    """Context manager sampling RSS of the process tree in a background thread to get its peak during a trial.
+
+    Args:
+        interval (float): Sampling interval in seconds.
+    """
+
+    def __init__(self, interval: float = 0.05):
+        self._interval = interval
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self.peak_rss = 0
+
+    def _sample(self):
+        while not self._stop_event.wait(self._interval):
+            self.peak_rss = max(self.peak_rss, _get_process_tree_rss())
+
+    def __enter__(self) -> "_PeakRssMonitor":
+        self.peak_rss = _get_process_tree_rss()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stop_event.set()
+        self._thread.join()
+        self.peak_rss = max(self.peak_rss, _get_process_tree_rss())
+
+
 class BsSearchAlgo:
     """Algorithm class to find optimal batch size.
 
+    On GPU, the peak memory allocated by torch is compared with the device memory.
+    On CPU, the peak RSS of the process and its children (e.g. dataloader workers) is compared with the host memory
+    available at the beginning of the search.
+
     Args:
         train_func (Callable[[int], None]): Training function with single arugment to set batch size.
         default_bs (int): Default batch size. It should be bigger than 0.
         max_bs (int): Maximum batch size. It should be bigger than 0.
+        mem_budget (Optional[int]): If set, memory in bytes the training may use instead of the whole device memory.
     """
 
-    def __init__(self, train_func: Callable[[int], None], default_bs: int, max_bs: int):
+    def __init__(
+        self, train_func: Callable[[int], None], default_bs: int, max_bs: int, mem_budget: Optional[int] = None
+    ):
         if default_bs <= 0:
             raise ValueError("Batch size should be bigger than 0.")
         if max_bs <= 0:
@@ -34,33 +84,60 @@ class BsSearchAlgo:
         self._default_bs = default_bs
         self._max_bs = max_bs
         self._bs_try_history: Dict[int, int] = {}
-        _, self._total_mem = torch.cuda.mem_get_info()
+        self._use_cuda = torch.cuda.is_available()
+        if self._use_cuda:
+            _, self._total_mem = torch.cuda.mem_get_info()
+        else:
+            # Trials are measured by the absolute peak RSS of the process tree. RSS freed by a previous trial but not
+            # returned to the OS is counted again, which may overestimate but never underestimate a trial.
+            self._total_mem = psutil.virtual_memory().available + _get_process_tree_rss()
+        if mem_budget is not None:
+            self._total_mem = min(self._total_mem, mem_budget)
         self._mem_lower_bound = 0.8 * self._total_mem
         self._mem_upper_bound = 0.85 * self._total_mem
 
+    def _is_oom(self, error: Exception) -> bool:
+        if isinstance(error, MemoryError):
+            return True
+        if self._use_cuda:
+            return str(error).startswith("CUDA out of memory.")
+        return "DefaultCPUAllocator" in str(error)
+
     def _try_batch_size(self, bs: int) -> Tuple[bool, int]:
         cuda_oom = False
-        torch.cuda.reset_max_memory_allocated(device=None)
-        torch.cuda.empty_cache()
+        if self._use_cuda:
+            torch.cuda.reset_max_memory_allocated(device=None)
+            torch.cuda.empty_cache()
 
+        start_time = time.perf_counter()
+        rss_monitor = _PeakRssMonitor()
         try:
-            self._train_func(bs)
-        except RuntimeError as e:
-            if str(e).startswith("CUDA out of memory."):
+            if self._use_cuda:
+                self._train_func(bs)
+            else:
+                with rss_monitor:
+                    self._train_func(bs)
+        except (RuntimeError, MemoryError) as e:
+            if self._is_oom(e):
                 cuda_oom = True
             else:
                 raise e
+        elapsed_time = time.perf_counter() - start_time
 
-        max_memory_allocated = torch.cuda.max_memory_allocated(device=None)
+        if self._use_cuda:
+            max_memory_allocated = torch.cuda.max_memory_allocated(device=None)
+        else:
+            max_memory_allocated = rss_monitor.peak_rss
         if not cuda_oom:
             # Because heapq only supports min heap, use negatized batch size
             self._bs_try_history[bs] = max_memory_allocated
 
         logger.debug(
-            f"Adapting Batch size => bs : {bs}, CUDA_OOM : {cuda_oom}, "
-            f"GPU memory usage : {max_memory_allocated / self._total_mem}%"
+            f"Adapting Batch size => bs : {bs}, OOM : {cuda_oom}, "
+            f"memory usage : {max_memory_allocated / self._total_mem}%, time : {elapsed_time:.2f}s"
         )
-        torch.cuda.empty_cache()
+        if self._use_cuda:
+            torch.cuda.empty_cache()
 
         return cuda_oom, max_memory_allocated
 
@@ -72,7 +149,7 @@ class BsSearchAlgo:
         return ret
 
     def auto_decrease_batch_size(self) -> int:
-        """Decrease batch size if default batch size isn't fit to current GPU device.
+        """Decrease batch size if default batch size isn't fit to current device.
 
         Returns:
             int: Proper batch size possibly decreased as default value isn't fit
@@ -107,7 +184,7 @@ class BsSearchAlgo:
         This function finds a big enough batch size by training with various batch sizes.
         It estimate a batch size using equation is estimated using training history.
         The reason why using the word "big enough" is that it tries to find not maxmium but big enough value which uses
-        GPU memory between lower and upper bound.
+        device memory between lower and upper bound.
 
         Args:
             drop_last (bool): Whether to drop the last incomplete batch.
@@ -0,0 +1,39 @@
+"""Fused exponential moving average update of tensors."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import List, Sequence
+
+import torch
+
+
+def ema_update_(dst_tensors: Sequence[torch.Tensor], src_tensors: Sequence[torch.Tensor], momentum: float) -> None:
+    """Update destination tensors in place with exponential moving average of source tensors.
+
+    Computes dst = (1 - momentum) * dst + momentum * src for every pair of tensors. Floating point tensors are
+    updated with multi-tensor ``torch._foreach_*`` kernels when available and without any temporary tensor.
+    Other tensors (e.g. ``num_batches_tracked`` of BatchNorm) keep being averaged and truncated to their dtype.
+
+    Args:
+        dst_tensors (Sequence[torch.Tensor]): Tensors to update, e.g. EMA model parameters and buffers.
+        src_tensors (Sequence[torch.Tensor]): Source tensors, in the same order and on the same device as dst_tensors.
+        momentum (float): Weight of the source tensors.
+    """
+    float_dst: List[torch.Tensor] = []
+    float_src: List[torch.Tensor] = []
+    with torch.no_grad():
+        for dst, src in zip(dst_tensors, src_tensors):
+            if dst.is_floating_point():
+                float_dst.append(dst)
+                float_src.append(src)
+            else:
+                dst.copy_(dst * (1 - momentum) + src * momentum)
+        if not float_dst:
+            return
+        if hasattr(torch, "_foreach_mul_"):
+            torch._foreach_mul_(float_dst, 1 - momentum)  # pylint: disable=protected-access
+            torch._foreach_add_(float_dst, float_src, alpha=momentum)  # pylint: disable=protected-access
+        else:
+            for dst, src in zip(float_dst, float_src):
+                dst.mul_(1 - momentum).add_(src, alpha=momentum)
@@ -19,8 +19,13 @@ from .callback import (
     OptimizationProgressCallback,
     TrainingProgressCallback,
 )
-from .data import get_cls_img_indices, get_image, get_old_new_img_indices
-from .ir import embed_ir_model_data
+from .data import (
+    get_cls_img_indices,
+    get_image,
+    get_old_new_img_indices,
+    get_stratified_indices,
+)
+from .ir import embed_ir_model_data, get_ir_model_data, get_ir_model_paths
 from .utils import (
     UncopiableDefaultDict,
     get_arg_spec,
@@ -31,8 +36,11 @@ from .utils import (
 
 __all__ = [
     "embed_ir_model_data",
+    "get_ir_model_data",
+    "get_ir_model_paths",
     "get_cls_img_indices",
     "get_old_new_img_indices",
+    "get_stratified_indices",
     "TrainingProgressCallback",
     "InferenceProgressCallback",
     "OptimizationProgressCallback",
@@ -0,0 +1,170 @@
+"""Calibration data loader for post-training optimization of OpenVINO models."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import hashlib
+import json
+import os
+import os.path as osp
+import tempfile
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from compression.api import DataLoader
+
+from otx.algorithms.common.utils.data import get_stratified_indices
+from otx.algorithms.common.utils.logger import get_logger
+from otx.api.entities.datasets import DatasetEntity
+from otx.api.usecases.exportable_code.inference import BaseInferencer
+from otx.core.file import evict_cache
+
+logger = get_logger()
+
+CALIBRATION_CACHE_SIZE = 2 * 1024**3
+
+
+def get_model_input_spec(model: Any) -> str:
+    """Describe the inputs and the preprocessing parameters of a ModelAPI model.
+
+    Args:
+        model (Any): ModelAPI model of an inferencer
+
+    Returns:
+        str: JSON string, which changes whenever the preprocessed inputs of the model may change
+    """
+    inputs = {}
+    for name, meta in sorted(getattr(model, "inputs", {}).items()):
+        inputs[name] = [str(list(meta.shape)), str(meta.precision), str(meta.layout)]
+    parameters = {}
+    if hasattr(model, "parameters"):
+        for name in sorted(model.parameters()):
+            if hasattr(model, name):
+                parameters[name] = repr(getattr(model, name))
+    return json.dumps({"class": type(model).__name__, "inputs": inputs, "parameters": parameters}, sort_keys=True)
+
+
+def _encode_metadata(value: Any) -> Any:
+    """Convert preprocessing metadata to JSON, keeping tuples apart from lists."""
+    if isinstance(value, dict):
+        return {"dict": [[key, _encode_metadata(item)] for key, item in value.items()]}
+    if isinstance(value, (tuple, list)):
+        return {type(value).__name__: [_encode_metadata(item) for item in value]}
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise TypeError(f"Unsupported metadata type: {type(value)}")
+
+
+def _decode_metadata(value: Any) -> Any:
+    """Inverse of _encode_metadata()."""
+    if not isinstance(value, dict):
+        return value
+    ((kind, items),) = value.items()
+    if kind == "dict":
+        return {key: _decode_metadata(item) for key, item in items}
+    decoded = [_decode_metadata(item) for item in items]
+    return tuple(decoded) if kind == "tuple" else decoded
+
+
+class CalibrationDataLoader(DataLoader):
+    """POT data loader serving a deterministic calibration subset.
+
+    The subset is picked by get_stratified_indices() and its items are preprocessed when POT requests them.
+    If ``cache_dir`` is given, the preprocessed inputs of each item are saved to a file keyed by the input spec of
+    the model and the fingerprint of the picked items, so that repeated optimizations of the same IR on the same
+    data neither decode nor preprocess any image. Before it is used, the cache directory is trimmed to
+    CALIBRATION_CACHE_SIZE bytes, removing the least recently written subsets first.
+
+    Args:
+        dataset (DatasetEntity): Dataset to pick the calibration items from
+        inferencer (BaseInferencer): Inferencer preprocessing the images
+        size (int): Number of calibration items, i.e. stat_subset_size of POT
+        cache_dir (str, optional): Directory to cache preprocessed inputs. Defaults to None, disabling caching.
+        seed (int): Seed of the pick of calibration items
+    """
+
+    def __init__(
+        self,
+        dataset: DatasetEntity,
+        inferencer: BaseInferencer,
+        size: int,
+        cache_dir: Optional[str] = None,
+        seed: int = 0,
+    ):
+        super().__init__(config=None)
+        self.dataset = dataset
+        self.inferencer = inferencer
+        self.cache_dir = cache_dir
+        self.indices = get_stratified_indices(dataset, size, seed)
+        self._subset_dir: Optional[str] = None
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            evict_cache(self.cache_dir, CALIBRATION_CACHE_SIZE)
+
+    def __getitem__(self, index: int):
+        """Get preprocessed inputs of the index-th calibration item."""
+        item = self.dataset[self.indices[index]]
+        sample = self._load_sample(index)
+        if sample is None:
+            sample = self.inferencer.pre_process(item.numpy)
+            self._save_sample(index, sample)
+        inputs, metadata = sample
+        return (index, item.annotation_scene), inputs, metadata
+
+    def __len__(self):
+        """Get number of calibration items."""
+        return len(self.indices)
+
+    def _get_fingerprint(self) -> str:
+        fingerprint = hashlib.sha1(get_model_input_spec(getattr(self.inferencer, "model", None)).encode())
+        for index in self.indices:
+            item = self.dataset[index]
+            path = getattr(item.media, "path", None)
+            if path is not None and osp.exists(path):
+                stat = os.stat(path)
+                fingerprint.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+            else:
+                fingerprint.update(np.ascontiguousarray(item.media.numpy).tobytes())
+            roi = item.roi.shape
+            fingerprint.update(np.asarray([roi.x1, roi.y1, roi.x2, roi.y2], dtype=np.float64).tobytes())
+        return fingerprint.hexdigest()
+
+    def _get_sample_path(self, index: int) -> Optional[str]:
+        if self.cache_dir is None:
+            return None
+        if self._subset_dir is None:
+            self._subset_dir = osp.join(self.cache_dir, self._get_fingerprint())
+        return osp.join(self._subset_dir, f"{index:06d}.npz")
+
+    def _load_sample(self, index: int) -> Optional[Tuple[Dict[str, np.ndarray], Any]]:
+        path = self._get_sample_path(index)
+        if path is None or not osp.exists(path):
+            return None
+        try:
+            with np.load(path) as cached:
+                metadata = _decode_metadata(json.loads(str(cached["metadata"])))
+                inputs = {key[len("input_") :]: cached[key] for key in cached.files if key.startswith("input_")}
+            return inputs, metadata
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning(f"Ignoring broken calibration cache {path}: {e}")
+            return None
+
+    def _save_sample(self, index: int, sample: Tuple[Dict[str, np.ndarray], Any]):
+        path = self._get_sample_path(index)
+        if path is None:
+            return
+        inputs, metadata = sample
+        try:
+            encoded_metadata = json.dumps(_encode_metadata(metadata))
+        except TypeError as e:
+            logger.debug(f"Calibration sample {index} is not cached: {e}")
+            return
+        os.makedirs(osp.dirname(path), exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=osp.dirname(path), suffix=".tmp", delete=False) as f:
+            np.savez(
+                f, metadata=np.asarray(encoded_metadata), **{f"input_{key}": value for key, value in inputs.items()}
+            )
+        os.replace(f.name, path)
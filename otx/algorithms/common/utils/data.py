@@ -19,7 +19,7 @@
 import glob
 import logging
 import os
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
@@ -109,11 +109,8 @@ def get_cls_img_indices(labels, dataset):
         dataset(DatasetEntity): dataset entity
     """
     img_indices = {label.name: [] for label in labels}
-    for i, item in enumerate(dataset):
-        item_labels = item.annotation_scene.get_labels()
-        for i_l in item_labels:
-            if i_l in labels:
-                img_indices[i_l.name].append(i)
+    for label in labels:
+        img_indices[label.name].extend(dataset.get_item_indices_with_labels([label]))
 
     return img_indices
 
@@ -126,17 +123,52 @@ def get_old_new_img_indices(labels, new_classes, dataset):
         new_classes(List[str]): List of new classes
         dataset(DatasetEntity): dataset entity
     """
-    ids_old, ids_new = [], []
     _dataset_label_schema_map = {label.name: label for label in labels}
-    new_classes = [_dataset_label_schema_map[new_class] for new_class in new_classes]
-    for i, item in enumerate(dataset):
-        if item.annotation_scene.contains_any(new_classes):
-            ids_new.append(i)
-        else:
-            ids_old.append(i)
+    new_names = {_dataset_label_schema_map[new_class].name for new_class in new_classes}
+    # labels are matched by name, as in AnnotationSceneEntity.contains_any
+    new_labels = [label for label in dataset.get_labels(include_empty=True) if label.name in new_names]
+    ids_new = dataset.get_item_indices_with_labels(new_labels, include_empty=True)
+    new_set = set(ids_new)
+    ids_old = [i for i in range(len(dataset)) if i not in new_set]
     return {"old": ids_old, "new": ids_new}
 
 
+def get_stratified_indices(dataset: DatasetEntity, size: int, seed: int = 0) -> List[int]:
+    """Deterministically pick indices of a subset of the dataset, stratified by labels.
+
+    Items are grouped by the set of their label ids. Each group contributes in proportion to its size, the remainder
+    going to the groups with the largest fractional parts. Items are picked within a group in a random order given
+    by the seed, so that the same dataset always gives the same subset.
+
+    Args:
+        dataset (DatasetEntity): Dataset to pick items from
+        size (int): Number of items to pick. The whole dataset is returned if it is not larger.
+        seed (int): Seed of the order of items within each group
+
+    Returns:
+        List[int]: Sorted indices of the picked items
+    """
+    if size >= len(dataset):
+        return list(range(len(dataset)))
+    groups: Dict[Tuple[str, ...], List[int]] = {}
+    for index, item in enumerate(dataset):
+        key = tuple(sorted(str(label_id) for label_id in item.annotation_scene.get_label_ids(include_empty=True)))
+        groups.setdefault(key, []).append(index)
+    keys = sorted(groups)
+    quotas = np.array([len(groups[key]) * size / len(dataset) for key in keys])
+    counts = np.floor(quotas).astype(np.int64)
+    remainder = size - counts.sum()
+    # Stable sort, so that ties are broken by the order of keys
+    counts[np.argsort(counts - quotas, kind="stable")[:remainder]] += 1
+
+    rng = np.random.default_rng(seed)
+    indices: List[int] = []
+    for key, count in zip(keys, counts):
+        group = np.asarray(groups[key])
+        indices.extend(group[rng.permutation(len(group))[:count]].tolist())
+    return sorted(indices)
+
+
 def get_image(results: Dict[str, Any], cache_dir: str, to_float32=False) -> np.ndarray:
     """Load an image and cache it if it's a training video frame.
 
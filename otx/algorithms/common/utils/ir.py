@@ -4,10 +4,13 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
-from typing import Any, Dict, Tuple
+import os
+from typing import Any, Dict, Tuple, Union
 
 from openvino.runtime import Core, serialize
 
+from otx.api.entities.model import ModelEntity
+
 
 def embed_ir_model_data(xml_file: str, data_items: Dict[Tuple[str], Any]) -> None:
     """Embeds serialized data to IR xml file.
@@ -22,3 +25,42 @@ def embed_ir_model_data(xml_file: str, data_items: Dict[Tuple[str], Any]) -> Non
     for k, data in data_items.items():
         model.set_rt_info(data, list(k))
     serialize(model, xml_file)
+
+
+def get_ir_model_data(model: ModelEntity) -> Tuple[Union[str, bytes], Union[str, bytes]]:
+    """Returns IR xml and bin of the model to be passed to OpenVINO.
+
+    Paths are returned if the model adapters are backed by files so that OpenVINO reads the weights
+    from disk directly, otherwise the bytes data is returned.
+
+    Args:
+        model : a model entity holding "openvino.xml" and "openvino.bin".
+    """
+
+    xml_adapter = model.model_adapters["openvino.xml"]
+    bin_adapter = model.model_adapters["openvino.bin"]
+    if xml_adapter.file_path is not None and bin_adapter.file_path is not None:
+        return xml_adapter.file_path, bin_adapter.file_path
+    return xml_adapter.data, bin_adapter.data
+
+
+def get_ir_model_paths(model: ModelEntity, save_dir: str) -> Tuple[str, str]:
+    """Returns paths of IR xml and bin files of the model.
+
+    File-backed model adapters are used in place, otherwise the data is written to save_dir.
+
+    Args:
+        model : a model entity holding "openvino.xml" and "openvino.bin".
+        save_dir : a directory to write the data which is not backed by files.
+    """
+
+    paths = []
+    for key, filename in (("openvino.xml", "model.xml"), ("openvino.bin", "model.bin")):
+        model_adapter = model.model_adapters[key]
+        path = model_adapter.file_path
+        if path is None:
+            path = os.path.join(save_dir, filename)
+            with open(path, "wb") as f:
+                f.write(model_adapter.data)
+        paths.append(path)
+    return paths[0], paths[1]
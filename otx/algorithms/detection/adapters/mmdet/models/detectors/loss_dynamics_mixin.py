@@ -8,7 +8,6 @@ from typing import Dict, Sequence, Tuple
 
 import datumaro as dm
 import numpy as np
-import pandas as pd
 
 from otx.algorithms.common.utils.logger import get_logger
 from otx.algorithms.detection.adapters.mmdet.models.loss_dyns import TrackingLossType
@@ -16,6 +15,7 @@ from otx.api.entities.dataset_item import DatasetItemEntityWithID
 from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.shapes.rectangle import Rectangle
 from otx.core.data.noisy_label_detection import (
+    LossDynamicsStore,
     LossDynamicsTracker,
     LossDynamicsTrackingMixin,
 )
@@ -30,8 +30,8 @@ class DetLossDynamicsTracker(LossDynamicsTracker):
 
     def __init__(self, tracking_loss_types: Sequence[TrackingLossType]) -> None:
         super().__init__()
-        self._loss_dynamics: Dict[TrackingLossType, Dict] = {
-            loss_type: defaultdict(list) for loss_type in tracking_loss_types
+        self._loss_dynamics: Dict[TrackingLossType, LossDynamicsStore] = {
+            loss_type: LossDynamicsStore() for loss_type in tracking_loss_types
         }
 
     def _convert_anns(self, item: DatasetItemEntityWithID):
@@ -64,29 +64,21 @@ class DetLossDynamicsTracker(LossDynamicsTracker):
         """Accumulate training loss dynamics for each training step."""
         for key, loss_dyns in outputs.items():
             if isinstance(key, TrackingLossType):
-                for (entity_id, ann_id), value in loss_dyns.items():
-                    self._loss_dynamics[key][(entity_id, ann_id)].append((iter, value))
+                self._loss_dynamics[key].append(iter, list(loss_dyns.keys()), list(loss_dyns.values()))
 
     def export(self, output_path: str) -> None:
         """Export loss dynamics statistics to Datumaro format."""
-        dfs = [
-            pd.DataFrame.from_dict(
-                {
-                    k: (np.array([iter for iter, _ in arr]), np.array([value for _, value in arr]))
-                    for k, arr in loss_dyns.items()
-                },
-                orient="index",
-                columns=["iters", f"loss_dynamics_{key.name}"],
-            )
-            for key, loss_dyns in self._loss_dynamics.items()
-        ]
-        df = pd.concat(dfs, axis=1)
-        df = df.loc[:, ~df.columns.duplicated()]
-
-        for (entity_id, ann_id), row in df.iterrows():
+        attributes: Dict[Tuple[str, str], Dict[str, np.ndarray]] = defaultdict(dict)
+        for key, store in self._loss_dynamics.items():
+            for (entity_id, ann_id), iters, values in store.group_by_key():
+                attrs = attributes[(entity_id, ann_id)]
+                attrs.setdefault("iters", iters)
+                attrs[f"loss_dynamics_{key.name}"] = values.astype(np.float32)
+
+        for (entity_id, ann_id), attrs in attributes.items():
             ann = self.otx_ann_id_to_dm_ann_map.get((entity_id, ann_id), None)
             if ann:
-                ann.attributes = row.to_dict()
+                ann.attributes = attrs
 
         self._export_dataset.export(output_path, format="datumaro")
 
@@ -36,10 +36,13 @@ from otx.algorithms.detection.utils.data import (
     adaptive_tile_params,
     format_list_to_str,
     get_anchor_boxes,
+    get_dataset_profile,
     get_sizes_from_dataset_entity,
+    get_sizes_from_profile,
 )
 from otx.api.entities.datasets import DatasetEntity, DatasetPurpose
 from otx.api.entities.label import Domain, LabelEntity
+from otx.core.file import get_cache_dir
 
 try:
     from sklearn.cluster import KMeans
@@ -295,16 +298,21 @@ def cluster_anchors(recipe_config: Config, dataset: DatasetEntity):
     ]
     prev_generator = recipe_config.model.bbox_head.anchor_generator
     group_as = [len(width) for width in prev_generator.widths]
-    wh_stats = get_sizes_from_dataset_entity(dataset, list(target_wh))
+    profile = get_dataset_profile(dataset, Domain.DETECTION, cache_dir=get_cache_dir("dataset_profile"))
+    wh_stats, counts = get_sizes_from_profile(profile, list(target_wh))
 
-    if len(wh_stats) < sum(group_as):
+    if counts.sum() < sum(group_as):
         logger.warning(
-            f"There are not enough objects to cluster: {len(wh_stats)} were detected, while it should be "
+            f"There are not enough objects to cluster: {counts.sum()} were detected, while it should be "
             f"at least {sum(group_as)}. Anchor box clustering was skipped."
         )
         return
 
-    widths, heights = get_anchor_boxes(wh_stats, group_as)
+    if len(wh_stats) < sum(group_as):
+        # Too few distinct box sizes for the histogram, cluster the exact sizes instead
+        widths, heights = get_anchor_boxes(get_sizes_from_dataset_entity(dataset, list(target_wh)), group_as)
+    else:
+        widths, heights = get_anchor_boxes(wh_stats, group_as, weights=counts)
     logger.info(
         f"Anchor boxes widths have been updated from {format_list_to_str(prev_generator.widths)} "
         f"to {format_list_to_str(widths)}"
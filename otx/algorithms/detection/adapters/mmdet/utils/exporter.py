@@ -11,6 +11,7 @@ from otx.algorithms.common.adapters.mmdeploy.utils.utils import (
 )
 from otx.algorithms.common.utils.logger import get_logger
 from otx.algorithms.detection.adapters.mmdet.utils.builder import build_detector
+from otx.core.file import get_cache_dir
 
 logger = get_logger()
 
@@ -69,4 +70,5 @@ class DetectionExporter(Exporter):
             output_names=["boxes", "labels"],
             opset_version=opset_version,
             export_type=export_type,
+            cache_dir=get_cache_dir("export"),
         )
@@ -28,7 +28,6 @@ from zipfile import ZipFile
 import attr
 import numpy as np
 from addict import Dict as ADDict
-from compression.api import DataLoader
 from compression.engines.ie_engine import IEEngine
 from compression.graph import load_model, save_model
 from compression.graph.model_utils import compress_model_weights, get_nodes_by_type
@@ -36,6 +35,8 @@ from compression.pipeline.initializer import create_pipeline
 from openvino.model_zoo.model_api.adapters import OpenvinoAdapter, create_core
 from openvino.model_zoo.model_api.models import Model
 
+from otx.algorithms.common.utils.calibration import CalibrationDataLoader
+from otx.algorithms.common.utils.ir import get_ir_model_data, get_ir_model_paths
 from otx.algorithms.common.utils.logger import get_logger
 from otx.algorithms.common.utils.utils import get_default_async_reqs_num
 from otx.algorithms.detection.adapters.openvino import model_wrappers
@@ -88,6 +89,7 @@ from otx.api.usecases.tasks.interfaces.optimization_interface import (
 from otx.api.utils.dataset_utils import add_saliency_maps_to_dataset_item
 from otx.api.utils.detection_utils import detection2array
 from otx.api.utils.tiler import Tiler
+from otx.core.file import get_cache_dir
 
 logger = get_logger()
 
@@ -371,26 +373,6 @@ class OpenVINOTileClassifierWrapper(BaseInferencerWithConverter):
         return detections, features
 
 
-class OTXOpenVinoDataLoader(DataLoader):
-    """Data loader for OTXDetection using OpenVINO backend."""
-
-    def __init__(self, dataset: DatasetEntity, inferencer: BaseInferencer):
-        self.dataset = dataset
-        self.inferencer = inferencer
-
-    def __getitem__(self, index: int):
-        """Return dataset item from index."""
-        image = self.dataset[index].numpy
-        annotation = self.dataset[index].annotation_scene
-        inputs, metadata = self.inferencer.pre_process(image)
-
-        return (index, annotation), inputs, metadata
-
-    def __len__(self):
-        """Length of OTXOpenVinoDataLoader."""
-        return len(self.dataset)
-
-
 class OpenVINODetectionTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IOptimizationTask):
     """Task implementation for OTXDetection using OpenVINO backend."""
 
@@ -450,11 +432,12 @@ class OpenVINODetectionTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IO
         async_requests_num = get_default_async_reqs_num()
         if self.config.tiling_parameters.enable_tiling:
             async_requests_num = 1  # tiling has it's own async configuration
+        model_file, weight_file = get_ir_model_data(self.model)
         args = [
             _hparams,
             self.task_environment.label_schema,
-            self.model.get_data("openvino.xml"),
-            self.model.get_data("openvino.bin"),
+            model_file,
+            weight_file,
             "CPU",
             async_requests_num,
         ]
@@ -578,10 +561,12 @@ class OpenVINODetectionTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IO
         update_progress_callback = default_progress_callback
         process_saliency_maps = False
         explain_predicted_classes = True
+        prediction_store = None
         if explain_parameters is not None:
             update_progress_callback = explain_parameters.update_progress  # type: ignore
             process_saliency_maps = explain_parameters.process_saliency_maps
             explain_predicted_classes = explain_parameters.explain_predicted_classes
+            prediction_store = explain_parameters.prediction_store
 
         dataset_size = len(dataset)
         for i, dataset_item in enumerate(dataset, 1):
@@ -612,6 +597,7 @@ class OpenVINODetectionTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IO
                 predicted_scored_labels=predicted_scored_labels,
                 explain_predicted_classes=explain_predicted_classes,
                 process_saliency_maps=process_saliency_maps,
+                prediction_store=prediction_store,
             )
         logger.info("OpenVINO explain completed")
         return dataset
@@ -699,15 +685,15 @@ class OpenVINODetectionTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IO
             raise RuntimeError("Optimize failed, model is None")
 
         dataset = dataset.get_subset(Subset.TRAINING)
-        data_loader = OTXOpenVinoDataLoader(dataset, self.inferencer)
+        data_loader = CalibrationDataLoader(
+            dataset,
+            self.inferencer,
+            self.hparams.pot_parameters.stat_subset_size,
+            cache_dir=get_cache_dir("calibration"),
+        )
 
         with tempfile.TemporaryDirectory() as tempdir:
-            xml_path = os.path.join(tempdir, "model.xml")
-            bin_path = os.path.join(tempdir, "model.bin")
-            with open(xml_path, "wb") as f:
-                f.write(self.model.get_data("openvino.xml"))
-            with open(bin_path, "wb") as f:
-                f.write(self.model.get_data("openvino.bin"))
+            xml_path, bin_path = get_ir_model_paths(self.model, tempdir)
 
             model_config = ADDict({"model_name": "openvino_model", "model": xml_path, "weights": bin_path})
 
@@ -728,7 +714,6 @@ class OpenVINODetectionTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IO
             }
         )
 
-        stat_subset_size = self.hparams.pot_parameters.stat_subset_size
         preset = self.hparams.pot_parameters.preset.name.lower()
 
         algorithms = [
@@ -737,8 +722,8 @@ class OpenVINODetectionTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IO
                 "params": {
                     "target_device": "ANY",
                     "preset": preset,
-                    "stat_subset_size": min(stat_subset_size, len(data_loader)),
-                    "shuffle_data": True,
+                    "stat_subset_size": len(data_loader),
+                    "shuffle_data": False,
                 },
             }
         ]
@@ -17,7 +17,8 @@
 import io
 import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterable, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -63,12 +64,14 @@ from otx.api.entities.shapes.polygon import Point, Polygon
 from otx.api.entities.shapes.rectangle import Rectangle
 from otx.api.entities.subset import Subset
 from otx.api.entities.task_environment import TaskEnvironment
-from otx.api.entities.tensor import TensorEntity
 from otx.api.entities.train_parameters import TrainParameters, default_progress_callback
 from otx.api.serialization.label_mapper import label_schema_to_bytes
 from otx.api.usecases.evaluation.metrics_helper import MetricsHelper
 from otx.api.usecases.tasks.interfaces.export_interface import ExportType
-from otx.api.utils.dataset_utils import add_saliency_maps_to_dataset_item
+from otx.api.utils.dataset_utils import (
+    add_feature_vector_to_dataset_item,
+    add_saliency_maps_to_dataset_item,
+)
 from otx.cli.utils.multi_gpu import is_multigpu_child_process
 
 logger = get_logger()
@@ -257,12 +260,14 @@ class OTXDetectionTask(OTXTask, ABC):
         logger.info("infer()")
         process_saliency_maps = False
         explain_predicted_classes = True
+        prediction_store = None
 
         update_progress_callback = default_progress_callback
         if inference_parameters is not None:
             update_progress_callback = inference_parameters.update_progress  # type: ignore
             process_saliency_maps = inference_parameters.process_saliency_maps
             explain_predicted_classes = inference_parameters.explain_predicted_classes
+            prediction_store = inference_parameters.prediction_store
 
         self._time_monitor = InferenceProgressCallback(len(dataset), update_progress_callback)
         # If confidence threshold is adaptive then up-to-date value should be stored in the model
@@ -275,7 +280,12 @@ class OTXDetectionTask(OTXTask, ABC):
         prediction_results, _ = self._infer_model(dataset, inference_parameters)
 
         self._add_predictions_to_dataset(
-            prediction_results, dataset, self.confidence_threshold, process_saliency_maps, explain_predicted_classes
+            prediction_results,
+            dataset,
+            self.confidence_threshold,
+            process_saliency_maps,
+            explain_predicted_classes,
+            prediction_store,
         )
         logger.info("Inference completed")
         return dataset
@@ -369,10 +379,12 @@ class OTXDetectionTask(OTXTask, ABC):
         update_progress_callback = default_progress_callback
         process_saliency_maps = False
         explain_predicted_classes = True
+        prediction_store = None
         if explain_parameters is not None:
             update_progress_callback = explain_parameters.update_progress  # type: ignore
             process_saliency_maps = explain_parameters.process_saliency_maps
             explain_predicted_classes = explain_parameters.explain_predicted_classes
+            prediction_store = explain_parameters.prediction_store
 
         self._time_monitor = InferenceProgressCallback(len(dataset), update_progress_callback)
 
@@ -381,7 +393,7 @@ class OTXDetectionTask(OTXTask, ABC):
         explain_results = outputs["saliency_maps"]
 
         self._add_explanations_to_dataset(
-            detections, explain_results, dataset, process_saliency_maps, explain_predicted_classes
+            detections, explain_results, dataset, process_saliency_maps, explain_predicted_classes, prediction_store
         )
         logger.info("Explain completed")
         return dataset
@@ -413,15 +425,23 @@ class OTXDetectionTask(OTXTask, ABC):
         confidence_threshold=0.0,
         process_saliency_maps=False,
         explain_predicted_classes=True,
+        prediction_store=None,
     ):
         """Loop over dataset again to assign predictions. Convert from MMDetection format to OTX format."""
-        for dataset_item, (all_results, feature_vector, saliency_map) in zip(dataset, prediction_results):
-            shapes = self._get_shapes(all_results, dataset_item.width, dataset_item.height, confidence_threshold)
+        dataset_items = list(dataset)
+        prediction_results = list(prediction_results)
+        all_shapes = self._get_shapes_of_items(
+            [all_results for all_results, _, _ in prediction_results], dataset_items, confidence_threshold
+        )
+        for dataset_item, shapes, (_, feature_vector, saliency_map) in zip(
+            dataset_items, all_shapes, prediction_results
+        ):
             dataset_item.append_annotations(shapes)
 
             if feature_vector is not None:
-                active_score = TensorEntity(name="representation_vector", numpy=feature_vector.reshape(-1))
-                dataset_item.append_metadata_item(active_score, model=self._task_environment.model)
+                add_feature_vector_to_dataset_item(
+                    dataset_item, feature_vector, self._task_environment.model, prediction_store
+                )
 
             if saliency_map is not None:
                 labels = self._labels.copy()
@@ -441,8 +461,23 @@ class OTXDetectionTask(OTXTask, ABC):
                     predicted_scored_labels=predicted_scored_labels,
                     explain_predicted_classes=explain_predicted_classes,
                     process_saliency_maps=process_saliency_maps,
+                    prediction_store=prediction_store,
                 )
 
+    def _get_shapes_of_items(self, all_results_list, dataset_items, confidence_threshold):
+        """Convert predictions of several items, extracting contours of the items in parallel threads."""
+
+        def get_shapes(args):
+            all_results, dataset_item = args
+            return self._get_shapes(all_results, dataset_item.width, dataset_item.height, confidence_threshold)
+
+        num_workers = min(len(dataset_items), os.cpu_count() or 1, 8)
+        if self._task_type == TaskType.DETECTION or num_workers <= 1:
+            # box conversion only builds entities, which doesn't benefit from threads holding the GIL
+            return [get_shapes(args) for args in zip(all_results_list, dataset_items)]
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            return list(executor.map(get_shapes, zip(all_results_list, dataset_items)))
+
     def _get_shapes(self, all_results, width, height, confidence_threshold):
         if self._task_type == TaskType.DETECTION:
             shapes = self._det_add_predictions_to_dataset(all_results, width, height, confidence_threshold)
@@ -456,44 +491,67 @@ class OTXDetectionTask(OTXTask, ABC):
         return shapes
 
     def _det_add_predictions_to_dataset(self, all_results, width, height, confidence_threshold):
-        shapes = []
-        for label_idx, detections in enumerate(all_results):
-            for i in range(detections.shape[0]):
-                probability = float(detections[i, 4])
-                coords = detections[i, :4].astype(float).copy()
-                coords /= np.array([width, height, width, height], dtype=float)
-                coords = np.clip(coords, 0, 1)
-
-                if probability < confidence_threshold:
-                    continue
+        detections = [np.asarray(result, dtype=float).reshape(-1, 5) for result in all_results]
+        if not detections:
+            return []
+        label_indices = np.concatenate([np.full(len(result), i) for i, result in enumerate(detections)])
+        detections = np.concatenate(detections)
+
+        coords = np.clip(detections[:, :4] / np.array([width, height, width, height], dtype=float), 0, 1)
+        probabilities = detections[:, 4]
+        keep = ~(probabilities < confidence_threshold)
+        keep &= ~(coords[:, 3] - coords[:, 1] <= 0) & ~(coords[:, 2] - coords[:, 0] <= 0)
+
+        return [
+            Annotation(
+                Rectangle(x1=x1, y1=y1, x2=x2, y2=y2),
+                labels=[ScoredLabel(self._labels[label_idx], probability=probability)],
+            )
+            for (x1, y1, x2, y2), probability, label_idx in zip(
+                coords[keep].tolist(), probabilities[keep].tolist(), label_indices[keep].tolist()
+            )
+        ]
 
-                assigned_label = [ScoredLabel(self._labels[label_idx], probability=probability)]
-                if coords[3] - coords[1] <= 0 or coords[2] - coords[0] <= 0:
-                    continue
+    @staticmethod
+    def _crop_mask(mask) -> Optional[Tuple[np.ndarray, Tuple[int, int]]]:
+        """Crop a binary or RLE mask to the bounding box of its foreground.
 
-                shapes.append(
-                    Annotation(
-                        Rectangle(x1=coords[0], y1=coords[1], x2=coords[2], y2=coords[3]),
-                        labels=assigned_label,
-                    )
-                )
-        return shapes
+        Returns:
+            Optional[Tuple[np.ndarray, Tuple[int, int]]]: uint8 crop and its (x, y) offset in the image,
+                None if the mask is empty.
+        """
+        if isinstance(mask, dict):
+            if mask_util.area(mask) == 0:
+                return None
+            x, y, w, h = (int(v) for v in mask_util.toBbox(mask))
+            mask = mask_util.decode(mask)
+            return mask[y : y + h, x : x + w].astype(np.uint8), (x, y)
+        rows = np.flatnonzero(mask.any(axis=1))
+        if rows.size == 0:
+            return None
+        cols = np.flatnonzero(mask[rows[0] : rows[-1] + 1].any(axis=0))
+        x, y = int(cols[0]), int(rows[0])
+        return mask[y : rows[-1] + 1, x : cols[-1] + 1].astype(np.uint8), (x, y)
 
     def _ins_seg_add_predictions_to_dataset(self, all_results, width, height, confidence_threshold):
         shapes = []
         for label_idx, (boxes, masks) in enumerate(zip(*all_results)):
             for mask, probability in zip(masks, boxes[:, 4]):
-                if isinstance(mask, dict):
-                    mask = mask_util.decode(mask)
-                mask = mask.astype(np.uint8)
                 probability = float(probability)
-                contours, hierarchies = cv2.findContours(mask, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE)
+                if probability < confidence_threshold:
+                    continue
+                cropped = self._crop_mask(mask)
+                if cropped is None:
+                    continue
+                # contours of the foreground crop are shifted back to image coordinates by the offset
+                mask, offset = cropped
+                contours, hierarchies = cv2.findContours(mask, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE, offset=offset)
                 if hierarchies is None:
                     continue
                 for contour, hierarchy in zip(contours, hierarchies[0]):
                     if hierarchy[3] != -1:
                         continue
-                    if len(contour) <= 2 or probability < confidence_threshold:
+                    if len(contour) <= 2:
                         continue
                     if self._task_type == TaskType.INSTANCE_SEGMENTATION:
                         points = [Point(x=point[0][0] / (width - 1), y=point[0][1] / (height - 1)) for point in contour]
@@ -507,7 +565,13 @@ class OTXDetectionTask(OTXTask, ABC):
         return shapes
 
     def _add_explanations_to_dataset(
-        self, detections, explain_results, dataset, process_saliency_maps, explain_predicted_classes
+        self,
+        detections,
+        explain_results,
+        dataset,
+        process_saliency_maps,
+        explain_predicted_classes,
+        prediction_store=None,
     ):
         """Add saliency map to the dataset."""
         for dataset_item, detection, saliency_map in zip(dataset, detections, explain_results):
@@ -529,6 +593,7 @@ class OTXDetectionTask(OTXTask, ABC):
                 predicted_scored_labels=predicted_scored_labels,
                 explain_predicted_classes=explain_predicted_classes,
                 process_saliency_maps=process_saliency_maps,
+                prediction_store=prediction_store,
             )
 
     @staticmethod
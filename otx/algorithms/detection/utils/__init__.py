@@ -17,7 +17,9 @@
 from .data import (
     format_list_to_str,
     get_anchor_boxes,
+    get_dataset_profile,
     get_sizes_from_dataset_entity,
+    get_sizes_from_profile,
     load_dataset_items_coco_format,
 )
 from .utils import generate_label_schema, get_det_model_api_configuration
@@ -26,6 +28,8 @@ __all__ = [
     "get_det_model_api_configuration",
     "load_dataset_items_coco_format",
     "get_sizes_from_dataset_entity",
+    "get_dataset_profile",
+    "get_sizes_from_profile",
     "get_anchor_boxes",
     "format_list_to_str",
     "generate_label_schema",
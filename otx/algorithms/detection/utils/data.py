@@ -14,17 +14,18 @@
 # See the License for the specific language governing permissions
 # and limitations under the License.
 
+import hashlib
 import json
 import math
+import os
 import os.path as osp
-from typing import Any, Dict, List, Optional, Sequence
+import tempfile
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 from mmdet.datasets.api_wrappers.coco_api import COCO
 
-from otx.algorithms.detection.adapters.mmdet.datasets.dataset import (
-    get_annotation_mmdet_format,
-)
+from otx.algorithms.common.utils.logger import get_logger
 from otx.algorithms.detection.configs.base.configuration import DetectionConfig
 from otx.api.entities.annotation import (
     Annotation,
@@ -41,6 +42,11 @@ from otx.api.entities.shapes.polygon import Point, Polygon
 from otx.api.entities.shapes.rectangle import Rectangle
 from otx.api.entities.subset import Subset
 from otx.api.utils.shape_factory import ShapeFactory
+from otx.core.file import evict_cache, get_cache_dir
+
+logger = get_logger()
+
+DATASET_PROFILE_CACHE_SIZE = 64 * 1024**2
 
 
 # pylint: disable=too-many-instance-attributes, too-many-arguments
@@ -412,12 +418,156 @@ def get_sizes_from_dataset_entity(dataset: DatasetEntity, target_wh: List[int]):
     return wh_stats
 
 
-def get_anchor_boxes(wh_stats: List[tuple], group_as: List[int]):
-    """Get anchor box widths & heights."""
-    from sklearn.cluster import KMeans
+def _get_dataset_fingerprint(dataset: DatasetEntity, domain: Domain, num_bins: int) -> str:
+    """Hash of media, image sizes, ROI and annotations of the dataset items used as a key of the profile cache."""
+    fingerprint = hashlib.sha1(f"{domain.name}:{num_bins}:{len(dataset)}".encode())
+    for item in dataset:
+        media_path = getattr(item.media, "path", None)
+        media_key = media_path or str(getattr(item, "id_", ""))
+        if media_path is not None and osp.exists(media_path):
+            stat = os.stat(media_path)
+            media_key += f":{stat.st_size}:{stat.st_mtime_ns}"
+        fingerprint.update(f"{media_key}:{item.width}:{item.height}".encode())
+        shapes = [item.roi.shape] + [annotation.shape for annotation in item.annotation_scene.annotations]
+        coords: List[float] = []
+        for shape in shapes:
+            points = getattr(shape, "points", None)
+            if points is not None:
+                coords.extend(p for point in points for p in (point.x, point.y))
+            else:
+                coords.extend((shape.x1, shape.y1, shape.x2, shape.y2))
+            coords.append(-1.0)
+        fingerprint.update(np.asarray(coords, dtype=np.float64).tobytes())
+        label_ids = [
+            str(label.id_) for annotation in item.annotation_scene.annotations for label in annotation.get_labels()
+        ]
+        fingerprint.update(",".join(label_ids).encode())
+    return fingerprint.hexdigest()
+
+
+def get_dataset_profile(
+    dataset: DatasetEntity,
+    domain: Optional[Domain] = None,
+    cache_dir: Optional[str] = None,
+    num_bins: int = 256,
+) -> Dict[str, np.ndarray]:
+    """Collect box and image size statistics of a dataset in one pass.
+
+    The profile is compact regardless of the number of boxes, so it can be cached on disk keyed
+    by the dataset fingerprint and reused by the following runs on unchanged data. The cache keeps
+    the most recent profiles up to DATASET_PROFILE_CACHE_SIZE bytes.
 
-    kmeans = KMeans(init="k-means++", n_clusters=sum(group_as), random_state=0).fit(wh_stats)
-    centers = kmeans.cluster_centers_
+    Args:
+        dataset (DatasetEntity): Dataset to profile
+        domain (Domain, optional): Domain of the labels to count. Defaults to the domain of the first label.
+        cache_dir (str, optional): Directory to cache profiles. Defaults to None, disabling caching.
+        num_bins (int): Number of log-scale bins per axis of the relative box size histogram.
+
+    Returns:
+        Dict[str, np.ndarray]: profile with
+            num_boxes, area_min, area_max, area_sum: statistics of box areas in pixels,
+            box_count_hist: histogram of the number of boxes per image,
+            image_wh_min, image_wh_max, image_wh_sum: statistics of image sizes,
+            wh_bin_edges, wh_hist: 2D histogram of box width and height relative to the image size.
+    """
+    labels = dataset.get_labels(include_empty=False)
+    if domain is None:
+        domain = labels[0].domain if labels else Domain.DETECTION
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = osp.join(cache_dir, f"{_get_dataset_fingerprint(dataset, domain, num_bins)}.npz")
+        if osp.exists(cache_path):
+            with np.load(cache_path) as cached:
+                return dict(cached)
+
+    label_names = {label.name for label in labels}
+    areas: List[float] = []
+    relative_wh: List[Tuple[float, float]] = []
+    box_counts: List[int] = []
+    image_wh: List[Tuple[int, int]] = []
+    for item in dataset:
+        width, height = item.width, item.height
+        image_wh.append((width, height))
+        num_boxes = 0
+        for annotation in item.get_annotations(include_empty=False):
+            n = sum(
+                1
+                for label in annotation.get_labels(include_empty=False)
+                if label.domain == domain and label.name in label_names
+            )
+            if n == 0:
+                continue
+            box = ShapeFactory.shape_as_rectangle(annotation.shape)
+            areas.extend([box.width * width * box.height * height] * n)
+            relative_wh.append((box.width, box.height))
+            num_boxes += n
+        box_counts.append(num_boxes)
+
+    area_array = np.asarray(areas, dtype=np.float64)
+    wh_array = np.asarray(relative_wh, dtype=np.float64).reshape(-1, 2)
+    image_wh_array = np.asarray(image_wh, dtype=np.float64).reshape(-1, 2)
+    wh_bin_edges = np.logspace(-4, 0, num_bins + 1)
+    wh_hist, _, _ = np.histogram2d(
+        np.clip(wh_array[:, 0], wh_bin_edges[0], wh_bin_edges[-1]),
+        np.clip(wh_array[:, 1], wh_bin_edges[0], wh_bin_edges[-1]),
+        bins=[wh_bin_edges, wh_bin_edges],
+    )
+    profile = dict(
+        num_boxes=np.asarray(len(area_array)),
+        area_min=np.asarray(area_array.min() if len(area_array) else 0.0),
+        area_max=np.asarray(area_array.max() if len(area_array) else 0.0),
+        area_sum=np.asarray(area_array.sum()),
+        box_count_hist=np.bincount(np.asarray(box_counts, dtype=np.int64), minlength=1),
+        image_wh_min=image_wh_array.min(axis=0) if len(image_wh_array) else np.zeros(2),
+        image_wh_max=image_wh_array.max(axis=0) if len(image_wh_array) else np.zeros(2),
+        image_wh_sum=image_wh_array.sum(axis=0),
+        wh_bin_edges=wh_bin_edges,
+        wh_hist=wh_hist.astype(np.int64),
+    )
+
+    if cache_path is not None:
+        os.makedirs(cache_dir, exist_ok=True)  # type: ignore[arg-type]
+        with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".tmp", delete=False) as f:
+            np.savez_compressed(f, **profile)
+        os.replace(f.name, cache_path)
+        evict_cache(cache_dir, DATASET_PROFILE_CACHE_SIZE)  # type: ignore[arg-type]
+    return profile
+
+
+def get_sizes_from_profile(profile: Dict[str, np.ndarray], target_wh: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Get box sizes resized to the target size and their counts from the dataset profile.
+
+    :param profile: Dataset profile from get_dataset_profile
+    :param target_wh: target width and height of the dataset
+    :return tuple: array of box widths and heights at the bin centers and the number of boxes in each bin
+    """
+    edges = profile["wh_bin_edges"]
+    centers = np.sqrt(edges[:-1] * edges[1:])
+    w_idx, h_idx = np.nonzero(profile["wh_hist"])
+    wh_stats = np.stack([centers[w_idx] * target_wh[0], centers[h_idx] * target_wh[1]], axis=1)
+    return wh_stats, profile["wh_hist"][w_idx, h_idx]
+
+
+def get_anchor_boxes(
+    wh_stats: Union[np.ndarray, Sequence[Tuple[float, float]]],
+    group_as: List[int],
+    weights: Optional[Union[np.ndarray, Sequence[float]]] = None,
+    batch_threshold: int = 100000,
+):
+    """Get anchor box widths & heights.
+
+    Points can be weighted, e.g. with histogram counts from the dataset profile.
+    Mini-batch k-means is used if there are more than batch_threshold points.
+    """
+    from sklearn.cluster import KMeans, MiniBatchKMeans
+
+    n_clusters = sum(group_as)
+    if len(wh_stats) > batch_threshold:
+        kmeans = MiniBatchKMeans(init="k-means++", n_clusters=n_clusters, random_state=0, batch_size=4096, n_init=3)
+    else:
+        kmeans = KMeans(init="k-means++", n_clusters=n_clusters, random_state=0)
+    centers = kmeans.fit(wh_stats, sample_weight=weights).cluster_centers_
 
     areas = np.sqrt(np.prod(centers, axis=1))
     idx = np.argsort(areas)
@@ -459,24 +609,17 @@ def adaptive_tile_params(
     """
     assert rule in ["min", "avg"], f"Unknown rule: {rule}"
 
-    bboxes = np.zeros((0, 4), dtype=np.float32)
-    labels = dataset.get_labels(include_empty=False)
-    domain = labels[0].domain
-    max_object = 0
-    for dataset_item in dataset:
-        result = get_annotation_mmdet_format(dataset_item, labels, domain)
-        if len(result["bboxes"]):
-            bboxes = np.concatenate((bboxes, result["bboxes"]), 0)
-            if len(result["bboxes"]) > max_object:
-                max_object = len(result["bboxes"])
-
-    areas = (bboxes[:, 2] - bboxes[:, 0]) * (bboxes[:, 3] - bboxes[:, 1])
+    profile = get_dataset_profile(dataset, cache_dir=get_cache_dir("dataset_profile"))
+    if int(profile["num_boxes"]) == 0:
+        logger.warning("There are no objects in the dataset. Adaptive tile parameters were skipped.")
+        return
+    max_object = len(profile["box_count_hist"]) - 1
 
     if rule == "min":
-        object_area = np.min(areas)
+        object_area = float(profile["area_min"])
     elif rule == "avg":
-        object_area = np.mean(areas)
-    max_area = np.max(areas)
+        object_area = float(profile["area_sum"]) / int(profile["num_boxes"])
+    max_area = float(profile["area_max"])
 
     tile_size = int(math.sqrt(object_area / object_tile_ratio))
     tile_overlap = max_area / (tile_size**2)
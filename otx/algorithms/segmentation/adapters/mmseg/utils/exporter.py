@@ -10,6 +10,7 @@ from otx.algorithms.common.adapters.mmcv.tasks.exporter import Exporter
 from otx.algorithms.common.adapters.mmdeploy.utils import sync_batchnorm_2_batchnorm
 from otx.algorithms.common.utils.logger import get_logger
 from otx.algorithms.segmentation.adapters.mmseg.utils.builder import build_segmentor
+from otx.core.file import get_cache_dir
 
 logger = get_logger()
 
@@ -70,4 +71,5 @@ class SegmentationExporter(Exporter):
             output_names=["output"],
             opset_version=opset_version,
             export_type=export_type,
+            cache_dir=get_cache_dir("export"),
         )
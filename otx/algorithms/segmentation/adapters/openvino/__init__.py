@@ -3,6 +3,6 @@
 # Copyright (C) 2022 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
-from .task import OpenVINOSegmentationInferencer, OpenVINOSegmentationTask, OTXOpenVinoDataLoader
+from .task import OpenVINOSegmentationInferencer, OpenVINOSegmentationTask
 
-__all__ = ["OpenVINOSegmentationTask", "OpenVINOSegmentationInferencer", "OTXOpenVinoDataLoader"]
+__all__ = ["OpenVINOSegmentationTask", "OpenVINOSegmentationInferencer"]
@@ -25,7 +25,6 @@ from zipfile import ZipFile
 import attr
 import numpy as np
 from addict import Dict as ADDict
-from compression.api import DataLoader
 from compression.engines.ie_engine import IEEngine
 from compression.graph import load_model, save_model
 from compression.graph.model_utils import compress_model_weights, get_nodes_by_type
@@ -33,6 +32,8 @@ from compression.pipeline.initializer import create_pipeline
 from openvino.model_zoo.model_api.adapters import OpenvinoAdapter, create_core
 from openvino.model_zoo.model_api.models import Model
 
+from otx.algorithms.common.utils.calibration import CalibrationDataLoader
+from otx.algorithms.common.utils.ir import get_ir_model_data, get_ir_model_paths
 from otx.algorithms.common.utils.logger import get_logger
 from otx.algorithms.common.utils.utils import get_default_async_reqs_num
 from otx.algorithms.segmentation.adapters.openvino import model_wrappers
@@ -74,6 +75,7 @@ from otx.api.usecases.tasks.interfaces.optimization_interface import (
     IOptimizationTask,
     OptimizationType,
 )
+from otx.core.file import get_cache_dir
 
 logger = get_logger()
 
@@ -174,26 +176,6 @@ class OpenVINOSegmentationInferencer(BaseInferencer):
             self.callback_exceptions.append(e)
 
 
-class OTXOpenVinoDataLoader(DataLoader):
-    """Data loader for OTXDetection using OpenVINO backend."""
-
-    def __init__(self, dataset: DatasetEntity, inferencer: BaseInferencer):
-        self.dataset = dataset
-        self.inferencer = inferencer
-
-    def __getitem__(self, index: int):
-        """Return dataset item from index."""
-        image = self.dataset[index].numpy
-        annotation = self.dataset[index].annotation_scene
-        inputs, metadata = self.inferencer.pre_process(image)
-
-        return (index, annotation), inputs, metadata
-
-    def __len__(self):
-        """Length of OTXOpenVinoDataLoader."""
-        return len(self.dataset)
-
-
 class OpenVINOSegmentationTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IOptimizationTask):
     """Task implementation for Segmentation using OpenVINO backend."""
 
@@ -217,11 +199,12 @@ class OpenVINOSegmentationTask(IDeploymentTask, IInferenceTask, IEvaluationTask,
         """load_inferencer function of OpenVINO Segmentation Task."""
         if self.model is None:
             raise RuntimeError("load_inferencer failed, model is None")
+        model_file, weight_file = get_ir_model_data(self.model)
         return OpenVINOSegmentationInferencer(
             self.hparams,
             self.task_environment.label_schema,
-            self.model.get_data("openvino.xml"),
-            self.model.get_data("openvino.bin"),
+            model_file,
+            weight_file,
             num_requests=get_default_async_reqs_num(),
         )
 
@@ -349,15 +332,15 @@ class OpenVINOSegmentationTask(IDeploymentTask, IInferenceTask, IEvaluationTask,
             raise ValueError("POT is the only supported optimization type for OpenVino models")
 
         dataset = dataset.get_subset(Subset.TRAINING)
-        data_loader = OTXOpenVinoDataLoader(dataset, self.inferencer)
+        data_loader = CalibrationDataLoader(
+            dataset,
+            self.inferencer,
+            self.hparams.pot_parameters.stat_subset_size,
+            cache_dir=get_cache_dir("calibration"),
+        )
 
         with tempfile.TemporaryDirectory() as tempdir:
-            xml_path = os.path.join(tempdir, "model.xml")
-            bin_path = os.path.join(tempdir, "model.bin")
-            with open(xml_path, "wb") as f:
-                f.write(self.model.get_data("openvino.xml"))
-            with open(bin_path, "wb") as f:
-                f.write(self.model.get_data("openvino.bin"))
+            xml_path, bin_path = get_ir_model_paths(self.model, tempdir)
 
             model_config = ADDict({"model_name": "openvino_model", "model": xml_path, "weights": bin_path})
 
@@ -378,8 +361,8 @@ class OpenVINOSegmentationTask(IDeploymentTask, IInferenceTask, IEvaluationTask,
         else:
             algorithms = [ADDict({"name": "DefaultQuantization", "params": {"target_device": "ANY"}})]
         for algo in algorithms:
-            algo.params.stat_subset_size = self.hparams.pot_parameters.stat_subset_size
-            algo.params.shuffle_data = True
+            algo.params.stat_subset_size = len(data_loader)
+            algo.params.shuffle_data = False
             if "Quantization" in algo["name"]:
                 algo.params.preset = self.hparams.pot_parameters.preset.name.lower()
 
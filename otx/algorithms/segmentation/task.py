@@ -17,7 +17,9 @@
 import io
 import os
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, List, Optional, Tuple
 
 import numpy as np
 import torch
@@ -38,6 +40,8 @@ from otx.algorithms.segmentation.configs.base import SegmentationConfig
 from otx.algorithms.segmentation.utils.metadata import get_seg_model_api_configuration
 from otx.api.configuration import cfg_helper
 from otx.api.configuration.helper.utils import ids_to_strings
+from otx.api.entities.annotation import Annotation
+from otx.api.entities.dataset_item import DatasetItemEntity
 from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.explain_parameters import ExplainParameters
 from otx.api.entities.inference_parameters import InferenceParameters
@@ -58,14 +62,15 @@ from otx.api.entities.model import (
     ModelEntity,
     ModelPrecision,
 )
-from otx.api.entities.result_media import ResultMediaEntity
+from otx.api.entities.prediction_store import PredictionStore, StoredResultMediaEntity
+from otx.api.entities.result_media import LazyResultMediaEntity, ResultMediaEntity
 from otx.api.entities.resultset import ResultSetEntity
 from otx.api.entities.task_environment import TaskEnvironment
-from otx.api.entities.tensor import TensorEntity
 from otx.api.entities.train_parameters import TrainParameters, default_progress_callback
 from otx.api.serialization.label_mapper import label_schema_to_bytes
 from otx.api.usecases.evaluation.metrics_helper import MetricsHelper
 from otx.api.usecases.tasks.interfaces.export_interface import ExportType
+from otx.api.utils.dataset_utils import add_feature_vector_to_dataset_item
 from otx.api.utils.segmentation_utils import (
     create_annotation_from_segmentation_map,
     create_hard_prediction_from_soft_prediction,
@@ -134,14 +139,18 @@ class OTXSegmentationTask(OTXTask, ABC):
             is_evaluation = False
 
         update_progress_callback = default_progress_callback
+        prediction_store = None
         if inference_parameters is not None:
             update_progress_callback = inference_parameters.update_progress  # type: ignore
+            prediction_store = inference_parameters.prediction_store
 
         self._time_monitor = InferenceProgressCallback(len(dataset), update_progress_callback)
 
         predictions = self._infer_model(dataset, InferenceParameters(is_evaluation=True))
         prediction_results = zip(predictions["eval_predictions"], predictions["feature_vectors"])
-        self._add_predictions_to_dataset(prediction_results, dataset, dump_soft_prediction=not is_evaluation)
+        self._add_predictions_to_dataset(
+            prediction_results, dataset, dump_soft_prediction=not is_evaluation, prediction_store=prediction_store
+        )
 
         logger.info("Inference completed")
         return dataset
@@ -271,41 +280,93 @@ class OTXSegmentationTask(OTXTask, ABC):
         output_resultset.performance = metric.get_performance()
         logger.info("Evaluation completed")
 
-    def _add_predictions_to_dataset(self, prediction_results, dataset, dump_soft_prediction):
-        """Loop over dataset again to assign predictions. Convert from MMSegmentation format to OTX format."""
-        for dataset_item, (prediction, feature_vector) in zip(dataset, prediction_results):
-            soft_prediction = np.transpose(prediction[0], axes=(1, 2, 0))
-            hard_prediction = create_hard_prediction_from_soft_prediction(
-                soft_prediction=soft_prediction,
-                soft_threshold=self._hyperparams.postprocessing.soft_threshold,
-                blur_strength=self._hyperparams.postprocessing.blur_strength,
-            )
-            annotations = create_annotation_from_segmentation_map(
-                hard_prediction=hard_prediction,
-                soft_prediction=soft_prediction,
-                label_map=self._label_dictionary,
+    def _add_predictions_to_dataset(self, prediction_results, dataset, dump_soft_prediction, prediction_store=None):
+        """Loop over dataset again to assign predictions. Convert from MMSegmentation format to OTX format.
+
+        Predictions are post-processed by a pool of threads, with a bounded number of them in flight.
+        Soft predictions are dumped as uint8 maps per class, turned into activation maps only when they are read.
+        If prediction_store is given, feature vectors and soft predictions are kept there.
+        """
+        num_workers = min(os.cpu_count() or 1, 8)
+        with ThreadPoolExecutor(max_workers=num_workers) as pool:
+            pending: Deque[Tuple[DatasetItemEntity, Future, Optional[np.ndarray]]] = deque()
+            for dataset_item, (prediction, feature_vector) in zip(dataset, prediction_results):
+                future = pool.submit(self._post_process_prediction, prediction[0], dump_soft_prediction)
+                pending.append((dataset_item, future, feature_vector))
+                if len(pending) > 2 * num_workers:
+                    self._add_prediction_to_dataset_item(*pending.popleft(), prediction_store)
+            while pending:
+                self._add_prediction_to_dataset_item(*pending.popleft(), prediction_store)
+
+    def _post_process_prediction(
+        self, prediction: np.ndarray, dump_soft_prediction: bool
+    ) -> Tuple[List[Annotation], Optional[np.ndarray]]:
+        """Create annotations from a soft prediction of shape (num_classes, H, W) and compact it to uint8."""
+        soft_prediction = np.transpose(prediction, axes=(1, 2, 0))
+        hard_prediction = create_hard_prediction_from_soft_prediction(
+            soft_prediction=soft_prediction,
+            soft_threshold=self._hyperparams.postprocessing.soft_threshold,
+            blur_strength=self._hyperparams.postprocessing.blur_strength,
+        )
+        annotations = create_annotation_from_segmentation_map(
+            hard_prediction=hard_prediction,
+            soft_prediction=soft_prediction,
+            label_map=self._label_dictionary,
+        )
+        compact_soft_prediction = None
+        if dump_soft_prediction:
+            compact_soft_prediction = np.rint(np.clip(prediction, 0.0, 1.0) * 255).astype(np.uint8)
+        return annotations, compact_soft_prediction
+
+    def _add_prediction_to_dataset_item(
+        self,
+        dataset_item: DatasetItemEntity,
+        future: Future,
+        feature_vector: Optional[np.ndarray],
+        prediction_store: Optional[PredictionStore] = None,
+    ):
+        annotations, compact_soft_prediction = future.result()
+        dataset_item.append_annotations(annotations=annotations)
+
+        if feature_vector is not None:
+            add_feature_vector_to_dataset_item(
+                dataset_item, feature_vector, self._task_environment.model, prediction_store
             )
-            dataset_item.append_annotations(annotations=annotations)
-
-            if feature_vector is not None:
-                active_score = TensorEntity(name="representation_vector", numpy=feature_vector.reshape(-1))
-                dataset_item.append_metadata_item(active_score, model=self._task_environment.model)
-
-            if dump_soft_prediction:
-                for label_index, label in self._label_dictionary.items():
-                    if label_index == 0:
-                        continue
-                    current_label_soft_prediction = soft_prediction[:, :, label_index]
-                    class_act_map = get_activation_map(current_label_soft_prediction)
-                    result_media = ResultMediaEntity(
+
+        if compact_soft_prediction is not None:
+            height, width = compact_soft_prediction.shape[1:]
+            key = None if prediction_store is None else prediction_store.add_saliency_map(compact_soft_prediction)
+            for label_index, label in self._label_dictionary.items():
+                if label_index == 0:
+                    continue
+                result_media: ResultMediaEntity
+                if key is None:
+                    result_media = LazyResultMediaEntity(
+                        name=label.name,
+                        type="soft_prediction",
+                        label=label,
+                        annotation_scene=dataset_item.annotation_scene,
+                        roi=dataset_item.roi,
+                        numpy=compact_soft_prediction[label_index],
+                        process=get_activation_map,
+                        width=width,
+                        height=height,
+                    )
+                else:
+                    result_media = StoredResultMediaEntity(
                         name=label.name,
                         type="soft_prediction",
                         label=label,
                         annotation_scene=dataset_item.annotation_scene,
                         roi=dataset_item.roi,
-                        numpy=class_act_map,
+                        store=prediction_store.saliency_maps,  # type: ignore[union-attr]
+                        key=key,
+                        index=label_index,
+                        process=get_activation_map,
+                        width=width,
+                        height=height,
                     )
-                    dataset_item.append_metadata_item(result_media, model=self._task_environment.model)
+                dataset_item.append_metadata_item(result_media, model=self._task_environment.model)
 
     def save_model(self, output_model: ModelEntity):
         """Save best model weights in SegmentationTrainTask."""
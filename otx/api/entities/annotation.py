@@ -26,6 +26,8 @@ class Annotation(metaclass=abc.ABCMeta):
         id (Optional[ID]): the id of the annotation
     """
 
+    __slots__ = ["__id_", "__shape", "__labels"]
+
     # pylint: disable=redefined-builtin;
     def __init__(self, shape: ShapeEntity, labels: List[ScoredLabel], id: Optional[ID] = None):
         self.__id_ = ID(ObjectId()) if id is None else id
@@ -0,0 +1,694 @@
+"""This module implements the columnar backend of the Dataset entity."""
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+# pylint: disable=too-many-arguments, too-many-instance-attributes
+
+import copy
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from otx.api.entities.annotation import (
+    Annotation,
+    AnnotationSceneEntity,
+    AnnotationSceneKind,
+)
+from otx.api.entities.dataset_item import DatasetItemEntity
+from otx.api.entities.datasets import DatasetEntity, DatasetPurpose
+from otx.api.entities.id import ID
+from otx.api.entities.label import LabelEntity
+from otx.api.entities.media import IMedia2DEntity
+from otx.api.entities.metadata import MetadataItemEntity
+from otx.api.entities.scored_label import ScoredLabel
+from otx.api.entities.shapes.ellipse import Ellipse
+from otx.api.entities.shapes.polygon import Point, Polygon
+from otx.api.entities.shapes.rectangle import Rectangle
+from otx.api.entities.shapes.shape import ShapeEntity, ShapeType
+from otx.api.entities.subset import Subset
+from otx.api.utils.time_utils import now
+
+_READ_ONLY_MESSAGE = (
+    "Items of a ColumnarDatasetEntity are read-only views of its columns. "
+    "Edit a regular dataset instead, e.g. DatasetEntity(items=list(columnar_dataset))."
+)
+
+
+def _gather_ranges(offsets: np.ndarray, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the flat element indices of the ranges ``offsets[i]:offsets[i + 1]`` and the offsets of the result.
+
+    Args:
+        offsets (np.ndarray): Offsets of the ranges, of size (number of ranges + 1).
+        indices (np.ndarray): Indices of the ranges to gather.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: flat element indices and offsets of the gathered ranges.
+    """
+    starts = offsets[indices]
+    lengths = offsets[indices + 1] - starts
+    new_offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=new_offsets[1:])
+    flat_indices = np.arange(new_offsets[-1], dtype=np.int64) - np.repeat(new_offsets[:-1] - starts, lengths)
+    return flat_indices, new_offsets
+
+
+def _offsets_from_lengths(lengths: Sequence[int]) -> np.ndarray:
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+class ColumnarAnnotations:
+    """Annotations of a sequence of dataset items stored as contiguous arrays.
+
+    Annotation ``j`` of item ``i`` is stored at row ``item_offsets[i] + j``. Each row has a shape type and the
+    bounding box of its shape. Polygon points and scored labels of row ``k`` are the ranges
+    ``point_offsets[k]:point_offsets[k + 1]`` and ``label_offsets[k]:label_offsets[k + 1]`` of the point and label
+    buffers. Label indices refer to the ``labels`` table.
+
+    Only the geometry and the scored labels are kept. Annotation ids, shape modification dates and label sources
+    are not stored, so the entities built by :meth:`annotation` get ids derived from the row index and the
+    creation date of the columns as modification date.
+
+    Args:
+        labels (List[LabelEntity]): Label table.
+        item_offsets (np.ndarray): int64 offsets of the annotations of each item, of size (number of items + 1).
+        shape_types (np.ndarray): uint8 :class:`ShapeType` of each annotation.
+        boxes (np.ndarray): float32 (x1, y1, x2, y2) of each annotation, the bounding box for polygons.
+        point_offsets (np.ndarray): int64 offsets of the polygon points of each annotation.
+        points (np.ndarray): float32 (x, y) polygon points.
+        label_offsets (np.ndarray): int64 offsets of the scored labels of each annotation.
+        label_indices (np.ndarray): int32 index in the label table of each scored label.
+        probabilities (np.ndarray): float32 probability of each scored label.
+    """
+
+    def __init__(
+        self,
+        labels: List[LabelEntity],
+        item_offsets: np.ndarray,
+        shape_types: np.ndarray,
+        boxes: np.ndarray,
+        point_offsets: np.ndarray,
+        points: np.ndarray,
+        label_offsets: np.ndarray,
+        label_indices: np.ndarray,
+        probabilities: np.ndarray,
+    ):
+        self.labels = labels
+        self.item_offsets = item_offsets
+        self.shape_types = shape_types
+        self.boxes = boxes
+        self.point_offsets = point_offsets
+        self.points = points
+        self.label_offsets = label_offsets
+        self.label_indices = label_indices
+        self.probabilities = probabilities
+        self.creation_date = now()
+
+    @classmethod
+    def from_annotation_lists(cls, annotation_lists: Iterable[Sequence[Annotation]]) -> "ColumnarAnnotations":
+        """Encodes the annotations of each item into columns.
+
+        Args:
+            annotation_lists (Iterable[Sequence[Annotation]]): Annotations of each item.
+
+        Raises:
+            TypeError: if a shape is not a Rectangle, Ellipse or Polygon.
+
+        Returns:
+            ColumnarAnnotations: encoded annotations.
+        """
+        labels: List[LabelEntity] = []
+        label_table: Dict[LabelEntity, int] = {}
+        item_lengths: List[int] = []
+        shape_types: List[int] = []
+        boxes: List[Tuple[float, float, float, float]] = []
+        point_lengths: List[int] = []
+        points: List[Tuple[float, float]] = []
+        label_lengths: List[int] = []
+        label_indices: List[int] = []
+        probabilities: List[float] = []
+
+        for annotations in annotation_lists:
+            item_lengths.append(len(annotations))
+            for annotation in annotations:
+                shape = annotation.shape
+                if isinstance(shape, Polygon):
+                    shape_points = [(point.x, point.y) for point in shape.points]
+                    points.extend(shape_points)
+                    point_lengths.append(len(shape_points))
+                    boxes.append((shape.min_x, shape.min_y, shape.max_x, shape.max_y))
+                elif isinstance(shape, (Rectangle, Ellipse)):
+                    point_lengths.append(0)
+                    boxes.append((shape.x1, shape.y1, shape.x2, shape.y2))
+                else:
+                    raise TypeError(f"Shape of type {type(shape).__name__} cannot be stored in columns")
+                shape_types.append(int(shape.type))
+
+                scored_labels = annotation.get_labels(include_empty=True)
+                label_lengths.append(len(scored_labels))
+                for scored_label in scored_labels:
+                    label = scored_label.get_label()
+                    if label not in label_table:
+                        label_table[label] = len(labels)
+                        labels.append(label)
+                    label_indices.append(label_table[label])
+                    probabilities.append(scored_label.probability)
+
+        return cls(
+            labels=labels,
+            item_offsets=_offsets_from_lengths(item_lengths),
+            shape_types=np.asarray(shape_types, dtype=np.uint8),
+            boxes=np.asarray(boxes, dtype=np.float32).reshape(-1, 4),
+            point_offsets=_offsets_from_lengths(point_lengths),
+            points=np.asarray(points, dtype=np.float32).reshape(-1, 2),
+            label_offsets=_offsets_from_lengths(label_lengths),
+            label_indices=np.asarray(label_indices, dtype=np.int32),
+            probabilities=np.asarray(probabilities, dtype=np.float32),
+        )
+
+    @classmethod
+    def concatenate(cls, columns: Sequence["ColumnarAnnotations"]) -> "ColumnarAnnotations":
+        """Concatenates the items of several columnar annotations, merging their label tables."""
+        labels: List[LabelEntity] = []
+        label_table: Dict[LabelEntity, int] = {}
+        label_indices = []
+        for column in columns:
+            remap = np.empty(len(column.labels), dtype=np.int32)
+            for i, label in enumerate(column.labels):
+                if label not in label_table:
+                    label_table[label] = len(labels)
+                    labels.append(label)
+                remap[i] = label_table[label]
+            label_indices.append(remap[column.label_indices])
+
+        def concatenate_offsets(offsets: List[np.ndarray]) -> np.ndarray:
+            bases = np.cumsum([0] + [offset[-1] for offset in offsets[:-1]])
+            return np.concatenate([[0]] + [offset[1:] + base for offset, base in zip(offsets, bases)]).astype(np.int64)
+
+        return cls(
+            labels=labels,
+            item_offsets=concatenate_offsets([column.item_offsets for column in columns]),
+            shape_types=np.concatenate([column.shape_types for column in columns]),
+            boxes=np.concatenate([column.boxes for column in columns]),
+            point_offsets=concatenate_offsets([column.point_offsets for column in columns]),
+            points=np.concatenate([column.points for column in columns]),
+            label_offsets=concatenate_offsets([column.label_offsets for column in columns]),
+            label_indices=np.concatenate(label_indices).astype(np.int32),
+            probabilities=np.concatenate([column.probabilities for column in columns]),
+        )
+
+    @property
+    def num_items(self) -> int:
+        """Returns the number of items."""
+        return len(self.item_offsets) - 1
+
+    def __len__(self) -> int:
+        """Returns the number of annotations."""
+        return len(self.shape_types)
+
+    def take(self, item_indices: np.ndarray) -> "ColumnarAnnotations":
+        """Returns the annotations of the given items, sharing the label table.
+
+        Args:
+            item_indices (np.ndarray): Indices of the items to take.
+
+        Returns:
+            ColumnarAnnotations: annotations of the given items.
+        """
+        rows, item_offsets = _gather_ranges(self.item_offsets, np.asarray(item_indices, dtype=np.int64))
+        point_rows, point_offsets = _gather_ranges(self.point_offsets, rows)
+        label_rows, label_offsets = _gather_ranges(self.label_offsets, rows)
+        return ColumnarAnnotations(
+            labels=self.labels,
+            item_offsets=item_offsets,
+            shape_types=self.shape_types[rows],
+            boxes=self.boxes[rows],
+            point_offsets=point_offsets,
+            points=self.points[point_rows],
+            label_offsets=label_offsets,
+            label_indices=self.label_indices[label_rows],
+            probabilities=self.probabilities[label_rows],
+        )
+
+    def get_label_counts(self, include_empty: bool = False) -> Dict[LabelEntity, int]:
+        """Returns the number of annotations of each label.
+
+        Args:
+            include_empty (bool): set to True to include empty labels in the output. Defaults to False.
+
+        Returns:
+            Dict[LabelEntity, int]: number of annotations having each label, for labels that appear at least once.
+        """
+        counts = np.bincount(self.label_indices, minlength=len(self.labels))
+        return {
+            label: int(count)
+            for label, count in zip(self.labels, counts)
+            if count > 0 and (include_empty or not label.is_empty)
+        }
+
+    def get_item_label_indices(self, item_index: int) -> List[int]:
+        """Returns the unique label indices of an item in order of appearance."""
+        start, end = self.label_offsets[self.item_offsets[[item_index, item_index + 1]]]
+        return list(dict.fromkeys(self.label_indices[start:end].tolist()))
+
+    def shape(self, row: int) -> ShapeEntity:
+        """Builds the shape entity of an annotation row."""
+        shape_type = self.shape_types[row]
+        if shape_type == ShapeType.POLYGON:
+            start, end = self.point_offsets[row], self.point_offsets[row + 1]
+            points = [Point(x=x, y=y) for x, y in self.points[start:end].tolist()]
+            return Polygon(points=points, modification_date=self.creation_date)
+        x1, y1, x2, y2 = self.boxes[row].tolist()
+        if shape_type == ShapeType.ELLIPSE:
+            return Ellipse(x1=x1, y1=y1, x2=x2, y2=y2, modification_date=self.creation_date)
+        return Rectangle(x1=x1, y1=y1, x2=x2, y2=y2, modification_date=self.creation_date)
+
+    def annotation(self, row: int) -> Annotation:
+        """Builds the annotation entity of an annotation row."""
+        start, end = self.label_offsets[row], self.label_offsets[row + 1]
+        scored_labels = [
+            ScoredLabel(self.labels[label_index], probability=probability)
+            for label_index, probability in zip(
+                self.label_indices[start:end].tolist(), self.probabilities[start:end].tolist()
+            )
+        ]
+        return Annotation(self.shape(row), labels=scored_labels, id=ID(f"{row:024x}"))
+
+
+class ColumnarAnnotationSceneEntity(AnnotationSceneEntity):
+    """Annotation scene of one item of :class:`ColumnarAnnotations`.
+
+    The annotation entities are only built when ``annotations`` is accessed. Labels are read from the columns
+    until then. The scene is read-only: the columns are not updated by edits, so setting or appending annotations
+    raises a TypeError and the list returned by ``annotations`` is a copy.
+
+    Args:
+        columns (ColumnarAnnotations): Columns holding the annotations.
+        item_index (int): Index of the item in the columns.
+        kind (AnnotationSceneKind): Kind of the annotation scene.
+    """
+
+    def __init__(self, columns: ColumnarAnnotations, item_index: int, kind: AnnotationSceneKind):
+        super().__init__(annotations=[], kind=kind)
+        self._columns = columns
+        self._item_index = item_index
+        self._built: Dict[int, Annotation] = {}
+        self._annotations: Optional[List[Annotation]] = None
+
+    def get_annotation(self, index: int) -> Annotation:
+        """Returns the annotation at an index of the scene, building only that annotation if needed."""
+        if self._annotations is not None:
+            return self._annotations[index]
+        if index not in self._built:
+            self._built[index] = self._columns.annotation(int(self._columns.item_offsets[self._item_index]) + index)
+        return self._built[index]
+
+    @property
+    def annotations(self) -> List[Annotation]:
+        """Return the Annotations that are present in the AnnotationSceneEntity."""
+        if self._annotations is None:
+            start, end = self._columns.item_offsets[[self._item_index, self._item_index + 1]]
+            self._annotations = [self.get_annotation(i) for i in range(end - start)]
+            self._built = {}
+        return list(self._annotations)
+
+    @annotations.setter
+    def annotations(self, value: List[Annotation]):
+        raise TypeError(_READ_ONLY_MESSAGE)
+
+    @property
+    def kind(self) -> AnnotationSceneKind:
+        """Returns the AnnotationSceneKind of the AnnotationSceneEntity."""
+        return AnnotationSceneEntity.kind.fget(self)  # type: ignore[attr-defined]
+
+    @kind.setter
+    def kind(self, value) -> None:
+        raise TypeError(_READ_ONLY_MESSAGE)
+
+    def append_annotation(self, annotation: Annotation) -> None:
+        """Raises a TypeError since the scene is read-only."""
+        raise TypeError(_READ_ONLY_MESSAGE)
+
+    def append_annotations(self, annotations: List[Annotation]) -> None:
+        """Raises a TypeError since the scene is read-only."""
+        raise TypeError(_READ_ONLY_MESSAGE)
+
+    def __eq__(self, other: object) -> bool:
+        """Returns True if both scenes are views of the same item."""
+        if not isinstance(other, ColumnarAnnotationSceneEntity):
+            return False
+        return self._columns is other._columns and self._item_index == other._item_index and self.kind == other.kind
+
+    def __hash__(self):
+        """Returns hash of the annotation scene."""
+        return id(self)
+
+    def get_labels(self, include_empty: bool = False) -> List[LabelEntity]:
+        """Returns a list of unique labels which appear in this annotation scene."""
+        labels = [self._columns.labels[i] for i in self._columns.get_item_label_indices(self._item_index)]
+        return [label for label in labels if include_empty or not label.is_empty]
+
+    def get_label_ids(self, include_empty: bool = False) -> Set[ID]:
+        """Returns a set of the ID's of unique labels which appear in this annotation scene."""
+        return {label.id_ for label in self.get_labels(include_empty)}
+
+
+class ColumnarDatasetItemEntity(DatasetItemEntity):
+    """Read-only view of an item of :class:`ColumnarDatasetEntity`.
+
+    Setting the annotation scene, ROI, subset or ignored labels raises a TypeError since the dataset would not be
+    updated. The metadata is shared with the dataset, so metadata items can be appended. :meth:`wrap` and copies
+    return a regular :class:`DatasetItemEntity`.
+    """
+
+    @property
+    def annotation_scene(self) -> AnnotationSceneEntity:
+        """Access to annotation scene."""
+        return DatasetItemEntity.annotation_scene.fget(self)  # type: ignore[attr-defined]
+
+    @annotation_scene.setter
+    def annotation_scene(self, value: AnnotationSceneEntity):
+        raise TypeError(_READ_ONLY_MESSAGE)
+
+    @property
+    def roi(self) -> Annotation:
+        """Region Of Interest."""
+        return DatasetItemEntity.roi.fget(self)  # type: ignore[attr-defined]
+
+    @roi.setter
+    def roi(self, roi: Optional[Annotation]):
+        raise TypeError(_READ_ONLY_MESSAGE)
+
+    @property
+    def subset(self) -> Subset:
+        """Returns the subset that the IDatasetItem belongs to. e.g. Subset.TRAINING."""
+        return DatasetItemEntity.subset.fget(self)  # type: ignore[attr-defined]
+
+    @subset.setter
+    def subset(self, value: Subset):
+        raise TypeError(_READ_ONLY_MESSAGE)
+
+    @property
+    def ignored_labels(self) -> Set[LabelEntity]:
+        """Get the IDs of the labels to ignore in this dataset item."""
+        return DatasetItemEntity.ignored_labels.fget(self)  # type: ignore[attr-defined]
+
+    @ignored_labels.setter
+    def ignored_labels(self, value: Union[List[LabelEntity], Tuple[LabelEntity, ...], Set[LabelEntity]]):
+        raise TypeError(_READ_ONLY_MESSAGE)
+
+    def wrap(self, **kwargs) -> DatasetItemEntity:  # type: ignore[override]
+        """Creates a new DatasetItemEntity, overriding only the given arguments to the existing ones for this view."""
+        params = dict(
+            media=self.media,
+            annotation_scene=self.annotation_scene,
+            roi=self.roi,
+            metadata=self.get_metadata(),
+            subset=self.subset,
+            ignored_labels=self.ignored_labels,
+        )
+        params.update(**kwargs)
+        return DatasetItemEntity(**params)
+
+    def __deepcopy__(self, memo):
+        """Returns a deep copy of the view as a regular DatasetItemEntity, sharing the annotation scene."""
+        return copy.deepcopy(self.wrap(), memo)
+
+
+class ColumnarDatasetEntity(DatasetEntity):
+    """Dataset whose annotations are stored in :class:`ColumnarAnnotations` instead of per-item entities.
+
+    Items are served as lightweight :class:`DatasetItemEntity` views built on access, so holding a large dataset
+    doesn't cost one set of Python objects per shape and label. Bulk queries such as :meth:`get_subset`,
+    :meth:`get_labels` and :meth:`get_label_counts` operate on the arrays.
+
+    The views are read-only: setting the annotation scene, ROI, subset or ignored labels of an item raises a
+    TypeError, as does appending annotations to its scene, while its metadata is shared with the dataset. Edits to
+    the annotation list or the annotation entities returned by a scene are not stored either. Use the dataset methods
+    to add or remove items, and add predictions as usual to the regular dataset returned by
+    :meth:`with_empty_annotations`.
+
+    >>> dataset = ColumnarDatasetEntity.from_dataset(dataset)
+    >>> training_subset = dataset.get_subset(Subset.TRAINING)
+
+    Args:
+        media (List[IMedia2DEntity]): Media of each item.
+        annotations (ColumnarAnnotations): Annotations of the items.
+        subsets (np.ndarray): int8 :class:`Subset` value of each item.
+        kinds (np.ndarray): int8 :class:`AnnotationSceneKind` value of the annotation scene of each item.
+        roi_indices (np.ndarray): int32 index in the item annotations of the annotation used as ROI,
+            -1 for a full box ROI without labels.
+        purpose (DatasetPurpose): Purpose for dataset. Defaults to DatasetPurpose.INFERENCE.
+        rois (Optional[Dict[int, Annotation]]): ROIs of the items whose ROI is not one of their annotations.
+        metadata (Optional[Dict[int, List[MetadataItemEntity]]]): Metadata of the items which have any.
+        ignored_labels (Optional[Dict[int, Set[LabelEntity]]]): Ignored labels of the items which have any.
+    """
+
+    def __init__(
+        self,
+        media: List[IMedia2DEntity],
+        annotations: ColumnarAnnotations,
+        subsets: np.ndarray,
+        kinds: np.ndarray,
+        roi_indices: np.ndarray,
+        purpose: DatasetPurpose = DatasetPurpose.INFERENCE,
+        rois: Optional[Dict[int, Annotation]] = None,
+        metadata: Optional[Dict[int, List[MetadataItemEntity]]] = None,
+        ignored_labels: Optional[Dict[int, Set[LabelEntity]]] = None,
+    ):
+        super().__init__(purpose=purpose)
+        if annotations.num_items != len(media):
+            raise ValueError(f"Annotations of {annotations.num_items} items were given for {len(media)} media")
+        self._media = media
+        self._annotations = annotations
+        self._subsets = subsets
+        self._kinds = kinds
+        self._roi_indices = roi_indices
+        self._rois = {} if rois is None else rois
+        self._metadata = {} if metadata is None else metadata
+        self._ignored_labels = {} if ignored_labels is None else ignored_labels
+
+    @classmethod
+    def from_items(
+        cls, items: Sequence[DatasetItemEntity], purpose: DatasetPurpose = DatasetPurpose.INFERENCE
+    ) -> "ColumnarDatasetEntity":
+        """Encodes dataset items into a columnar dataset.
+
+        Args:
+            items (Sequence[DatasetItemEntity]): Items to encode.
+            purpose (DatasetPurpose): Purpose for dataset. Defaults to DatasetPurpose.INFERENCE.
+
+        Returns:
+            ColumnarDatasetEntity: columnar dataset with the items.
+        """
+        roi_indices = np.full(len(items), -1, dtype=np.int32)
+        rois: Dict[int, Annotation] = {}
+        for i, item in enumerate(items):
+            if item.media is None:
+                raise ValueError("Media in dataset item cannot be None")
+            roi = item.roi
+            for j, annotation in enumerate(item.annotation_scene.annotations):
+                if annotation is roi:
+                    roi_indices[i] = j
+                    break
+            else:
+                if not Rectangle.is_full_box(roi.shape) or roi.get_labels(include_empty=True):
+                    rois[i] = roi
+
+        return cls(
+            media=[item.media for item in items],
+            annotations=ColumnarAnnotations.from_annotation_lists(item.annotation_scene.annotations for item in items),
+            subsets=np.fromiter((item.subset.value for item in items), dtype=np.int8, count=len(items)),
+            kinds=np.fromiter((item.annotation_scene.kind.value for item in items), dtype=np.int8, count=len(items)),
+            roi_indices=roi_indices,
+            purpose=purpose,
+            rois=rois,
+            metadata={i: item.get_metadata() for i, item in enumerate(items) if item.get_metadata()},
+            ignored_labels={i: item.ignored_labels for i, item in enumerate(items) if item.ignored_labels},
+        )
+
+    @classmethod
+    def from_dataset(cls, dataset: DatasetEntity) -> "ColumnarDatasetEntity":
+        """Encodes a dataset into a columnar dataset with the same purpose."""
+        if isinstance(dataset, ColumnarDatasetEntity):
+            return dataset
+        return cls.from_items(list(dataset), purpose=dataset.purpose)
+
+    @property
+    def annotations(self) -> ColumnarAnnotations:
+        """Returns the columnar annotations of the dataset."""
+        return self._annotations
+
+    def _take(self, indices: np.ndarray) -> "ColumnarDatasetEntity":
+        """Returns a new columnar dataset with the items at the given unique indices."""
+        indices = np.asarray(indices, dtype=np.int64)
+        inverse = np.full(len(self), -1, dtype=np.int64)
+        inverse[indices] = np.arange(len(indices))
+
+        def take_sparse(values: dict) -> dict:
+            return {int(inverse[i]): value for i, value in values.items() if inverse[i] >= 0}
+
+        return ColumnarDatasetEntity(
+            media=[self._media[i] for i in indices.tolist()],
+            annotations=self._annotations.take(indices),
+            subsets=self._subsets[indices],
+            kinds=self._kinds[indices],
+            roi_indices=self._roi_indices[indices],
+            purpose=self.purpose,
+            rois=take_sparse(self._rois),
+            metadata=take_sparse(self._metadata),
+            ignored_labels=take_sparse(self._ignored_labels),
+        )
+
+    def _get_item(self, index: int) -> DatasetItemEntity:
+        """Builds the view of the item at the given non-negative index."""
+        annotation_scene = ColumnarAnnotationSceneEntity(
+            self._annotations, index, kind=AnnotationSceneKind(int(self._kinds[index]))
+        )
+        roi = self._rois.get(index)
+        if roi is None:
+            roi_index = int(self._roi_indices[index])
+            if roi_index >= 0:
+                roi = annotation_scene.get_annotation(roi_index)
+            else:
+                full_box = Rectangle(x1=0.0, y1=0.0, x2=1.0, y2=1.0, modification_date=self._annotations.creation_date)
+                roi = Annotation(full_box, labels=[], id=ID(f"roi_{index}"))
+        return ColumnarDatasetItemEntity(
+            media=self._media[index],
+            annotation_scene=annotation_scene,
+            roi=roi,
+            metadata=self._metadata.setdefault(index, []),
+            subset=Subset(int(self._subsets[index])),
+            ignored_labels=self._ignored_labels.get(index),
+        )
+
+    def _fetch(self, key: Union[slice, int]) -> Union[DatasetItemEntity, List[DatasetItemEntity]]:
+        """Fetch the given entity/entities from the items."""
+        if isinstance(key, list):
+            return [self._fetch(ii) for ii in key]  # type: ignore
+        if isinstance(key, slice):
+            return [self._get_item(ii) for ii in range(*key.indices(len(self)))]
+        if isinstance(key, (int, np.integer)):
+            return self._get_item(range(len(self))[key])
+        raise TypeError(
+            f"Instance of type `{type(key).__name__}` cannot be used to access Dataset items. "
+            f"Only slice and int are supported"
+        )
+
+    def __repr__(self):
+        """Returns string representation of the dataset."""
+        return f"{self.__class__.__name__}(items={list(self)}, purpose={self.purpose})"
+
+    def __len__(self):
+        """Returns the number of items in the dataset."""
+        return len(self._media)
+
+    def __add__(self, other: Union[DatasetEntity, List[DatasetItemEntity]]) -> DatasetEntity:
+        """Returns a new dataset which contains the items of self added with the input dataset.
+
+        The result is columnar if the input is a columnar dataset, otherwise a regular dataset of the item views.
+        """
+        if isinstance(other, ColumnarDatasetEntity):
+            return self._concatenate([self, other])
+        if isinstance(other, (DatasetEntity, list)):
+            return DatasetEntity(items=list(self), purpose=self.purpose) + other
+        raise ValueError(f"Cannot add other of type {type(other)}")
+
+    def _concatenate(self, datasets: Sequence["ColumnarDatasetEntity"]) -> "ColumnarDatasetEntity":
+        bases = np.cumsum([0] + [len(dataset) for dataset in datasets[:-1]]).tolist()
+
+        def concatenate_sparse(name: str) -> dict:
+            return {
+                base + i: value for dataset, base in zip(datasets, bases) for i, value in getattr(dataset, name).items()
+            }
+
+        return ColumnarDatasetEntity(
+            media=[media for dataset in datasets for media in dataset._media],
+            annotations=ColumnarAnnotations.concatenate([dataset._annotations for dataset in datasets]),
+            subsets=np.concatenate([dataset._subsets for dataset in datasets]),
+            kinds=np.concatenate([dataset._kinds for dataset in datasets]),
+            roi_indices=np.concatenate([dataset._roi_indices for dataset in datasets]),
+            purpose=self.purpose,
+            rois=concatenate_sparse("_rois"),
+            metadata=concatenate_sparse("_metadata"),
+            ignored_labels=concatenate_sparse("_ignored_labels"),
+        )
+
+    def _replace(self, other: "ColumnarDatasetEntity") -> None:
+        self._media = other._media
+        self._annotations = other._annotations
+        self._subsets = other._subsets
+        self._kinds = other._kinds
+        self._roi_indices = other._roi_indices
+        self._rois = other._rois
+        self._metadata = other._metadata
+        self._ignored_labels = other._ignored_labels
+        self._index = None
+
+    def get_subset(self, subset: Subset) -> "ColumnarDatasetEntity":
+        """Returns a new ColumnarDatasetEntity with just the dataset items matching the subset.
+
+        Args:
+            subset (Subset): `Subset` to return.
+
+        Returns:
+            ColumnarDatasetEntity: dataset with items matching subset
+        """
+        return self._take(np.flatnonzero(self._subsets == subset.value))
+
+    def remove(self, item: DatasetItemEntity) -> None:
+        """Remove an item equal to the input item.
+
+        Raises:
+            ValueError: if the input item is not in the dataset
+        """
+        for index, dataset_item in enumerate(self):
+            if dataset_item == item:
+                self.remove_at_indices([index])
+                return
+        raise ValueError("Item is not in the dataset")
+
+    def append(self, item: DatasetItemEntity) -> None:
+        """Append a DatasetItemEntity to the dataset, encoding its annotations.
+
+        Appending re-allocates the columns, so build the dataset with :meth:`from_items` when possible.
+        """
+        self._replace(self._concatenate([self, ColumnarDatasetEntity.from_items([item], purpose=self.purpose)]))
+
+    def remove_at_indices(self, indices: List[int]) -> None:
+        """Delete items based on the `indices`.
+
+        Args:
+            indices (List[int]): the indices of the items that will be deleted from the items.
+        """
+        keep = np.ones(len(self), dtype=bool)
+        keep[indices] = False
+        self._replace(self._take(np.flatnonzero(keep)))
+
+    def get_labels(self, include_empty: bool = False) -> List[LabelEntity]:
+        """Returns the list of all unique labels that are in the dataset.
+
+        Note: This does not respect the ROI of the dataset items.
+
+        Args:
+            include_empty (bool): set to True to include empty label (if exists) in the output. Defaults to False.
+
+        Returns:
+            List[LabelEntity]: list of labels that appear in the dataset
+        """
+        return list(self._annotations.get_label_counts(include_empty))
+
+    def get_label_counts(self, include_empty: bool = False) -> Dict[LabelEntity, int]:
+        """Returns the number of annotations of each label in the dataset.
+
+        Note: This does not respect the ROI of the dataset items.
+
+        Args:
+            include_empty (bool): set to True to include empty label (if exists) in the output. Defaults to False.
+
+        Returns:
+            Dict[LabelEntity, int]: number of annotations having each label that appears in the dataset
+        """
+        return self._annotations.get_label_counts(include_empty)
@@ -7,10 +7,22 @@
 
 import collections.abc
 import copy
-import itertools
 import logging
 from enum import Enum
-from typing import Generic, Iterator, List, Optional, TypeVar, Union, cast, overload
+from typing import (
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
 from bson.objectid import ObjectId
 
@@ -85,6 +97,32 @@ class DatasetIterator(collections.abc.Iterator):
 TDatasetItemEntity = TypeVar("TDatasetItemEntity", bound="DatasetItemEntity")
 
 
+class _DatasetIndex:
+    """Positions of the items of a dataset by subset, label and identity.
+
+    Args:
+        items (Iterable[DatasetItemEntity]): Items of the dataset, in order.
+    """
+
+    def __init__(self, items: Iterable[DatasetItemEntity]):
+        self.subsets: Dict[Subset, List[int]] = {}
+        self.labels: Dict[LabelEntity, List[int]] = {}
+        self.positions: Dict[int, int] = {}
+        self.size = 0
+        for item in items:
+            self.add(item)
+
+    def add(self, item: DatasetItemEntity) -> None:
+        """Adds an item after the indexed ones."""
+        position = self.size
+        self.subsets.setdefault(item.subset, []).append(position)
+        for label in item.annotation_scene.get_labels(include_empty=True):
+            self.labels.setdefault(label, []).append(position)
+        # the dataset holds its items, so their ids are unique while the index is valid
+        self.positions.setdefault(id(item), position)
+        self.size += 1
+
+
 class DatasetEntity(Generic[TDatasetItemEntity]):
     """A dataset consists of a list of DatasetItemEntities and a purpose.
 
@@ -141,6 +179,16 @@ class DatasetEntity(Generic[TDatasetItemEntity]):
         This subset is also a DatasetEntity. The entities in the subset dataset refer to the same entities as
         in the original dataset. Altering one of the objects in the subset, will also alter them in the original.
 
+    ## Index
+
+        :meth:`get_subset`, :meth:`get_labels`, :meth:`get_item_indices_with_labels` and :meth:`remove` use an index
+        of the items by subset, label and identity. It is built at the first query, extended by :meth:`append` and
+        dropped by :meth:`remove` and :meth:`remove_at_indices`. Changing the subset or the annotations of an item
+        which is already in the dataset is not tracked, so call :meth:`reindex` after such changes.
+
+        >>> dataset[0].annotation_scene.append_annotation(annotation)
+        >>> dataset.reindex()
+
     Args:
         items (Optional[List[DatasetItemEntity]]): A list of dataset items to create dataset with. Defaults to None.
         purpose (DatasetPurpose): Purpose for dataset. Refer to :class:`DatasetPurpose` for more info.
@@ -154,6 +202,7 @@ class DatasetEntity(Generic[TDatasetItemEntity]):
     ):
         self._items = [] if items is None else items
         self._purpose = purpose
+        self._index: Optional[_DatasetIndex] = None
 
     @property
     def purpose(self) -> DatasetPurpose:
@@ -350,7 +399,7 @@ class DatasetEntity(Generic[TDatasetItemEntity]):
             DatasetEntity: DatasetEntity with items matching subset
         """
         dataset = DatasetEntity(
-            items=[item for item in self._items if item.subset == subset],
+            items=[self._items[i] for i in self._get_index().subsets.get(subset, [])],
             purpose=self.purpose,
         )
         return dataset
@@ -366,7 +415,10 @@ class DatasetEntity(Generic[TDatasetItemEntity]):
         Raises:
             ValueError: if the input item is not in the dataset
         """
-        index = self._items.index(item)
+        index = self._get_index().positions.get(id(item))
+        if index is None:
+            # not in the dataset itself, but an equal item may be
+            index = self._items.index(item)
         self.remove_at_indices([index])
 
     def append(self, item: TDatasetItemEntity) -> None:
@@ -391,6 +443,8 @@ class DatasetEntity(Generic[TDatasetItemEntity]):
         if item.media is None:
             raise ValueError("Media in dataset item cannot be None")
         self._items.append(item)
+        if self._index is not None:
+            self._index.add(item)
 
     def sort_items(self) -> None:
         """Order the dataset items. Does nothing here, but may be overridden in child classes.
@@ -405,9 +459,20 @@ class DatasetEntity(Generic[TDatasetItemEntity]):
         Args:
             indices (List[int]): the indices of the items that will be deleted from the items.
         """
-        indices.sort(reverse=True)  # sort in descending order
-        for i_item in indices:
-            del self._items[i_item]
+        removed = {range(len(self._items))[i] for i in indices}
+        # keep the list object, which may be shared with the caller of the constructor
+        self._items[:] = [item for i, item in enumerate(self._items) if i not in removed]
+        self._index = None
+
+    def reindex(self) -> None:
+        """Rebuilds the index of the items, e.g. after changing the subset or the annotations of items in place."""
+        self._index = _DatasetIndex(self)
+
+    def _get_index(self) -> _DatasetIndex:
+        # the size also catches the items added to the list given to the constructor
+        if self._index is None or self._index.size != len(self):
+            self._index = _DatasetIndex(self)
+        return self._index
 
     def get_labels(self, include_empty: bool = False) -> List[LabelEntity]:
         """Returns the list of all unique labels that are in the dataset.
@@ -420,5 +485,28 @@ class DatasetEntity(Generic[TDatasetItemEntity]):
         Returns:
             List[LabelEntity]: list of labels that appear in the dataset
         """
-        label_set = set(itertools.chain(*[item.annotation_scene.get_labels(include_empty) for item in self]))
-        return list(label_set)
+        return [label for label in self._get_index().labels if include_empty or not label.is_empty]
+
+    def get_item_indices_with_labels(self, labels: Sequence[LabelEntity], include_empty: bool = False) -> List[int]:
+        """Returns the sorted indices of the items whose annotation scene contains any of the given labels.
+
+        Note: This does not respect the ROI of the dataset items, and uses the index of the dataset, see
+        :meth:`reindex`.
+
+        Example:
+            >>> dataset = DatasetEntity(items=[...])
+            >>> car_indices = dataset.get_item_indices_with_labels([car_label])
+
+        Args:
+            labels (Sequence[LabelEntity]): labels to look up.
+            include_empty (bool): set to True to also look up empty labels. Defaults to False.
+
+        Returns:
+            List[int]: indices of the items containing any of the labels
+        """
+        index = self._get_index()
+        positions: Set[int] = set()
+        for label in set(labels):
+            if include_empty or not label.is_empty:
+                positions.update(index.labels.get(label, []))
+        return sorted(positions)
@@ -7,6 +7,8 @@
 from dataclasses import dataclass
 from typing import Any, Callable, Optional
 
+from otx.api.entities.prediction_store import PredictionStore
+
 
 # pylint: disable=unused-argument
 def default_progress_callback(progress: int, score: Optional[float] = None):
@@ -24,6 +26,8 @@ class ExplainParameters:
             and (2) apply a colormap.
         explain_predicted_classes: Provides explanations only for predicted classes.
             Otherwise, explain all classes.
+        enable_async_inference: Enables async inference to increase performance.
+        prediction_store: If set, saliency maps are kept in this store and the dataset items only refer to them.
     """
 
     update_progress: Callable[[int, Optional[float]], Any] = default_progress_callback
@@ -31,3 +35,5 @@ class ExplainParameters:
     explainer: str = ""
     process_saliency_maps: bool = False
     explain_predicted_classes: bool = True
+    enable_async_inference: bool = True
+    prediction_store: Optional[PredictionStore] = None
@@ -26,6 +26,9 @@ class ID(str):
     # Since the str type is immutable, we cannot handle the object construction arguments in __init__
     # as we would normally and instead have to use __new__.
     # The __init__ function is still left for typing correctness and so that Sphinx can get the prototype of the class.
+    # Empty __slots__ keeps instances as small as the str they wrap, without a per-instance __dict__.
+
+    __slots__ = ()
 
     def __new__(cls, representation: Optional[Union[str, ObjectId]] = None):
         """Creates a new ID object."""
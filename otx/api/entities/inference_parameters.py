@@ -8,6 +8,8 @@
 from dataclasses import dataclass
 from typing import Any, Callable, Optional
 
+from otx.api.entities.prediction_store import PredictionStore
+
 
 # pylint: disable=unused-argument
 def default_progress_callback(progress: int, score: Optional[float] = None):
@@ -32,6 +34,8 @@ class InferenceParameters:
         explain_predicted_classes: If set to True, provide explanations only for predicted classes.
             Otherwise, explain all classes.
         enable_async_inference: Enables async inference to increase performance.
+        prediction_store: If set, feature vectors and saliency maps are kept in this store and the dataset items
+            only refer to them.
     """
 
     is_evaluation: bool = False
@@ -41,3 +45,4 @@ class InferenceParameters:
     process_saliency_maps: bool = False
     explain_predicted_classes: bool = True
     enable_async_inference: bool = True
+    prediction_store: Optional[PredictionStore] = None
@@ -0,0 +1,313 @@
+"""This module implements a columnar store of the feature vectors and saliency maps predicted for a dataset."""
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+# pylint: disable=too-many-arguments
+
+import os
+import os.path as osp
+import threading
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from otx.api.entities.annotation import Annotation, AnnotationSceneEntity
+from otx.api.entities.label import LabelEntity
+from otx.api.entities.result_media import LazyResultMediaEntity
+from otx.api.entities.tensor import TensorEntity
+
+
+class FeatureVectorStore:
+    """Feature vectors of a sequence of dataset items stored as rows of one contiguous matrix.
+
+    The matrix is allocated at the first vector, with ``capacity`` rows of its dimension. If ``path`` is given,
+    the matrix is a memory-mapped ``.npy`` file, so that the vectors do not stay in RAM. Rows which are never
+    appended are left as zeros in the file.
+
+    Args:
+        capacity (int): Maximum number of feature vectors, usually the number of dataset items.
+        path (Optional[str]): ``.npy`` file to memory-map the matrix to. Defaults to None, keeping it in memory.
+        dtype (np.dtype): Data type of the matrix. Defaults to float16.
+    """
+
+    def __init__(self, capacity: int, path: Optional[str] = None, dtype: np.dtype = np.float16):
+        self.capacity = capacity
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self._matrix: Optional[np.ndarray] = None
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of stored feature vectors."""
+        return self._size
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Returns the stored feature vectors as a (number of vectors, dimension) matrix."""
+        if self._matrix is None:
+            return np.empty((0, 0), dtype=self.dtype)
+        return self._matrix[: self._size]
+
+    def append(self, feature_vector: np.ndarray) -> int:
+        """Stores a feature vector and returns its row index."""
+        feature_vector = np.asarray(feature_vector).reshape(-1)
+        with self._lock:
+            if self._matrix is None:
+                shape = (self.capacity, feature_vector.size)
+                if self.path is None:
+                    self._matrix = np.zeros(shape, dtype=self.dtype)
+                else:
+                    os.makedirs(osp.dirname(osp.abspath(self.path)), exist_ok=True)
+                    self._matrix = np.lib.format.open_memmap(self.path, mode="w+", dtype=self.dtype, shape=shape)
+            if self._size == self.capacity:
+                raise IndexError(f"FeatureVectorStore is full with {self.capacity} feature vectors")
+            if feature_vector.size != self._matrix.shape[1]:
+                raise ValueError(
+                    f"Expected a feature vector of size {self._matrix.shape[1]}, but got {feature_vector.size}"
+                )
+            index = self._size
+            self._size += 1
+        self._matrix[index] = feature_vector
+        return index
+
+    def get(self, index: int) -> np.ndarray:
+        """Returns a float32 copy of the index-th feature vector."""
+        if not 0 <= index < self._size:
+            raise IndexError(f"Feature vector {index} is out of range of the {self._size} stored ones")
+        return self._matrix[index].astype(np.float32)  # type: ignore[index]
+
+    def flush(self):
+        """Writes the memory-mapped matrix to its file."""
+        if isinstance(self._matrix, np.memmap):
+            self._matrix.flush()
+
+
+class SaliencyMapStore:
+    """Saliency maps of a sequence of dataset items stored in chunks.
+
+    Consecutive saliency maps of the same shape and data type are stacked into chunks of up to ``chunk_bytes`` bytes,
+    a saliency map larger than that making a chunk on its own. If ``directory`` is given, each complete chunk is saved
+    to a ``.npy`` file and memory-mapped, so that only the chunk being filled stays in RAM. A saliency map is referred
+    to by the key returned by :meth:`append`.
+
+    Args:
+        directory (Optional[str]): Directory to save the chunks to. Defaults to None, keeping them in memory.
+        chunk_bytes (int): Maximum size of a chunk in bytes. Defaults to 64 MiB.
+    """
+
+    def __init__(self, directory: Optional[str] = None, chunk_bytes: int = 64 * 1024**2):
+        if chunk_bytes < 1:
+            raise ValueError(f"chunk_bytes should be positive, but got {chunk_bytes}")
+        self.directory = directory
+        self.chunk_bytes = chunk_bytes
+        self._chunks: List[np.ndarray] = []
+        self._buffer: Optional[np.ndarray] = None
+        self._buffer_size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of stored saliency maps."""
+        return sum(len(chunk) for chunk in self._chunks) + self._buffer_size
+
+    @property
+    def num_chunks(self) -> int:
+        """Returns the number of chunks, including the one being filled."""
+        return len(self._chunks) + int(self._buffer is not None)
+
+    def append(self, saliency_map: np.ndarray) -> Tuple[int, int]:
+        """Stores a saliency map and returns its key, i.e. the indices of its chunk and of its row in the chunk."""
+        saliency_map = np.asarray(saliency_map)
+        with self._lock:
+            buffer = self._buffer
+            if buffer is not None and (
+                self._buffer_size == len(buffer)
+                or buffer.shape[1:] != saliency_map.shape
+                or buffer.dtype != saliency_map.dtype
+            ):
+                self._seal()
+            if self._buffer is None:
+                num_rows = max(1, self.chunk_bytes // max(saliency_map.nbytes, 1))
+                self._buffer = np.empty((num_rows, *saliency_map.shape), dtype=saliency_map.dtype)
+            key = (len(self._chunks), self._buffer_size)
+            self._buffer[self._buffer_size] = saliency_map
+            self._buffer_size += 1
+        return key
+
+    def get(self, key: Tuple[int, int], index: Optional[int] = None) -> np.ndarray:
+        """Returns a copy of the saliency map of the given key, or of its index-th map if index is not None."""
+        chunk_index, row = key
+        chunk: Optional[np.ndarray] = None
+        with self._lock:
+            if 0 <= chunk_index < len(self._chunks):
+                chunk, size = self._chunks[chunk_index], len(self._chunks[chunk_index])
+            elif chunk_index == len(self._chunks) and self._buffer is not None:
+                chunk, size = self._buffer, self._buffer_size
+            if chunk is None or not 0 <= row < size:
+                raise IndexError(f"No saliency map is stored with key {key}")
+        return np.array(chunk[row] if index is None else chunk[row][index])
+
+    def flush(self):
+        """Completes the chunk being filled, saving it to its file if the store has a directory."""
+        with self._lock:
+            self._seal()
+
+    def _seal(self):
+        if self._buffer is None:
+            return
+        chunk = self._buffer[: self._buffer_size]
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+            path = osp.join(self.directory, f"chunk_{len(self._chunks):06d}.npy")
+            np.save(path, chunk)
+            chunk = np.load(path, mmap_mode="r")
+        elif self._buffer_size < len(self._buffer):
+            chunk = chunk.copy()
+        self._chunks.append(chunk)
+        self._buffer = None
+        self._buffer_size = 0
+
+
+class StoredTensorEntity(TensorEntity):
+    """Represents a tensor whose data is a row of a :class:`FeatureVectorStore`, read only when it is accessed.
+
+    Setting ``numpy`` stores the given data in the entity itself.
+
+    Args:
+        name (str): Name of metadata.
+        store (FeatureVectorStore): Store holding the data.
+        index (int): Row of the data in the store.
+    """
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, name: str, store: FeatureVectorStore, index: int):
+        self.name = name
+        self._store: Optional[FeatureVectorStore] = store
+        self._index = index
+        self._numpy: Optional[np.ndarray] = None
+
+    @property
+    def numpy(self) -> np.ndarray:
+        """Returns the numpy representation of the tensor."""
+        if self._store is not None:
+            return self._store.get(self._index)
+        if self._numpy is None:
+            raise ValueError(f"Tensor {self.name} has neither a store nor data")
+        return self._numpy
+
+    @numpy.setter
+    def numpy(self, value):
+        self._numpy = value
+        self._store = None
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Returns the shape of the tensor."""
+        return self.numpy.shape
+
+
+class StoredResultMediaEntity(LazyResultMediaEntity):
+    """Represents a result media whose raw data is read from a :class:`SaliencyMapStore` only when it is accessed.
+
+    Args:
+        name (str): Name.
+        type (str): The type of data (e.g. Attention map). This type is descriptive.
+        annotation_scene (AnnotationScene Entity): Associated annotation which was generated by the task
+                                alongside this media.
+        store (SaliencyMapStore): Store holding the raw data.
+        key (Tuple[int, int]): Key of the raw data in the store.
+        index (Optional[int]): If not None, the raw data is the index-th map of the stored array, e.g. the saliency
+            map of one class out of the class-wise saliency maps of an image. Defaults to None.
+        process (Optional[Callable[[np.ndarray], np.ndarray]]): Function generating the media from the raw data.
+            Defaults to None, returning the raw data.
+        width (int): Width of the generated media. Ignored if process is None.
+        height (int): Height of the generated media. Ignored if process is None.
+        roi (Optional[Annotation]): The ROI covered by this media. If null, assume the entire image. Defaults to None.
+        label (Optional[LabelEntity]): A label associated with this media. Defaults to None.
+    """
+
+    # pylint: disable=redefined-builtin, too-many-arguments;
+    def __init__(
+        self,
+        name: str,
+        type: str,
+        annotation_scene: AnnotationSceneEntity,
+        store: SaliencyMapStore,
+        key: Tuple[int, int],
+        index: Optional[int] = None,
+        process: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+        width: int = 0,
+        height: int = 0,
+        roi: Optional[Annotation] = None,
+        label: Optional[LabelEntity] = None,
+    ):
+        # The raw data stays in the store, so that no array is copied to the entity
+        super().__init__(name, type, annotation_scene, np.empty(0), process, width, height, roi=roi, label=label)
+        self._store: Optional[SaliencyMapStore] = store
+        self._key = key
+        self._index = index
+
+    @property
+    def raw_numpy(self) -> np.ndarray:
+        """Returns the data before processing."""
+        if self._store is None:
+            return self._numpy
+        return self._store.get(self._key, self._index)
+
+    @property
+    def numpy(self) -> np.ndarray:
+        """Returns the data, generated from the raw data unless it was set."""
+        return LazyResultMediaEntity.numpy.fget(self)  # type: ignore[attr-defined]
+
+    @numpy.setter
+    def numpy(self, value):
+        self._store = None
+        LazyResultMediaEntity.numpy.fset(self, value)  # type: ignore[attr-defined]
+
+
+class PredictionStore:
+    """Columnar store of the feature vectors and saliency maps predicted for a dataset.
+
+    Instead of one array per dataset item, feature vectors are rows of a single float16 matrix and saliency maps,
+    as well as other result maps such as soft predictions, are stacked into chunks. The metadata items attached to
+    the dataset items only refer to the store. If ``directory`` is given, the matrix and the chunks are files in this
+    directory, so that the predictions are streamed to disk and memory usage does not grow with the dataset size.
+
+    Args:
+        num_items (int): Number of dataset items, i.e. the maximum number of feature vectors.
+        directory (Optional[str]): Directory to save the predictions to. Defaults to None, keeping them in memory.
+        chunk_bytes (int): Maximum size of a chunk of saliency maps in bytes. Defaults to 64 MiB.
+        feature_dtype (np.dtype): Data type of the stored feature vectors. Defaults to float16.
+    """
+
+    def __init__(
+        self,
+        num_items: int,
+        directory: Optional[str] = None,
+        chunk_bytes: int = 64 * 1024**2,
+        feature_dtype: np.dtype = np.float16,
+    ):
+        self.directory = directory
+        self.feature_vectors = FeatureVectorStore(
+            num_items,
+            path=None if directory is None else osp.join(directory, "feature_vectors.npy"),
+            dtype=feature_dtype,
+        )
+        self.saliency_maps = SaliencyMapStore(
+            directory=None if directory is None else osp.join(directory, "saliency_maps"),
+            chunk_bytes=chunk_bytes,
+        )
+
+    def add_feature_vector(self, feature_vector: np.ndarray, name: str = "representation_vector") -> TensorEntity:
+        """Stores a feature vector and returns a tensor entity referring to it."""
+        return StoredTensorEntity(name, self.feature_vectors, self.feature_vectors.append(feature_vector))
+
+    def add_saliency_map(self, saliency_map: np.ndarray) -> Tuple[int, int]:
+        """Stores a saliency map and returns its key in the saliency map store."""
+        return self.saliency_maps.append(saliency_map)
+
+    def flush(self):
+        """Writes the pending feature vectors and saliency maps to the store directory."""
+        self.feature_vectors.flush()
+        self.saliency_maps.flush()
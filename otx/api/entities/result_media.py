@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
-from typing import Optional
+from typing import Callable, Optional
 
 import numpy as np
 
@@ -119,3 +119,70 @@ class ResultMediaEntity(IMetadata):
         if isinstance(other, ResultMediaEntity):
             return self.annotation_scene == other.annotation_scene and self.roi == other.roi
         return False
+
+
+class LazyResultMediaEntity(ResultMediaEntity):
+    """Represents a media which is generated from raw data only when it is accessed.
+
+    For instance, a saliency map is kept at the low resolution given by the model and upsampled to the image
+    resolution each time ``numpy`` is read, so that a dataset with many result media stays small in memory.
+    Setting ``numpy`` stores the given media as it is.
+
+    Args:
+        name (str): Name.
+        type (str): The type of data (e.g. Attention map). This type is descriptive.
+        annotation_scene (AnnotationScene Entity): Associated annotation which was generated by the task
+                                alongside this media.
+        numpy (np.ndarray): The raw data as a numpy array.
+        process (Optional[Callable[[np.ndarray], np.ndarray]]): Function generating the media from the raw data.
+            If None, the media is the raw data.
+        width (int): Width of the generated media. Ignored if process is None.
+        height (int): Height of the generated media. Ignored if process is None.
+        roi (Optional[Annotation]): The ROI covered by this media. If null, assume the entire image. Defaults to None.
+        label (Optional[LabelEntity]): A label associated with this media. Defaults to None.
+    """
+
+    # pylint: disable=redefined-builtin, too-many-arguments;
+    def __init__(
+        self,
+        name: str,
+        type: str,
+        annotation_scene: AnnotationSceneEntity,
+        numpy: np.ndarray,
+        process: Optional[Callable[[np.ndarray], np.ndarray]],
+        width: int,
+        height: int,
+        roi: Optional[Annotation] = None,
+        label: Optional[LabelEntity] = None,
+    ):
+        super().__init__(name, type, annotation_scene, numpy, roi=roi, label=label)
+        self._process: Optional[Callable[[np.ndarray], np.ndarray]] = process
+        self._width = width
+        self._height = height
+
+    @property
+    def width(self) -> int:
+        """Returns the width of the result media."""
+        return self._width if self._process is not None else self.raw_numpy.shape[1]
+
+    @property
+    def height(self) -> int:
+        """Returns the height of the result media."""
+        return self._height if self._process is not None else self.raw_numpy.shape[0]
+
+    @property
+    def raw_numpy(self) -> np.ndarray:
+        """Returns the data before processing."""
+        return self._numpy
+
+    @property
+    def numpy(self) -> np.ndarray:
+        """Returns the data, generated from the raw data unless it was set."""
+        if self._process is not None:
+            return self._process(self.raw_numpy)
+        return self.raw_numpy
+
+    @numpy.setter
+    def numpy(self, value):
+        self._numpy = value
+        self._process = None
@@ -4,6 +4,7 @@
 
 """This module define the scored label entity."""
 
+import copy
 import datetime
 import math
 from dataclasses import dataclass
@@ -29,6 +30,9 @@ class LabelSource:
     model_storage_id: ID = ID()
 
 
+_DEFAULT_LABEL_SOURCE = LabelSource()
+
+
 class ScoredLabel:
     """This represents a label along with a probability. This is used inside `Annotation` class.
 
@@ -39,6 +43,8 @@ class ScoredLabel:
             or the model that predicted this label.
     """
 
+    __slots__ = ["label", "probability", "_label_source"]
+
     def __init__(
         self,
         label: LabelEntity,
@@ -50,7 +56,19 @@ class ScoredLabel:
 
         self.label = label
         self.probability = probability
-        self.label_source = label_source if label_source is not None else LabelSource()
+        # the default source is only created when accessed, most predicted labels never need one
+        self._label_source = label_source
+
+    @property
+    def label_source(self) -> LabelSource:
+        """Source of the label."""
+        if self._label_source is None:
+            self._label_source = LabelSource()
+        return self._label_source
+
+    @label_source.setter
+    def label_source(self, value: LabelSource):
+        self._label_source = value
 
     @property
     def name(self) -> str:
@@ -96,6 +114,16 @@ class ScoredLabel:
         """Gets the label that the ScoredLabel object was initialized with."""
         return self.label
 
+    def __deepcopy__(self, memo):
+        """Copies the scored label while keeping the reference to the label entity.
+
+        Label entities come from the label schema and are compared by identity in several places,
+        so copies of annotations keep pointing at the same labels instead of duplicating them.
+        """
+        clone = ScoredLabel(self.label, self.probability, copy.deepcopy(self._label_source, memo))
+        memo[id(self)] = clone
+        return clone
+
     def __repr__(self):
         """String representation of the label."""
         return (
@@ -121,7 +149,7 @@ class ScoredLabel:
                 and self.hotkey == other.hotkey
                 and self.probability == other.probability
                 and self.domain == other.domain
-                and self.label_source == other.label_source
+                and (self._label_source or _DEFAULT_LABEL_SOURCE) == (other._label_source or _DEFAULT_LABEL_SOURCE)
             )
         return False
 
@@ -35,6 +35,8 @@ class Ellipse(Shape):
             modification_date: last modified date
     """
 
+    __slots__ = ["x1", "y1", "x2", "y2"]
+
     # pylint: disable=too-many-arguments; Requires refactor
     def __init__(
         self,
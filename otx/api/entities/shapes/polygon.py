@@ -88,6 +88,8 @@ class Polygon(Shape):
         modification_date: last modified date
     """
 
+    __slots__ = ["points", "min_x", "max_x", "min_y", "max_y"]
+
     # pylint: disable=too-many-arguments; Requires refactor
     def __init__(
         self,
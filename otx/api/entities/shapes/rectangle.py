@@ -38,6 +38,8 @@ class Rectangle(Shape):
         modification_date (datetime.datetime): Date of the last modification of the rectangle
     """
 
+    __slots__ = ["x1", "y1", "x2", "y2"]
+
     # pylint: disable=too-many-arguments; Requires refactor
     def __init__(
         self,
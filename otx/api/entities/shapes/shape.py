@@ -35,6 +35,8 @@ class ShapeEntity(metaclass=abc.ABCMeta):
     The shapes is a 2D geometric shape living in a normalized coordinate system (the values range from 0 to 1).
     """
 
+    __slots__ = ["_type"]
+
     # pylint: disable=redefined-builtin
     def __init__(self, shape_type: ShapeType):
         self._type = shape_type
@@ -123,6 +125,8 @@ class ShapeEntity(metaclass=abc.ABCMeta):
 class Shape(ShapeEntity):
     """Base class for Shape entities."""
 
+    __slots__ = ["modification_date"]
+
     # pylint: disable=redefined-builtin, too-many-arguments; Requires refactor
     def __init__(self, shape_type: ShapeType, modification_date: datetime.datetime):
         super().__init__(shape_type=shape_type)
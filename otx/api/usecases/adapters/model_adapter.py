@@ -4,7 +4,7 @@
 #
 
 import abc
-from typing import Union
+from typing import Optional, Union
 
 
 class IDataSource:
@@ -17,6 +17,40 @@ class IDataSource:
         raise NotImplementedError
 
 
+class FileDataSource(IDataSource):
+    """Data source which lazily reads its data from a file on disk.
+
+    The file content is not held in memory, ``data`` reads the file on each access.
+
+    Args:
+        path (str): Path to the file holding the data.
+    """
+
+    def __init__(self, path: str):
+        self._path = str(path)
+
+    @property
+    def path(self) -> str:
+        """Returns the path of the file."""
+        return self._path
+
+    @property
+    def data(self) -> bytes:
+        """Returns the content of the file."""
+        with open(self._path, "rb") as read_file:
+            return read_file.read()
+
+    def __eq__(self, other):
+        """Data sources are equal if they point to the same file."""
+        if isinstance(other, FileDataSource):
+            return self._path == other.path
+        return False
+
+    def __hash__(self):
+        """Returns the hash of the file path."""
+        return hash(self._path)
+
+
 class ModelAdapter(metaclass=abc.ABCMeta):
     """The ModelAdapter is an adapter is intended to lazily fetch its binary data from a given data source."""
 
@@ -41,6 +75,13 @@ class ModelAdapter(metaclass=abc.ABCMeta):
             return self.__data_source
         raise ValueError("This model adapter is not properly initialized with a source of data")
 
+    @property
+    def file_path(self) -> Optional[str]:
+        """Returns the path of the file holding the data if the adapter is backed by a file, otherwise None."""
+        if isinstance(self.__data_source, FileDataSource):
+            return self.__data_source.path
+        return None
+
     @property
     def from_file_storage(self) -> bool:
         """Returns if the ModelAdapters data comes from the file storage or not.
@@ -64,6 +64,19 @@ def build_argparser():
         default=False,
         action="store_true",
     )
+    args.add_argument(
+        "--decode_workers",
+        help="Optional. Number of threads decoding a folder of images ahead.",
+        default=0,
+        type=int,
+    )
+    args.add_argument(
+        "--reduce_factor",
+        help="Optional. Downscale input images by 1, 2, 4 or 8 while decoding.",
+        choices=[1, 2, 4, 8],
+        default=1,
+        type=int,
+    )
     args.add_argument(
         "--no_show",
         help="Optional. Disables showing inference results on UI.",
@@ -124,9 +137,16 @@ def main():
     if len(models) == 1:
         models = models[0]
 
+    # only pass the decoding options which are set, so that the executors of older otx versions keep working
+    streamer_kwargs = {}
+    if args.decode_workers:
+        streamer_kwargs["num_workers"] = args.decode_workers
+    if args.reduce_factor != 1:
+        streamer_kwargs["reduce_factor"] = args.reduce_factor
+
     # create inferencer and run
     demo = inferencer(models, visualizer)
-    demo.run(args.input, args.loop and not args.no_show)
+    demo.run(args.input, args.loop and not args.no_show, **streamer_kwargs)
 
 
 if __name__ == "__main__":
@@ -35,9 +35,9 @@ class AsyncExecutor:
         self.converter = create_output_converter(model.task_type, model.labels)
         self.async_pipeline = AsyncPipeline(self.model)
 
-    def run(self, input_stream: Union[int, str], loop: bool = False) -> None:
+    def run(self, input_stream: Union[int, str], loop: bool = False, **streamer_kwargs) -> None:
         """Async inference for input stream (image, video stream, camera)."""
-        streamer = get_streamer(input_stream, loop)
+        streamer = get_streamer(input_stream, loop, **streamer_kwargs)
         next_frame_id = 0
         next_frame_id_to_show = 0
         stop_visualization = False
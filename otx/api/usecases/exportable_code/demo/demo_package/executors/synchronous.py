@@ -30,9 +30,9 @@ class SyncExecutor:
         self.visualizer = visualizer
         self.converter = create_output_converter(model.task_type, model.labels)
 
-    def run(self, input_stream: Union[int, str], loop: bool = False) -> None:
+    def run(self, input_stream: Union[int, str], loop: bool = False, **streamer_kwargs) -> None:
         """Run demo using input stream (image, video stream, camera)."""
-        streamer = get_streamer(input_stream, loop)
+        streamer = get_streamer(input_stream, loop, **streamer_kwargs)
         saved_frames = []
 
         for frame in streamer:
@@ -6,17 +6,19 @@
 
 import abc
 import logging
-import multiprocessing
 import queue
+import threading
+import time
 import warnings
+from collections import deque
 from pathlib import Path
-from typing import Any, Iterator, List, Optional, Tuple, Union
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
 # pylint: disable=no-name-in-module
 from openvino.inference_engine import ExecutableNetwork, IECore, InferRequest
-from openvino.inference_engine.constants import OK, RESULT_NOT_READY
+from openvino.inference_engine.constants import OK
 
 from otx.api.entities.annotation import AnnotationSceneEntity
 from otx.api.usecases.exportable_code.streamer.streamer import BaseStreamer
@@ -200,6 +202,110 @@ class BaseOpenVINOInferencer(BaseInferencer, abc.ABC):
         )
 
 
+class _CompletedRequests:
+    """Thread-safe in-process buffer for results written by OpenVINO completion callbacks.
+
+    Args:
+        maxsize: Maximum number of results waiting to be consumed. 0 means unbounded.
+        drop_policy: What to do with a new result if the buffer is full.
+            "drop_oldest" drops the oldest waiting result, "drop_newest" drops the new result and
+            "block" makes the callback wait until the consumer takes a result.
+        ordered: Deliver results in submission order instead of completion order.
+        max_latencies: Number of most recent request latencies kept for the statistics.
+    """
+
+    DROP_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+    def __init__(self, maxsize: int, drop_policy: str, ordered: bool, max_latencies: int = 10000):
+        if drop_policy not in self.DROP_POLICIES:
+            raise ValueError(f"drop_policy should be one of {self.DROP_POLICIES}, but got {drop_policy}")
+        self.maxsize = maxsize
+        self.drop_policy = drop_policy
+        self.ordered = ordered
+        self.num_dropped = 0
+        self.latencies: Deque[float] = deque(maxlen=max_latencies)
+        self._ready: Deque[Any] = deque()
+        self._pending: Dict[int, Any] = {}
+        self._start_times: Dict[int, float] = {}
+        self._next_id = 0
+        self._next_ready_id = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def reserve(self) -> int:
+        """Register a new request and return its id."""
+        with self._condition:
+            request_id = self._next_id
+            self._next_id += 1
+            self._start_times[request_id] = time.perf_counter()
+            return request_id
+
+    def put(self, request_id: int, item: Any):
+        """Add the result of a request, applying the drop policy if the buffer is full.
+
+        Putting _NO_RESULT marks the request as finished without a result.
+        """
+        with self._condition:
+            start_time = self._start_times.pop(request_id, None)
+            if start_time is not None:
+                self.latencies.append(time.perf_counter() - start_time)
+            if not self.ordered:
+                self._append(item)
+            else:
+                self._pending[request_id] = item
+                while self._next_ready_id in self._pending:
+                    self._append(self._pending.pop(self._next_ready_id))
+                    self._next_ready_id += 1
+            self._condition.notify_all()
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """Take the next result.
+
+        Raises:
+            queue.Empty: If no result became available within timeout seconds.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._ready, timeout=timeout):
+                raise queue.Empty
+            item = self._ready.popleft()
+            self._condition.notify_all()
+            return item
+
+    def wait_for_results(self, timeout: Optional[float] = None) -> bool:
+        """Wait until a result is ready or no request is in flight. Returns True if a result is ready."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._ready or not self._start_times, timeout=timeout)
+            return bool(self._ready)
+
+    def close(self):
+        """Stop accepting results and release callbacks blocked by the "block" policy."""
+        with self._condition:
+            self._closed = True
+            self._ready.clear()
+            self._condition.notify_all()
+
+    def _append(self, item: Any):
+        if item is _NO_RESULT or self._closed:
+            return
+        if 0 < self.maxsize <= len(self._ready):
+            if self.drop_policy == "block":
+                self._condition.wait_for(lambda: len(self._ready) < self.maxsize or self._closed)
+                if self._closed:
+                    return
+            elif self.drop_policy == "drop_newest":
+                self.num_dropped += 1
+                logger.warning("An inference result was dropped because the queue is full")
+                return
+            else:
+                self._ready.popleft()
+                self.num_dropped += 1
+                logger.warning("The oldest inference result was dropped because the queue is full")
+        self._ready.append(item)
+
+
+_NO_RESULT = object()
+
+
 class AsyncOpenVINOTask:
     """This class runs asynchronous inference on a BaseOpenVinoInferencer.
 
@@ -210,9 +316,13 @@ class AsyncOpenVINOTask:
         inferencer: The inferencer to use to generate predictions
         drop_output: Set to a number to limit the amount of results
             stored at a time. If inference is completed but there is
-            no room for the output. The output will be dropped.Set
+            no room for the output, drop_policy is applied. Set
             to 0 to disable, Set to None to automatically determine
             a good value
+        drop_policy: "drop_oldest" (default) drops the oldest stored result,
+            "drop_newest" drops the new result and "block" waits for the consumer
+        ordered: Yield results in the order of the input frames instead of
+            the order in which the requests are completed. Defaults to False.
     """
 
     def __init__(
@@ -220,6 +330,8 @@ class AsyncOpenVINOTask:
         streamer: BaseStreamer,
         inferencer: BaseOpenVINOInferencer,
         drop_output: Optional[int] = None,
+        drop_policy: str = "drop_oldest",
+        ordered: bool = False,
     ):
         self.streamer: BaseStreamer = streamer
         self.inferencer: BaseOpenVINOInferencer = inferencer
@@ -229,7 +341,13 @@ class AsyncOpenVINOTask:
             # between memory conservation and flexibility.
             drop_output = self.inferencer.num_requests * 2
 
+        if drop_policy not in _CompletedRequests.DROP_POLICIES:
+            raise ValueError(f"drop_policy should be one of {_CompletedRequests.DROP_POLICIES}, but got {drop_policy}")
+
         self.drop_output = drop_output
+        self.drop_policy = drop_policy
+        self.ordered = ordered
+        self.completed_requests: Optional[_CompletedRequests] = None
 
     def __iter__(self) -> Iterator[Tuple[np.ndarray, List[np.ndarray]]]:
         """Starts the asynchronous inference loop.
@@ -244,8 +362,8 @@ class AsyncOpenVINOTask:
         Yields:
             Iterator[Tuple[np.ndarray, List[np.ndarray]]]: A Tuple with the used image and a list of predictions
         """
-        manager = multiprocessing.Manager()
-        completed_requests = manager.Queue(maxsize=self.drop_output)
+        completed_requests = _CompletedRequests(self.drop_output, self.drop_policy, self.ordered)
+        self.completed_requests = completed_requests
 
         if len(self.inferencer.model.requests) == 1:
             warnings.warn(
@@ -257,51 +375,46 @@ class AsyncOpenVINOTask:
         try:
             for frame in self.streamer:
                 while not self.__idle_request_available():
-                    try:
-                        yield completed_requests.get(timeout=0.1)
-                    except queue.Empty:
-                        pass
+                    if completed_requests.wait_for_results(timeout=0.1):
+                        yield completed_requests.get()
                 self.__make_request(frame, completed_requests)
 
-            while not completed_requests.empty():
-                try:
-                    yield completed_requests.get(timeout=0.1)
-                except queue.Empty:
-                    self.__wait_for_request()
+            while completed_requests.wait_for_results():
+                yield completed_requests.get()
         except GeneratorExit:
             pass
+        finally:
+            completed_requests.close()
 
-    def __idle_request_available(self) -> bool:
-        """Returns True if one idle request is available.
+    def get_latency_percentiles(self, percentiles: Sequence[float] = (50, 90, 99)) -> Dict[float, float]:
+        """Returns percentiles of the latency between submitting a request and receiving its result.
+
+        Args:
+            percentiles: Percentiles to compute, in range [0, 100].
 
         Returns:
-            bool: True if one idle request is available
+            Dict[float, float]: Latency in milliseconds for each requested percentile.
+                Empty if no request was completed yet.
         """
-        return self.inferencer.model.get_idle_request_id() >= 0
+        if self.completed_requests is None or not self.completed_requests.latencies:
+            return {}
+        latencies = np.fromiter(self.completed_requests.latencies, dtype=np.float64) * 1000
+        return dict(zip(percentiles, np.percentile(latencies, percentiles).tolist()))
 
-    def __wait_for_request(self, num_requests: Optional[int] = None, timeout: Optional[int] = None) -> bool:
-        """Wait for num_requests to become available.
-
-        Args:
-            num_requests: Number of requests that should be available
-                for the function to return False. If set to None waits
-                for all requests to finish. Defaults to None.
-            timeout: Amount of milliseconds to wait before function
-                returns regardless of available requests. Set to None to
-                wait regardless of the time. Defaults to None.
+    def __idle_request_available(self) -> bool:
+        """Returns True if one idle request is available.
 
         Returns:
-            bool -- Returns True if no requests are available, False if
-            num_requests are available
+            bool: True if one idle request is available
         """
-        return self.inferencer.model.wait(num_requests=num_requests, timeout=timeout) == RESULT_NOT_READY
+        return self.inferencer.model.get_idle_request_id() >= 0
 
-    def __make_request(self, image: np.ndarray, completed_requests: queue.Queue):
+    def __make_request(self, image: np.ndarray, completed_requests: _CompletedRequests):
         """Makes an asynchronous request.
 
         Args:
             image: Image to run inference on.
-            completed_requests: Queue where results should be placed.
+            completed_requests: Buffer where results should be placed.
 
         Raises:
             RuntimeError: Raised if no idle requests are available
@@ -311,28 +424,30 @@ class AsyncOpenVINOTask:
             raise RuntimeError("Tried to get idle request but got no request")
         request = self.inferencer.model.requests[request_id]
         input_image, metadata = self.inferencer.pre_process(image)
+        completed_id = completed_requests.reserve()
 
         request.set_completion_callback(
             py_callback=_async_callback,
-            py_data=(self, request, image, metadata, completed_requests),
+            py_data=(self, request, image, metadata, completed_requests, completed_id),
         )
         request.async_infer(inputs=input_image)
 
 
 def _async_callback(
     status,
-    callback_args: Tuple[AsyncOpenVINOTask, InferRequest, np.ndarray, Any, multiprocessing.Queue],
+    callback_args: Tuple[AsyncOpenVINOTask, InferRequest, np.ndarray, Any, _CompletedRequests, int],
 ):
     """Callback for Async Infer.
 
-    Adds the used image and output Dictionary to the completed_requests Queue.
+    Adds the used image and output Dictionary to the completed requests buffer.
 
     Args:
         status: OpenVINO status code
         callback_args: AsyncOpenVINOTask object, the Inference Request,
-            the image used, Queue to put the output in.
+            the image used, the metadata, buffer to put the output in and the id of the request in the buffer.
     """
-    self, request, image, metadata, completed_requests = callback_args
+    self, request, image, metadata, completed_requests, completed_id = callback_args
+    result = _NO_RESULT
     try:
         if status != OK:
             raise RuntimeError(f"Infer request has returned status code {status}")
@@ -340,17 +455,10 @@ def _async_callback(
         output_blobs = request.output_blobs
         output_blobs = {k: output_blob.buffer for (k, output_blob) in output_blobs.items()}
         output = self.inferencer.post_process(output_blobs, metadata)
-
-        try:
-            completed_requests.put_nowait((image, output))
-        except queue.Full:
-            logger.warning("An inference result was dropped because the queue is full")
-            # TODO: Make the callback safely drop the oldest output and add the
-            #  new output
-        except AttributeError:
-            # If __iter__ has exited while requests are still up this exception is
-            # thrown
-            pass
+        result = (image, output)
 
     except RuntimeError as error:
         logger.warning("RunTimeError in AsyncOpenVINOTask: _async_callback: %s", str(error))
+    finally:
+        # The request is always completed, otherwise the consumer would wait for it forever
+        completed_requests.put(completed_id, result)
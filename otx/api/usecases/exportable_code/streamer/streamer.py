@@ -9,8 +9,12 @@ import multiprocessing
 import os
 import queue
 import sys
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from enum import Enum
-from typing import Iterator, Union
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple, Type, Union
 
 import cv2
 import numpy as np
@@ -67,24 +71,95 @@ class BaseStreamer(metaclass=abc.ABCMeta):
         raise NotImplementedError
 
 
-def _process_run(streamer: BaseStreamer, buffer: multiprocessing.Queue) -> None:
-    """Private function that is run by the thread.
+def _process_run(
+    streamer: BaseStreamer,
+    ready_queue: multiprocessing.Queue,
+    free_queue: multiprocessing.Queue,
+    alloc_queue: multiprocessing.Queue,
+) -> None:
+    """Private function that is run by the streaming process.
 
-    Waits for the buffer to gain space for timeout seconds while it is full.
-    If no space was available within this time the function will exit
+    Each frame is written into a free shared memory slot and only the slot index is sent to the consumer.
+    Waiting for a free slot gives backpressure when the consumer is slower than the streamer.
+    Slots are allocated (and grown) by the consumer which owns the shared memory.
 
     streamer (BaseStreamer): The streamer to retrieve frames from
-    buffer (multiprocessing.Queue): The buffer to place the retrieved frames in
+    ready_queue (multiprocessing.Queue): Queue to send filled slots and allocation requests
+    free_queue (multiprocessing.Queue): Queue to receive slots which can be overwritten
+    alloc_queue (multiprocessing.Queue): Queue to receive names of newly allocated slots
     """
-    for frame in streamer:
-        buffer.put(frame)
+    slots: Dict[int, shared_memory.SharedMemory] = {}
+    try:
+        for frame in streamer:
+            frame = np.ascontiguousarray(frame)
+            slot = free_queue.get()
+            if slot not in slots or slots[slot].size < frame.nbytes:
+                ready_queue.put(("alloc", slot, frame.nbytes))
+                if slot in slots:
+                    slots[slot].close()
+                slots[slot] = shared_memory.SharedMemory(name=alloc_queue.get())
+            np.ndarray(frame.shape, frame.dtype, buffer=slots[slot].buf)[...] = frame
+            ready_queue.put(("frame", slot, frame.shape, frame.dtype.str))
+    finally:
+        for shm in slots.values():
+            shm.close()
+        ready_queue.put(None)
+
+
+def _put_until_stopped(buffer: queue.Queue, item: Optional[np.ndarray], stop_event: threading.Event) -> bool:
+    """Put an item in the buffer, waiting for a free place until the consumer stops iterating.
+
+    Returns:
+        bool: True if the item was put, False if the consumer stopped.
+    """
+    while not stop_event.is_set():
+        try:
+            buffer.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _thread_run(streamer: BaseStreamer, buffer: queue.Queue, stop_event: threading.Event) -> None:
+    """Private function that is run by the streaming thread.
+
+    streamer (BaseStreamer): The streamer to retrieve frames from
+    buffer (queue.Queue): The buffer to place the retrieved frames in
+    stop_event (threading.Event): Event which is set when the consumer stops iterating
+    """
+    try:
+        for frame in streamer:
+            if not _put_until_stopped(buffer, frame, stop_event):
+                break
+    finally:
+        _put_until_stopped(buffer, None, stop_event)
+
+
+def _release_shared_memory(shm: shared_memory.SharedMemory) -> None:
+    """Unlink a shared memory slot, closing it unless a frame still refers to its buffer."""
+    try:
+        shm.close()
+    except BufferError:
+        # A zero-copy frame is still alive, the mapping is released together with it.
+        pass
+    shm.unlink()
 
 
 class ThreadedStreamer(BaseStreamer):
-    """Runs a BaseStreamer on a separate thread.
+    """Runs a BaseStreamer on a separate process or thread.
+
+    By default frames are passed from a separate process through a fixed pool of shared memory slots,
+    so only slot indices go through the inter-process queues and a frame is never pickled.
+    A slot is recycled when the consumer requests the next frame.
+    If the internal streamer releases the GIL while decoding (e.g. OpenCV), ``use_thread`` runs it
+    on a thread of the current process instead.
 
     streamer (BaseStreamer): The streamer to run on a thread
     buffer_size (int): Number of frame to buffer internally. Defaults to 2.
+    use_thread (bool): Run the streamer on a thread instead of a process. Defaults to False.
+    copy_frames (bool): Copy frames out of shared memory slots. If False, a yielded frame is only valid
+        until the next frame is requested. Defaults to True.
 
     Example:
         >>> streamer = VideoStreamer(path="../demo.mp4")
@@ -93,9 +168,13 @@ class ThreadedStreamer(BaseStreamer):
         ...    pass
     """
 
-    def __init__(self, streamer: BaseStreamer, buffer_size: int = 2) -> None:
+    def __init__(
+        self, streamer: BaseStreamer, buffer_size: int = 2, use_thread: bool = False, copy_frames: bool = True
+    ) -> None:
         self.buffer_size = buffer_size
         self.streamer = streamer
+        self.use_thread = use_thread
+        self.copy_frames = copy_frames
 
     def __iter__(self) -> Iterator[np.ndarray]:
         """Get frames from streamer and yield them.
@@ -103,26 +182,82 @@ class ThreadedStreamer(BaseStreamer):
         Yields:
             Iterator[np.ndarray]: Yield the image or video frame.
         """
-        buffer: multiprocessing.Queue = multiprocessing.Queue(maxsize=self.buffer_size)
-        process = multiprocessing.Process(target=_process_run, args=(self.streamer, buffer))
-        # Make thread a daemon so that it will exit when the main program exits as well
+        if self.use_thread:
+            yield from self._iter_thread()
+        else:
+            yield from self._iter_process()
+
+    def _iter_thread(self) -> Iterator[np.ndarray]:
+        buffer: queue.Queue = queue.Queue(maxsize=self.buffer_size)
+        stop_event = threading.Event()
+        thread = threading.Thread(target=_thread_run, args=(self.streamer, buffer, stop_event), daemon=True)
+        thread.start()
+
+        try:
+            while True:
+                frame = buffer.get()
+                if frame is None:
+                    break
+                yield frame
+        finally:
+            stop_event.set()
+
+    def _iter_process(self) -> Iterator[np.ndarray]:
+        ready_queue: multiprocessing.Queue = multiprocessing.Queue()
+        free_queue: multiprocessing.Queue = multiprocessing.Queue()
+        alloc_queue: multiprocessing.Queue = multiprocessing.Queue()
+        for slot in range(self.buffer_size):
+            free_queue.put(slot)
+
+        if os.name == "posix":
+            # Share one resource tracker with the streaming process, otherwise a tracker started by the child
+            # unlinks the slots it attached to when the child exits.
+            resource_tracker.ensure_running()
+        process = multiprocessing.Process(
+            target=_process_run, args=(self.streamer, ready_queue, free_queue, alloc_queue)
+        )
+        # Make process a daemon so that it will exit when the main program exits as well
         process.daemon = True
         process.start()
 
+        slots: Dict[int, shared_memory.SharedMemory] = {}
         try:
-            while process.is_alive() or not buffer.empty():
+            while True:
                 try:
-                    yield buffer.get(timeout=0.1)
+                    message = ready_queue.get(timeout=1.0)
                 except queue.Empty:
-                    pass
+                    if process.is_alive():
+                        continue
+                    break
+                if message is None:
+                    break
+                if message[0] == "alloc":
+                    _, slot, size = message
+                    if slot in slots:
+                        _release_shared_memory(slots[slot])
+                    slots[slot] = shared_memory.SharedMemory(create=True, size=size)
+                    alloc_queue.put(slots[slot].name)
+                    continue
+
+                _, slot, shape, dtype = message
+                frame = np.ndarray(shape, np.dtype(dtype), buffer=slots[slot].buf)
+                if self.copy_frames:
+                    frame = frame.copy()
+                    free_queue.put(slot)
+                    yield frame
+                else:
+                    yield frame
+                    del frame
+                    free_queue.put(slot)
         except GeneratorExit:
             process.terminate()
         finally:
             process.join(timeout=0.1)
-            # The kill() function is only available in Python 3.7.
-            # Skip it if running an older Python version.
-            if sys.version_info >= (3, 7) and process.exitcode is None:
+            if process.exitcode is None:
                 process.kill()
+                process.join()
+            for shm in slots.values():
+                _release_shared_memory(shm)
 
     def get_type(self) -> MediaType:
         """Get type of internal streamer.
@@ -221,12 +356,36 @@ class CameraStreamer(BaseStreamer):
         return MediaType.CAMERA
 
 
+_REDUCED_COLOR_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+def _get_imread_flag(reduce_factor: int) -> int:
+    """Returns cv2.imread flag which downscales by reduce_factor while decoding."""
+    if reduce_factor not in _REDUCED_COLOR_FLAGS:
+        raise ValueError(f"reduce_factor should be one of {list(_REDUCED_COLOR_FLAGS)}, but got {reduce_factor}")
+    return _REDUCED_COLOR_FLAGS[reduce_factor]
+
+
+def _read_image(filename: str, flag: int) -> Optional[np.ndarray]:
+    """Reads an image as RGB. Returns None if the file can't be decoded."""
+    image = cv2.imread(filename, flag)
+    if image is None:
+        return None
+    return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+
 class ImageStreamer(BaseStreamer):
     """Stream from image file.
 
     Args:
         input_path (str): Path to an image.
         loop (bool): Whether to loop through the image or not. Defaults to False.
+        reduce_factor (int): Downscale the image by 1, 2, 4 or 8 while decoding. Defaults to 1.
 
     Example:
         >>> streamer = ImageStreamer(path="../images")
@@ -235,15 +394,15 @@ class ImageStreamer(BaseStreamer):
         ...     cv2.waitKey(0)
     """
 
-    def __init__(self, input_path: str, loop: bool = False) -> None:
+    def __init__(self, input_path: str, loop: bool = False, reduce_factor: int = 1) -> None:
         self.loop = loop
         self.media_type = MediaType.IMAGE
         if not os.path.isfile(input_path):
             raise InvalidInput(f"Can't find the image by {input_path}")
-        self.image = cv2.imread(input_path, cv2.IMREAD_COLOR)
-        if self.image is None:
+        image = _read_image(input_path, _get_imread_flag(reduce_factor))
+        if image is None:
             raise OpenError(f"Can't open the image from {input_path}")
-        self.image = cv2.cvtColor(self.image, cv2.COLOR_BGR2RGB)
+        self.image = image
 
     def __iter__(self) -> Iterator[np.ndarray]:
         """If loop is True, yield the image again and again."""
@@ -261,8 +420,19 @@ class ImageStreamer(BaseStreamer):
 class DirStreamer(BaseStreamer):
     """Stream from directory of images.
 
+    Images are validated lazily: the constructor only checks that one file has a known image signature,
+    and files which can't be decoded are skipped during the iteration.
+    With num_workers > 0, images are decoded ahead by a thread pool (OpenCV releases the GIL while decoding).
+
     Args:
         path: Path to directory.
+        loop (bool): Whether to loop through the images or not. Defaults to False.
+        num_workers (int): Number of decoding threads. Decode on the consumer thread if 0. Defaults to 0.
+        prefetch (int): Maximum number of images decoded ahead. Defaults to 2 * num_workers.
+        ordered (bool): Yield images in file name order. If False, images are yielded as soon as they are
+            decoded. Defaults to True.
+        reduce_factor (int): Downscale images by 1, 2, 4 or 8 while decoding,
+            useful when the model input is much smaller than the images. Defaults to 1.
 
     Example:
         >>> streamer = DirStreamer(path="../images")
@@ -271,10 +441,22 @@ class DirStreamer(BaseStreamer):
         ...     cv2.waitKey(0)
     """
 
-    def __init__(self, input_path: str, loop: bool = False) -> None:
+    def __init__(
+        self,
+        input_path: str,
+        loop: bool = False,
+        num_workers: int = 0,
+        prefetch: Optional[int] = None,
+        ordered: bool = True,
+        reduce_factor: int = 1,
+    ) -> None:
         self.loop = loop
         self.media_type = MediaType.DIR
         self.dir = input_path
+        self.num_workers = num_workers
+        self.prefetch = prefetch if prefetch is not None else 2 * num_workers
+        self.ordered = ordered
+        self.imread_flag = _get_imread_flag(reduce_factor)
         if not os.path.isdir(self.dir):
             raise InvalidInput(f"Can't find the dir by {input_path}")
         self.names = sorted(os.listdir(self.dir))
@@ -282,26 +464,65 @@ class DirStreamer(BaseStreamer):
             raise OpenError(f"The dir {input_path} is empty")
         self.file_id = 0
         for name in self.names:
-            filename = os.path.join(self.dir, name)
-            image = cv2.imread(str(filename), cv2.IMREAD_COLOR)
-            if image is not None:
+            if cv2.haveImageReader(os.path.join(self.dir, name)):
                 return
         raise OpenError(f"Can't read the first image from {input_path}")
 
+    def _next_filename(self) -> Optional[str]:
+        """Returns the next file name to read or None if the iteration is over."""
+        if self.file_id >= len(self.names):
+            return None
+        filename = os.path.join(self.dir, self.names[self.file_id])
+        if self.file_id < len(self.names) - 1:
+            self.file_id = self.file_id + 1
+        else:
+            self.file_id = self.file_id + 1 if not self.loop else 0
+        return filename
+
     def __iter__(self) -> Iterator[np.ndarray]:
         """Iterates over the images in a directory.
 
         If self.loop is True, it reiterates again from the first image in the directory.
         """
-        while self.file_id < len(self.names):
-            filename = os.path.join(self.dir, self.names[self.file_id])
-            image = cv2.imread(str(filename), cv2.IMREAD_COLOR)
-            if self.file_id < len(self.names) - 1:
-                self.file_id = self.file_id + 1
-            else:
-                self.file_id = self.file_id + 1 if not self.loop else 0
+        if self.num_workers > 0:
+            yield from self._iter_prefetch()
+            return
+
+        while True:
+            filename = self._next_filename()
+            if filename is None:
+                break
+            image = _read_image(filename, self.imread_flag)
             if image is not None:
-                yield cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+                yield image
+
+    def _iter_prefetch(self) -> Iterator[np.ndarray]:
+        """Iterates over the images decoded ahead by a thread pool."""
+        pending: Deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            try:
+                while True:
+                    while len(pending) < max(self.prefetch, 1):
+                        filename = self._next_filename()
+                        if filename is None:
+                            break
+                        pending.append(executor.submit(_read_image, filename, self.imread_flag))
+                    if not pending:
+                        break
+
+                    if self.ordered:
+                        future = pending.popleft()
+                    else:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        future = next(f for f in pending if f in done)
+                        pending.remove(future)
+
+                    image = future.result()
+                    if image is not None:
+                        yield image
+            finally:
+                for future in pending:
+                    future.cancel()
 
     def get_type(self) -> MediaType:
         """Returns the type of the streamer."""
@@ -312,6 +533,12 @@ def get_streamer(
     input_stream: Union[int, str] = 0,
     loop: bool = False,
     threaded: bool = False,
+    use_thread: bool = False,
+    copy_frames: bool = True,
+    num_workers: int = 0,
+    prefetch: Optional[int] = None,
+    ordered: bool = True,
+    reduce_factor: int = 1,
 ) -> BaseStreamer:
     """Get streamer object based on the file path or camera device index provided.
 
@@ -319,6 +546,13 @@ def get_streamer(
         input_stream (Union[int, str]): Path to file or directory or index for camera.
         loop (bool): Enable reading the input in a loop. Defaults to False.
         threaded (bool): Run streaming on a separate thread. Threaded streaming option. Defaults to False.
+        use_thread (bool): With threaded, run streaming on a thread instead of a process. Defaults to False.
+        copy_frames (bool): With threaded, copy frames out of the shared memory of the streaming process.
+            If False, a frame is only valid until the next one is requested. Defaults to True.
+        num_workers (int): Number of threads decoding a directory of images ahead. Defaults to 0.
+        prefetch (int): Maximum number of images of a directory decoded ahead. Defaults to 2 * num_workers.
+        ordered (bool): Yield images of a directory in file name order. Defaults to True.
+        reduce_factor (int): Downscale images by 1, 2, 4 or 8 while decoding. Defaults to 1.
 
     Returns:
         BaseStreamer: Streamer object.
@@ -326,18 +560,26 @@ def get_streamer(
     # errors: Dict = {InvalidInput: [], OpenError: []}
     errors = []
     streamer: BaseStreamer
-    for reader in (ImageStreamer, DirStreamer, VideoStreamer):
+    readers: Tuple[Tuple[Type[BaseStreamer], Dict[str, Any]], ...] = (
+        (ImageStreamer, dict(reduce_factor=reduce_factor)),
+        (
+            DirStreamer,
+            dict(num_workers=num_workers, prefetch=prefetch, ordered=ordered, reduce_factor=reduce_factor),
+        ),
+        (VideoStreamer, {}),
+    )
+    for reader, reader_kwargs in readers:
         try:
-            streamer = reader(input_stream, loop)  # type: ignore
+            streamer = reader(input_stream, loop, **reader_kwargs)  # type: ignore
             if threaded:
-                streamer = ThreadedStreamer(streamer)
+                streamer = ThreadedStreamer(streamer, use_thread=use_thread, copy_frames=copy_frames)
             return streamer
         except (InvalidInput, OpenError) as error:
             errors.append(error)
     try:
         streamer = CameraStreamer(input_stream)  # type: ignore
         if threaded:
-            streamer = ThreadedStreamer(streamer)
+            streamer = ThreadedStreamer(streamer, use_thread=use_thread, copy_frames=copy_frames)
         return streamer
     except (InvalidInput, OpenError) as error:
         errors.append(error)
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions
 # and limitations under the License.
 
+from functools import partial
 from typing import List, Optional, Tuple
 
 import numpy as np
@@ -23,10 +24,12 @@ from otx.api.entities.dataset_item import DatasetItemEntity
 from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.label import LabelEntity
 from otx.api.entities.model import ModelEntity
-from otx.api.entities.result_media import ResultMediaEntity
+from otx.api.entities.prediction_store import PredictionStore, StoredResultMediaEntity
+from otx.api.entities.result_media import LazyResultMediaEntity, ResultMediaEntity
 from otx.api.entities.resultset import ResultSetEntity
 from otx.api.entities.scored_label import ScoredLabel
 from otx.api.entities.shapes.rectangle import Rectangle
+from otx.api.entities.tensor import TensorEntity
 from otx.api.utils.vis_utils import get_actmap
 
 
@@ -193,6 +196,55 @@ def contains_anomalous_images(dataset: DatasetEntity) -> bool:
 
 
 # pylint: disable-msg=too-many-locals
+def _create_saliency_media(
+    dataset_item: DatasetItemEntity,
+    name: str,
+    saliency_map: np.ndarray,
+    process_saliency_maps: bool,
+    lazy_process_saliency_maps: bool,
+    label: Optional[LabelEntity] = None,
+    stored_saliency_map: Optional[Tuple[PredictionStore, Tuple[int, int], Optional[int]]] = None,
+) -> ResultMediaEntity:
+    output_res = (dataset_item.width, dataset_item.height)
+    if stored_saliency_map is not None:
+        prediction_store, key, index = stored_saliency_map
+        return StoredResultMediaEntity(
+            name=name,
+            type="saliency_map",
+            annotation_scene=dataset_item.annotation_scene,
+            store=prediction_store.saliency_maps,
+            key=key,
+            index=index,
+            process=partial(get_actmap, output_res=output_res) if process_saliency_maps else None,
+            width=output_res[0],
+            height=output_res[1],
+            roi=dataset_item.roi,
+            label=label,
+        )
+    if process_saliency_maps and lazy_process_saliency_maps:
+        return LazyResultMediaEntity(
+            name=name,
+            type="saliency_map",
+            annotation_scene=dataset_item.annotation_scene,
+            numpy=saliency_map,
+            process=partial(get_actmap, output_res=output_res),
+            width=output_res[0],
+            height=output_res[1],
+            roi=dataset_item.roi,
+            label=label,
+        )
+    if process_saliency_maps:
+        saliency_map = get_actmap(saliency_map, output_res)
+    return ResultMediaEntity(
+        name=name,
+        type="saliency_map",
+        annotation_scene=dataset_item.annotation_scene,
+        numpy=saliency_map,
+        roi=dataset_item.roi,
+        label=label,
+    )
+
+
 def add_saliency_maps_to_dataset_item(
     dataset_item: DatasetItemEntity,
     saliency_map: np.ndarray,
@@ -201,18 +253,34 @@ def add_saliency_maps_to_dataset_item(
     predicted_scored_labels: Optional[List[ScoredLabel]] = None,
     explain_predicted_classes: bool = True,
     process_saliency_maps: bool = False,
+    lazy_process_saliency_maps: bool = False,
+    prediction_store: Optional[PredictionStore] = None,
 ):
-    """Add saliency maps(2d for class-ignore saliency map, 3d for class-wise saliency maps) to a single dataset item."""
+    """Add saliency maps(2d for class-ignore saliency map, 3d for class-wise saliency maps) to a single dataset item.
+
+    If lazy_process_saliency_maps is set, processed saliency maps are stored at the resolution of the model output
+    and resized to the image resolution only when they are read. If prediction_store is given, the saliency maps of
+    the item are stored there once and the result media only refer to them, processing them when they are read.
+    """
+    stored_key: Optional[Tuple[int, int]] = None
+
+    def get_stored_saliency_map(index: Optional[int] = None):
+        nonlocal stored_key
+        if prediction_store is None:
+            return None
+        if stored_key is None:
+            stored_key = prediction_store.add_saliency_map(saliency_map)
+        return prediction_store, stored_key, index
+
     if saliency_map.ndim == 2:
         # Single saliency map per image, support e.g. EigenCAM use case
-        if process_saliency_maps:
-            saliency_map = get_actmap(saliency_map, (dataset_item.width, dataset_item.height))
-        saliency_media = ResultMediaEntity(
-            name="Saliency Map",
-            type="saliency_map",
-            annotation_scene=dataset_item.annotation_scene,
-            numpy=saliency_map,
-            roi=dataset_item.roi,
+        saliency_media = _create_saliency_media(
+            dataset_item,
+            "Saliency Map",
+            saliency_map,
+            process_saliency_maps,
+            lazy_process_saliency_maps,
+            stored_saliency_map=get_stored_saliency_map(),
         )
         dataset_item.append_metadata_item(saliency_media, model=model)
     elif saliency_map.ndim == 3:
@@ -233,18 +301,32 @@ def add_saliency_maps_to_dataset_item(
         for class_id, class_wise_saliency_map in enumerate(saliency_map):
             label = labels[class_id]
             if label in explain_targets:
-                if process_saliency_maps:
-                    class_wise_saliency_map = get_actmap(
-                        class_wise_saliency_map, (dataset_item.width, dataset_item.height)
-                    )
-                saliency_media = ResultMediaEntity(
-                    name=label.name,
-                    type="saliency_map",
-                    annotation_scene=dataset_item.annotation_scene,
-                    numpy=class_wise_saliency_map,
-                    roi=dataset_item.roi,
+                saliency_media = _create_saliency_media(
+                    dataset_item,
+                    label.name,
+                    class_wise_saliency_map,
+                    process_saliency_maps,
+                    lazy_process_saliency_maps,
                     label=label,
+                    stored_saliency_map=get_stored_saliency_map(class_id),
                 )
                 dataset_item.append_metadata_item(saliency_media, model=model)
     else:
         raise RuntimeError(f"Single saliency map has to be 2 or 3-dimensional, but got {saliency_map.ndim} dims")
+
+
+def add_feature_vector_to_dataset_item(
+    dataset_item: DatasetItemEntity,
+    feature_vector: np.ndarray,
+    model: Optional[ModelEntity],
+    prediction_store: Optional[PredictionStore] = None,
+):
+    """Add a feature vector to a single dataset item as its representation vector.
+
+    If prediction_store is given, the feature vector is stored there and the metadata item only refers to it.
+    """
+    if prediction_store is None:
+        representation_vector = TensorEntity(name="representation_vector", numpy=feature_vector.reshape(-1))
+    else:
+        representation_vector = prediction_store.add_feature_vector(feature_vector)
+    dataset_item.append_metadata_item(representation_vector, model=model)
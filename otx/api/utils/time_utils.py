@@ -10,18 +10,29 @@ import functools
 import time
 from typing import Optional
 
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+# (milliseconds, datetime) of the last call to now(), replaced as a whole so that threads read a consistent pair
+_last_now = [(-1, _EPOCH)]
+
 
 def now() -> datetime.datetime:
     """Return the current UTC creation_date and time up to a millisecond accuracy.
 
     This function is preferable over the Python datetime.datetime.now() function
     because it uses the same accuracy (milliseconds) as MongoDB rather than microsecond accuracy.
+    Calls within the same millisecond return the same (immutable) datetime object, so entities created
+    in bulk share their timestamps instead of holding one datetime each.
 
     Returns:
         Date and time up to a millisecond precision.
     """
-    date = datetime.datetime.now(datetime.timezone.utc)
-    return date.replace(microsecond=(date.microsecond // 1000) * 1000)
+    milliseconds = time.time_ns() // 1_000_000
+    last_milliseconds, last_date = _last_now[0]
+    if milliseconds == last_milliseconds:
+        return last_date
+    date = _EPOCH + datetime.timedelta(milliseconds=milliseconds)
+    _last_now[0] = (milliseconds, date)
+    return date
 
 
 # Debug tools
@@ -14,10 +14,12 @@
 # See the License for the specific language governing permissions
 # and limitations under the License.
 
+import tempfile
 from pathlib import Path
 
 from otx.algorithms.common.utils.logger import get_logger
 from otx.api.entities.explain_parameters import ExplainParameters
+from otx.api.entities.prediction_store import PredictionStore
 from otx.api.entities.task_environment import TaskEnvironment
 from otx.cli.manager import ConfigManager
 from otx.cli.utils.importing import get_impl_class
@@ -171,36 +173,41 @@ def main():
     image_files = get_image_files(args.explain_data_roots)
     dataset_to_explain = get_explain_dataset_from_filelist(image_files)
     explain_predicted_classes = not args.explain_all_classes
-    explain_parameters = ExplainParameters(
-        explainer=args.explain_algorithm,
-        process_saliency_maps=args.process_saliency_maps,
-        explain_predicted_classes=explain_predicted_classes,
-    )
-    explained_dataset = task.explain(
-        dataset_to_explain.with_empty_annotations(),
-        explain_parameters,
-    )
-    assert len(explained_dataset) == len(image_files)
-
-    _log_prior_to_saving(args, len(image_files))
-    explained_image_counter = 0
-    for explained_data, (_, filename) in zip(explained_dataset, image_files):
-        metadata_list = explained_data.get_metadata()
-        if len(metadata_list) > 0:
-            explained_image_counter += 1
-        elif explain_predicted_classes:  # Explain only predictions
-            logger.info(f"No saliency maps generated for {filename} - due to lack of confident predictions.")
-        for metadata in metadata_list:
-            saliency_data = metadata.data
-            fname = f"{Path(Path(filename).name).stem}_{saliency_data.name}".replace(" ", "_")
-            save_saliency_output(
-                process_saliency_maps=explain_parameters.process_saliency_maps,
-                img=explained_data.numpy,
-                saliency_map=saliency_data.numpy,
-                save_dir=args.save_explanation_to,
-                fname=fname,
-                weight=args.overlay_weight,
-            )
+    with tempfile.TemporaryDirectory(dir=args.save_explanation_to) as prediction_dir:
+        # Saliency maps are streamed to chunk files instead of being kept in memory until they are saved
+        prediction_store = PredictionStore(len(dataset_to_explain), directory=prediction_dir)
+        explain_parameters = ExplainParameters(
+            explainer=args.explain_algorithm,
+            process_saliency_maps=args.process_saliency_maps,
+            explain_predicted_classes=explain_predicted_classes,
+            prediction_store=prediction_store,
+        )
+        explained_dataset = task.explain(
+            dataset_to_explain.with_empty_annotations(),
+            explain_parameters,
+        )
+        assert len(explained_dataset) == len(image_files)
+        prediction_store.flush()
+
+        _log_prior_to_saving(args, len(image_files))
+        explained_image_counter = 0
+        for explained_data, (_, filename) in zip(explained_dataset, image_files):
+            metadata_list = explained_data.get_metadata()
+            if len(metadata_list) > 0:
+                explained_image_counter += 1
+            elif explain_predicted_classes:  # Explain only predictions
+                logger.info(f"No saliency maps generated for {filename} - due to lack of confident predictions.")
+            for metadata in metadata_list:
+                saliency_data = metadata.data
+                fname = f"{Path(Path(filename).name).stem}_{saliency_data.name}".replace(" ", "_")
+                save_saliency_output(
+                    process_saliency_maps=explain_parameters.process_saliency_maps,
+                    img=explained_data.numpy,
+                    saliency_map=saliency_data.numpy,
+                    save_dir=args.save_explanation_to,
+                    fname=fname,
+                    weight=args.overlay_weight,
+                )
     _log_after_saving(explain_predicted_classes, explained_image_counter, args, len(image_files))
 
     return dict(retcode=0, template=template.name)
@@ -18,6 +18,7 @@ import json
 import os
 import os.path as osp
 import re
+import shutil
 import struct
 import tempfile
 from pathlib import Path
@@ -38,7 +39,7 @@ from otx.api.entities.model import (
     ModelOptimizationType,
 )
 from otx.api.serialization.label_mapper import LabelSchemaMapper
-from otx.api.usecases.adapters.model_adapter import ModelAdapter
+from otx.api.usecases.adapters.model_adapter import FileDataSource, ModelAdapter
 from otx.cli.utils.nncf import is_checkpoint_nncf
 
 model_adapter_keys = (
@@ -63,7 +64,13 @@ def save_model_data(model: ModelEntity, folder: str) -> None:
 
     os.makedirs(folder, exist_ok=True)
     for filename, model_adapter in model.model_adapters.items():
-        with open(osp.join(folder, filename), "wb") as write_file:
+        path = osp.join(folder, filename)
+        if model_adapter.file_path is not None:
+            # copy file-backed data without loading it into memory
+            if not osp.exists(path) or not osp.samefile(model_adapter.file_path, path):
+                shutil.copyfile(model_adapter.file_path, path)
+            continue
+        with open(path, "wb") as write_file:
             write_file.write(model_adapter.data)
 
 
@@ -83,6 +90,20 @@ def read_binary(path: str) -> bytes:
         return b""
 
 
+def read_model_adapter(path: str) -> ModelAdapter:
+    """Creates ModelAdapter which reads data stored at path on demand.
+
+    Args:
+        path (str): A path where to load data from.
+
+    Returns:
+        ModelAdapter: File-backed ModelAdapter, or ModelAdapter with empty data if the file does not exist.
+    """
+    if osp.isfile(path):
+        return ModelAdapter(FileDataSource(path))
+    return ModelAdapter(b"")
+
+
 def read_model(model_configuration: ModelConfiguration, path: str, train_dataset: DatasetEntity) -> ModelEntity:
     """Creates ModelEntity based on model_configuration and data stored at path.
 
@@ -110,12 +131,12 @@ def read_openvino_model(
     """Reads an OpenVINO model from disk and returns a ModelEntity object."""
 
     model_adapters = {
-        "openvino.xml": ModelAdapter(read_binary(path[:-4] + ".xml")),
-        "openvino.bin": ModelAdapter(read_binary(path[:-4] + ".bin")),
+        "openvino.xml": read_model_adapter(path[:-4] + ".xml"),
+        "openvino.bin": read_model_adapter(path[:-4] + ".bin"),
     }
     for key in model_adapter_keys:
         full_path = osp.join(osp.dirname(path), key)
-        model_adapters[key] = ModelAdapter(read_binary(full_path))
+        model_adapters[key] = read_model_adapter(full_path)
 
     model = ModelEntity(
         configuration=model_configuration,
@@ -130,7 +151,7 @@ def read_pytorch_model(model_configuration: ModelConfiguration, path: str, train
     """Reads a PyTorch model from disk and returns a ModelEntity object."""
     optimization_type = ModelOptimizationType.NONE
 
-    model_adapters = {"weights.pth": ModelAdapter(read_binary(path))}
+    model_adapters = {"weights.pth": read_model_adapter(path)}
 
     if is_checkpoint_nncf(path):
         optimization_type = ModelOptimizationType.NNCF
@@ -139,7 +160,7 @@ def read_pytorch_model(model_configuration: ModelConfiguration, path: str, train
     for key in os.listdir(osp.dirname(path)):
         if re.match(r"aux_model_[0-9]+\.pth", key):
             full_path = osp.join(osp.dirname(path), key)
-            model_adapters[key] = ModelAdapter(read_binary(full_path))
+            model_adapters[key] = read_model_adapter(full_path)
 
     model = ModelEntity(
         configuration=model_configuration,
@@ -12,6 +12,7 @@ from typing import Dict, List, Optional
 from datumaro.components.annotation import AnnotationType
 from datumaro.components.annotation import Bbox as DatumBbox
 from datumaro.components.dataset import Dataset as DatumDataset
+from datumaro.components.dataset_base import DatasetItem as DatumDatasetItem
 
 from otx.api.entities.annotation import Annotation
 from otx.api.entities.dataset_item import DatasetItemEntity
@@ -118,33 +119,29 @@ class ActionClassificationDatasetAdapter(ActionBaseDatasetAdapter):
         label_information = self._prepare_label_information(self.dataset)
         self.label_entities = label_information["label_entities"]
 
-        dataset_items: List[DatasetItemEntity] = []
-        for subset, subset_data in self.dataset.items():
-            for _, datumaro_items in subset_data.subsets().items():
-                for datumaro_item in datumaro_items:
-                    image = self.datum_media_2_otx_media(datumaro_item.media)
-                    assert isinstance(image, Image)
-                    shapes: List[Annotation] = []
-                    for annotation in datumaro_item.annotations:
-                        if annotation.type == AnnotationType.label:
-                            shapes.append(self._get_label_entity(annotation))
-
-                    video_name, frame_idx = datumaro_item.id.split(self.VIDEO_FRAME_SEP)
-                    metadata_item = MetadataItemEntity(
-                        data=VideoMetadata(
-                            video_id=video_name,
-                            frame_idx=int(frame_idx),
-                            is_empty_frame=False,
-                        )
-                    )
-
-                    dataset_item = DatasetItemEntity(
-                        image, self._get_ann_scene_entity(shapes), subset=subset, metadata=[metadata_item]
-                    )
-                    dataset_items.append(dataset_item)
-
+        dataset_items = self._convert_items(self._convert_item)
         return DatasetEntity(items=dataset_items)
 
+    def _convert_item(self, subset: Subset, datumaro_item: DatumDatasetItem) -> DatasetItemEntity:
+        """Convert a single Datumaro frame to DatasetItemEntity."""
+        image = self.datum_media_2_otx_media(datumaro_item.media)
+        assert isinstance(image, Image)
+        shapes: List[Annotation] = []
+        for annotation in datumaro_item.annotations:
+            if annotation.type == AnnotationType.label:
+                shapes.append(self._get_label_entity(annotation))
+
+        video_name, frame_idx = datumaro_item.id.split(self.VIDEO_FRAME_SEP)
+        metadata_item = MetadataItemEntity(
+            data=VideoMetadata(
+                video_id=video_name,
+                frame_idx=int(frame_idx),
+                is_empty_frame=False,
+            )
+        )
+
+        return DatasetItemEntity(image, self._get_ann_scene_entity(shapes), subset=subset, metadata=[metadata_item])
+
 
 class ActionDetectionDatasetAdapter(ActionBaseDatasetAdapter):
     """Action Detection adapter inherited by ActionBaseDatasetAdapter and BaseDatasetAdapter."""
@@ -159,37 +156,34 @@ class ActionDetectionDatasetAdapter(ActionBaseDatasetAdapter):
         for label_entity in self.label_entities:
             label_entity.id = ID(int(label_entity.id) + 1)
 
-        dataset_items: List[DatasetItemEntity] = []
-        for subset, subset_data in self.dataset.items():
-            for _, datumaro_items in subset_data.subsets().items():
-                for datumaro_item in datumaro_items:
-                    image = self.datum_media_2_otx_media(datumaro_item.media)
-                    assert isinstance(image, Image)
-                    shapes: List[Annotation] = []
-                    is_empty_frame = False
-                    for annotation in datumaro_item.annotations:
-                        if isinstance(annotation, DatumBbox):
-                            if self.label_entities[annotation.label].name == self.EMPTY_FRAME_LABEL_NAME:
-                                is_empty_frame = True
-                                shapes.append(self._get_label_entity(annotation))
-                            else:
-                                shapes.append(self._get_original_bbox_entity(annotation))
-
-                    video_name, frame_name = datumaro_item.id.split(self.VIDEO_FRAME_SEP)
-                    metadata_item = MetadataItemEntity(
-                        data=VideoMetadata(
-                            video_id=video_name,
-                            frame_idx=int(frame_name.split("_")[-1]),
-                            is_empty_frame=is_empty_frame,
-                        )
-                    )
-                    dataset_item = DatasetItemEntity(
-                        image, self._get_ann_scene_entity(shapes), subset=subset, metadata=[metadata_item]
-                    )
-                    dataset_items.append(dataset_item)
+        dataset_items = self._convert_items(self._convert_item)
 
         found = [i for i, entity in enumerate(self.label_entities) if entity.name == self.EMPTY_FRAME_LABEL_NAME]
         if found:
             self.label_entities.pop(found[0])
 
         return DatasetEntity(items=dataset_items)
+
+    def _convert_item(self, subset: Subset, datumaro_item: DatumDatasetItem) -> DatasetItemEntity:
+        """Convert a single Datumaro frame to DatasetItemEntity."""
+        image = self.datum_media_2_otx_media(datumaro_item.media)
+        assert isinstance(image, Image)
+        shapes: List[Annotation] = []
+        is_empty_frame = False
+        for annotation in datumaro_item.annotations:
+            if isinstance(annotation, DatumBbox):
+                if self.label_entities[annotation.label].name == self.EMPTY_FRAME_LABEL_NAME:
+                    is_empty_frame = True
+                    shapes.append(self._get_label_entity(annotation))
+                else:
+                    shapes.append(self._get_original_bbox_entity(annotation))
+
+        video_name, frame_name = datumaro_item.id.split(self.VIDEO_FRAME_SEP)
+        metadata_item = MetadataItemEntity(
+            data=VideoMetadata(
+                video_id=video_name,
+                frame_idx=int(frame_name.split("_")[-1]),
+                is_empty_frame=is_empty_frame,
+            )
+        )
+        return DatasetItemEntity(image, self._get_ann_scene_entity(shapes), subset=subset, metadata=[metadata_item])
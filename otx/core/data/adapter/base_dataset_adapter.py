@@ -11,7 +11,8 @@ import os
 from abc import abstractmethod
 from copy import deepcopy
 from difflib import get_close_matches
-from typing import Any, Dict, List, Optional, Union
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import cv2
 import datumaro
@@ -22,6 +23,7 @@ from datumaro.components.annotation import Categories as DatumCategories
 from datumaro.components.dataset import Dataset as DatumDataset
 from datumaro.components.dataset import DatasetSubset as DatumDatasetSubset
 from datumaro.components.dataset import eager_mode
+from datumaro.components.dataset_base import DatasetItem as DatumDatasetItem
 from datumaro.components.media import Image as DatumImage
 from datumaro.components.media import MediaElement as DatumMediaElement
 
@@ -31,6 +33,7 @@ from otx.api.entities.annotation import (
     AnnotationSceneKind,
     NullAnnotationSceneEntity,
 )
+from otx.api.entities.dataset_item import DatasetItemEntity
 from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.id import ID
 from otx.api.entities.image import Image
@@ -61,6 +64,7 @@ class BaseDatasetAdapter(metaclass=abc.ABCMeta):
         test_ann_files (Optional[str]): Path for test annotation file
         unlabeled_data_roots (Optional[str]): Path for unlabeled data
         unlabeled_file_list (Optional[str]): Path of unlabeled file list
+        cache_config (Optional[Dict[str, Any]]): Config for the arrow cache of the imported subsets
 
     Since all adapters can be used for training and validation,
     the default value of train/val/test_data_roots was set to None.
@@ -341,7 +345,47 @@ class BaseDatasetAdapter(metaclass=abc.ABCMeta):
             labels=[ScoredLabel(label=self.label_entities[annotation.label])],
         )
 
-    def remove_unused_label_entities(self, used_labels: List):
+    def _convert_items(
+        self, convert_item: Callable[[Subset, DatumDatasetItem], Optional[DatasetItemEntity]]
+    ) -> List[DatasetItemEntity]:
+        """Convert the Datumaro items of all subsets to OTX items.
+
+        Args:
+            convert_item (Callable): Converts (subset, datumaro_item) to an OTX item
+                or None if the item should be skipped.
+
+        Returns:
+            List[DatasetItemEntity]: converted items
+        """
+        dataset_items: List[DatasetItemEntity] = []
+        for subset, subset_data in self.dataset.items():
+            for _, datumaro_items in subset_data.subsets().items():
+                for datumaro_item in datumaro_items:
+                    dataset_item = convert_item(subset, datumaro_item)
+                    if dataset_item is not None:
+                        dataset_items.append(dataset_item)
+        return dataset_items
+
+    def _convert_items_with_labels(
+        self,
+        convert_item: Callable[[Subset, DatumDatasetItem, Dict[int, None]], Optional[DatasetItemEntity]],
+    ) -> Tuple[List[DatasetItemEntity], List[int]]:
+        """Convert the Datumaro items of all subsets to OTX items, collecting the labels they use.
+
+        Args:
+            convert_item (Callable): Converts (subset, datumaro_item, used_labels) to an OTX item
+                or None if the item should be skipped. Used label indices are recorded as keys of used_labels.
+
+        Returns:
+            Tuple[List[DatasetItemEntity], List[int]]: converted items and indices of used labels
+                in first-seen order
+        """
+        # an insertion-ordered dict keeps the label order of a list without its linear membership test
+        used_labels: Dict[int, None] = {}
+        dataset_items = self._convert_items(partial(convert_item, used_labels=used_labels))
+        return dataset_items, list(used_labels)
+
+    def remove_unused_label_entities(self, used_labels: Iterable[int]):
         """Remove unused label from label entities.
 
         Because label entities will be used to make Label Schema,
@@ -349,7 +393,7 @@ class BaseDatasetAdapter(metaclass=abc.ABCMeta):
         So, remove the unused label from label entities.
 
         Args:
-            used_labels (List): list for index of used label
+            used_labels (Iterable[int]): indices of used labels
         """
         clean_label_entities = []
         for used_label in used_labels:
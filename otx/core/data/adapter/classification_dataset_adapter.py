@@ -9,6 +9,7 @@ from typing import List, Union
 
 from datumaro.components.annotation import AnnotationType as DatumAnnotationType
 from datumaro.components.annotation import LabelCategories as DatumLabelCategories
+from datumaro.components.dataset_base import DatasetItem as DatumDatasetItem
 
 from otx.api.entities.annotation import Annotation
 from otx.api.entities.dataset_item import DatasetItemEntityWithID
@@ -18,6 +19,7 @@ from otx.api.entities.label import LabelEntity
 from otx.api.entities.label_schema import LabelGroup, LabelGroupType, LabelSchemaEntity
 from otx.api.entities.scored_label import ScoredLabel
 from otx.api.entities.shapes.rectangle import Rectangle
+from otx.api.entities.subset import Subset
 from otx.core.data.adapter.base_dataset_adapter import BaseDatasetAdapter
 
 
@@ -37,26 +39,21 @@ class ClassificationDatasetAdapter(BaseDatasetAdapter):
         self.label_entities = label_information["label_entities"]
 
         # Set the DatasetItemEntityWithID
-        dataset_items: List[DatasetItemEntityWithID] = []
-        for subset, subset_data in self.dataset.items():
-            for _, datumaro_items in subset_data.subsets().items():
-                for datumaro_item in datumaro_items:
-                    image = self.datum_media_2_otx_media(datumaro_item.media)
-                    assert isinstance(image, Image)
-                    datumaro_labels = []
-                    for ann in datumaro_item.annotations:
-                        if ann.type == DatumAnnotationType.label:
-                            datumaro_labels.append(ann.label)
-
-                    shapes = self._get_cls_shapes(datumaro_labels)
-                    dataset_item = DatasetItemEntityWithID(
-                        image, self._get_ann_scene_entity(shapes), subset=subset, id_=datumaro_item.id
-                    )
-
-                    dataset_items.append(dataset_item)
-
+        dataset_items = self._convert_items(self._convert_item)
         return DatasetEntity(items=dataset_items)
 
+    def _convert_item(self, subset: Subset, datumaro_item: DatumDatasetItem) -> DatasetItemEntityWithID:
+        """Convert a single Datumaro item to DatasetItemEntityWithID."""
+        image = self.datum_media_2_otx_media(datumaro_item.media)
+        assert isinstance(image, Image)
+        datumaro_labels = []
+        for ann in datumaro_item.annotations:
+            if ann.type == DatumAnnotationType.label:
+                datumaro_labels.append(ann.label)
+
+        shapes = self._get_cls_shapes(datumaro_labels)
+        return DatasetItemEntityWithID(image, self._get_ann_scene_entity(shapes), subset=subset, id_=datumaro_item.id)
+
     def _get_cls_shapes(self, datumaro_labels: List[int]) -> List[Annotation]:
         """Converts a list of datumaro labels to Annotation object."""
         otx_labels = []
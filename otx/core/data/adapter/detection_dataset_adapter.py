@@ -5,9 +5,10 @@
 #
 
 # pylint: disable=invalid-name, too-many-locals, no-member, too-many-nested-blocks
-from typing import List
+from typing import Dict, Optional
 
 from datumaro.components.annotation import AnnotationType as DatumAnnotationType
+from datumaro.components.dataset_base import DatasetItem as DatumDatasetItem
 
 from otx.api.entities.dataset_item import DatasetItemEntityWithID
 from otx.api.entities.datasets import DatasetEntity
@@ -28,39 +29,39 @@ class DetectionDatasetAdapter(BaseDatasetAdapter):
         # Prepare label information
         label_information = self._prepare_label_information(self.dataset)
         self.label_entities = label_information["label_entities"]
-        dataset_items: List[DatasetItemEntityWithID] = []
-        used_labels: List[int] = []
-        for subset, subset_data in self.dataset.items():
-            for _, datumaro_items in subset_data.subsets().items():
-                for datumaro_item in datumaro_items:
-                    image = self.datum_media_2_otx_media(datumaro_item.media)
-                    assert isinstance(image, Image)
-                    shapes = []
-                    for ann in datumaro_item.annotations:
-                        if (
-                            self.task_type in (TaskType.INSTANCE_SEGMENTATION, TaskType.ROTATED_DETECTION)
-                            and ann.type == DatumAnnotationType.polygon
-                        ):
-                            if self._is_normal_polygon(ann):
-                                shapes.append(self._get_polygon_entity(ann, image.width, image.height))
-                        if self.task_type is TaskType.DETECTION and ann.type == DatumAnnotationType.bbox:
-                            if self._is_normal_bbox(ann.points[0], ann.points[1], ann.points[2], ann.points[3]):
-                                shapes.append(self._get_normalized_bbox_entity(ann, image.width, image.height))
-
-                        if ann.label not in used_labels:
-                            used_labels.append(ann.label)
-
-                    if (
-                        len(shapes) > 0
-                        or subset == Subset.UNLABELED
-                        or (subset != Subset.TRAINING and len(datumaro_item.annotations) == 0)
-                    ):
-                        dataset_item = DatasetItemEntityWithID(
-                            image,
-                            self._get_ann_scene_entity(shapes),
-                            subset=subset,
-                            id_=datumaro_item.id,
-                        )
-                        dataset_items.append(dataset_item)
+        dataset_items, used_labels = self._convert_items_with_labels(self._convert_item)
         self.remove_unused_label_entities(used_labels)
         return DatasetEntity(items=dataset_items)
+
+    def _convert_item(
+        self, subset: Subset, datumaro_item: DatumDatasetItem, used_labels: Dict[int, None]
+    ) -> Optional[DatasetItemEntityWithID]:
+        """Convert a single Datumaro item to DatasetItemEntityWithID."""
+        image = self.datum_media_2_otx_media(datumaro_item.media)
+        assert isinstance(image, Image)
+        shapes = []
+        for ann in datumaro_item.annotations:
+            if (
+                self.task_type in (TaskType.INSTANCE_SEGMENTATION, TaskType.ROTATED_DETECTION)
+                and ann.type == DatumAnnotationType.polygon
+            ):
+                if self._is_normal_polygon(ann):
+                    shapes.append(self._get_polygon_entity(ann, image.width, image.height))
+            if self.task_type is TaskType.DETECTION and ann.type == DatumAnnotationType.bbox:
+                if self._is_normal_bbox(ann.points[0], ann.points[1], ann.points[2], ann.points[3]):
+                    shapes.append(self._get_normalized_bbox_entity(ann, image.width, image.height))
+
+            used_labels[ann.label] = None
+
+        if (
+            len(shapes) > 0
+            or subset == Subset.UNLABELED
+            or (subset != Subset.TRAINING and len(datumaro_item.annotations) == 0)
+        ):
+            return DatasetItemEntityWithID(
+                image,
+                self._get_ann_scene_entity(shapes),
+                subset=subset,
+                id_=datumaro_item.id,
+            )
+        return None
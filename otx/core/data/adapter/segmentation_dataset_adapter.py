@@ -13,6 +13,7 @@ import numpy as np
 from datumaro.components.annotation import AnnotationType as DatumAnnotationType
 from datumaro.components.annotation import Mask
 from datumaro.components.dataset import Dataset as DatumDataset
+from datumaro.components.dataset_base import DatasetItem as DatumDatasetItem
 from datumaro.plugins.data_formats.common_semantic_segmentation import (
     CommonSemanticSegmentationBase,
     make_categories,
@@ -74,9 +75,6 @@ class SegmentationDatasetAdapter(BaseDatasetAdapter):
         label_information = self._prepare_label_information(self.dataset)
         self.label_entities = label_information["label_entities"]
 
-        dataset_items: List[DatasetItemEntity] = []
-        used_labels: List[int] = []
-
         if hasattr(self, "data_type_candidates"):
             if self.data_type_candidates[0] == "voc":
                 self.set_voc_labels()
@@ -91,34 +89,35 @@ class SegmentationDatasetAdapter(BaseDatasetAdapter):
             # with "common_semantic_segmentation", so we can use it.
             self.set_common_labels()
 
-        for subset, subset_data in self.dataset.items():
-            for _, datumaro_items in subset_data.subsets().items():
-                for datumaro_item in datumaro_items:
-                    image = self.datum_media_2_otx_media(datumaro_item.media)
-                    assert isinstance(image, Image)
-                    shapes: List[Annotation] = []
-                    for ann in datumaro_item.annotations:
-                        if ann.type == DatumAnnotationType.mask:
-                            # TODO: consider case -> didn't include the background information
-                            datumaro_polygons = MasksToPolygons.convert_mask(ann)
-                            for d_polygon in datumaro_polygons:
-                                new_label = self.updated_label_id.get(d_polygon.label, None)
-                                if new_label is not None:
-                                    d_polygon.label = new_label
-                                else:
-                                    continue
-
-                                shapes.append(self._get_polygon_entity(d_polygon, image.width, image.height))
-                                if d_polygon.label not in used_labels:
-                                    used_labels.append(d_polygon.label)
-
-                    if len(shapes) > 0 or subset == Subset.UNLABELED:
-                        dataset_item = DatasetItemEntity(image, self._get_ann_scene_entity(shapes), subset=subset)
-                        dataset_items.append(dataset_item)
-
+        dataset_items, used_labels = self._convert_items_with_labels(self._convert_item)
         self.remove_unused_label_entities(used_labels)
         return DatasetEntity(items=dataset_items)
 
+    def _convert_item(
+        self, subset: Subset, datumaro_item: DatumDatasetItem, used_labels: Dict[int, None]
+    ) -> Optional[DatasetItemEntity]:
+        """Convert a single Datumaro item to DatasetItemEntity."""
+        image = self.datum_media_2_otx_media(datumaro_item.media)
+        assert isinstance(image, Image)
+        shapes: List[Annotation] = []
+        for ann in datumaro_item.annotations:
+            if ann.type == DatumAnnotationType.mask:
+                # TODO: consider case -> didn't include the background information
+                datumaro_polygons = MasksToPolygons.convert_mask(ann)
+                for d_polygon in datumaro_polygons:
+                    new_label = self.updated_label_id.get(d_polygon.label, None)
+                    if new_label is not None:
+                        d_polygon.label = new_label
+                    else:
+                        continue
+
+                    shapes.append(self._get_polygon_entity(d_polygon, image.width, image.height))
+                    used_labels[d_polygon.label] = None
+
+        if len(shapes) > 0 or subset == Subset.UNLABELED:
+            return DatasetItemEntity(image, self._get_ann_scene_entity(shapes), subset=subset)
+        return None
+
     def set_voc_labels(self):
         """Set labels for common_semantic_segmentation dataset."""
         # Remove background & ignored label in VOC from datumaro
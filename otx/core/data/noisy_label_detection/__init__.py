@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
-from .base import LossDynamicsTracker, LossDynamicsTrackingMixin
+from .base import LossDynamicsStore, LossDynamicsTracker, LossDynamicsTrackingMixin
 from .loss_dynamics_tracking_hook import LossDynamicsTrackingHook
 
-__all__ = ["LossDynamicsTrackingHook", "LossDynamicsTracker", "LossDynamicsTrackingMixin"]
+__all__ = ["LossDynamicsTrackingHook", "LossDynamicsStore", "LossDynamicsTracker", "LossDynamicsTrackingMixin"]
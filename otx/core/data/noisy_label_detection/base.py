@@ -3,14 +3,87 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import datumaro as dm
+import numpy as np
 
 from otx.api.entities.dataset_item import DatasetItemEntityWithID
 from otx.api.entities.datasets import DatasetEntity
 
-__all__ = ["LossDynamicsTracker", "LossDynamicsTrackingMixin"]
+__all__ = ["LossDynamicsStore", "LossDynamicsTracker", "LossDynamicsTrackingMixin"]
+
+
+class LossDynamicsStore:
+    """Columnar store of loss dynamics for the tracked samples.
+
+    Each sample key (e.g. ``(entity_id, ann_id)``) is mapped to an integer index once.
+    Every record is appended to contiguous arrays of iterations, indices and float16 values,
+    so no Python object is created per record. The arrays double their capacity when they are full,
+    so that appending N records copies O(N) records in total.
+
+    Args:
+        initial_capacity (int): Number of records allocated at the first append.
+    """
+
+    def __init__(self, initial_capacity: int = 65536) -> None:
+        self._initial_capacity = initial_capacity
+        self._key_to_index: Dict[Any, int] = {}
+        self._keys: List[Any] = []
+        self._size = 0
+        self._iters = np.empty(0, dtype=np.int32)
+        self._indices = np.empty(0, dtype=np.int32)
+        self._values = np.empty(0, dtype=np.float16)
+
+    def __len__(self) -> int:
+        """Number of the accumulated records."""
+        return self._size
+
+    @property
+    def keys(self) -> List[Any]:
+        """Tracked sample keys in order of the first appearance."""
+        return self._keys
+
+    def _get_index(self, key: Any) -> int:
+        index = self._key_to_index.get(key)
+        if index is None:
+            index = len(self._keys)
+            self._key_to_index[key] = index
+            self._keys.append(key)
+        return index
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._iters)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity, self._initial_capacity)
+        for name in ("_iters", "_indices", "_values"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self._size] = old[: self._size]
+            setattr(self, name, new)
+
+    def append(self, iter: int, keys: Sequence[Any], values: Sequence[float]) -> None:
+        """Append loss values of the given sample keys at the training iteration."""
+        n_records = len(keys)
+        if n_records == 0:
+            return
+        indices = np.fromiter((self._get_index(key) for key in keys), dtype=np.int32, count=n_records)
+        self._reserve(self._size + n_records)
+        records = slice(self._size, self._size + n_records)
+        self._iters[records] = iter
+        self._indices[records] = indices
+        self._values[records] = np.asarray(values, dtype=np.float32)
+        self._size += n_records
+
+    def group_by_key(self) -> Iterator[Tuple[Any, np.ndarray, np.ndarray]]:
+        """Yield (key, iterations, values) of each tracked sample with records in accumulation order."""
+        indices = self._indices[: self._size]
+        order = np.argsort(indices, kind="stable")
+        splits = np.cumsum(np.bincount(indices, minlength=len(self._keys)))[:-1]
+        iters = np.split(self._iters[: self._size][order], splits)
+        values = np.split(self._values[: self._size][order], splits)
+        yield from zip(self._keys, iters, values)
 
 
 class LossDynamicsTracker:
@@ -4,6 +4,8 @@
 #
 
 import os
+import shutil
+from typing import Optional
 
 OTX_CACHE = os.path.expanduser(
     os.getenv(
@@ -12,3 +14,48 @@ OTX_CACHE = os.path.expanduser(
     )
 )
 os.makedirs(OTX_CACHE, exist_ok=True)
+
+
+def get_cache_dir(name: str) -> Optional[str]:
+    """Returns the directory of an opt-in cache in OTX_CACHE, or None if the cache is disabled.
+
+    Caches are enabled by listing their names, comma-separated, in the ``OTX_CACHES`` environment variable,
+    e.g. ``OTX_CACHES=export,dataset_profile``. ``OTX_CACHES=all`` enables all of them.
+    """
+    enabled = {cache.strip() for cache in os.getenv("OTX_CACHES", "").split(",")}
+    if name in enabled or "all" in enabled:
+        return os.path.join(OTX_CACHE, name)
+    return None
+
+
+def _get_size(path: str) -> int:
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    return sum(
+        os.path.getsize(os.path.join(root, file_name))
+        for root, _, file_names in os.walk(path)
+        for file_name in file_names
+    )
+
+
+def evict_cache(cache_dir: str, max_size: int):
+    """Removes the least recently modified entries of a cache directory until it is not larger than max_size bytes."""
+    entries = []
+    for entry in os.scandir(cache_dir):
+        try:
+            entries.append((entry.stat().st_mtime_ns, _get_size(entry.path), entry.path))
+        except FileNotFoundError:
+            # removed by another process
+            continue
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_size <= max_size:
+            break
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        total_size -= size
@@ -6,9 +6,12 @@
 # SPDX-License-Identifier: MIT
 
 import inspect
+from bisect import bisect_left, bisect_right
 from collections import OrderedDict
 from copy import deepcopy
 from dataclasses import asdict
+from functools import lru_cache
+from itertools import count
 from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
 import _collections_abc
@@ -26,6 +29,15 @@ from ..utils import get_op_name
 logger = get_logger()
 
 
+@lru_cache(maxsize=None)
+def _get_valid_in_ports(op_cls) -> Optional[range]:
+    """Return the valid in_port range of an operation class or None if it accepts varargs."""
+    spec = inspect.getfullargspec(op_cls.forward)
+    if spec.varargs is not None:
+        return None
+    return range(len(spec.args[1:]))
+
+
 class SortedDictKeysView(_collections_abc.KeysView):
     """SortedDictKeysView class."""
 
@@ -71,11 +83,19 @@ class NOOP:
 
 
 class SortedDict(dict):
-    """SortedDict class."""
+    """SortedDict class.
+
+    Keys are ordered by the value of ``sort_key`` in their edge attributes and by
+    insertion order for ties. Ordering is kept in lists searched with bisect
+    so that insertion and removal do not re-sort or scan the whole dict.
+    """
 
     def __init__(self, sort_key, *args, **kwargs):
         self._sort_key = sort_key
         self._sorted_keys = []
+        self._sort_tokens = []
+        self._key_tokens = {}
+        self._counter = count()
         super().__init__(self, *args, **kwargs)
 
     def __setitem__(self, key, value):
@@ -83,8 +103,11 @@ class SortedDict(dict):
         assert len(value) == 1
         edge_key, edge_attr = next(iter(value.items()))
         sort_value = float("inf") if self._sort_key not in edge_attr else edge_attr[self._sort_key]
-        self._sorted_keys.append([sort_value, key, edge_key])
-        self._sorted_keys.sort(key=lambda x: x[0])
+        token = (sort_value, next(self._counter))
+        idx = bisect_right(self._sort_tokens, token)
+        self._sort_tokens.insert(idx, token)
+        self._sorted_keys.insert(idx, [sort_value, key, edge_key])
+        self._key_tokens.setdefault(key, []).append(token)
         if key in self:
             assert edge_key not in self[key]
             self[key].update(value)
@@ -94,10 +117,20 @@ class SortedDict(dict):
     def __delitem__(self, key):
         """Sorteddict's delitem function."""
         super().__delitem__(key)
-        for i, (_, key_in, _) in enumerate(self._sorted_keys):
-            if key_in == key:
-                break
-        self._sorted_keys.pop(i)  # pylint: disable=undefined-loop-variable
+        self._remove_sorted_key(key)
+
+    def _remove_sorted_key(self, key):
+        """Sorteddict's _remove_sorted_key function."""
+        tokens = self._key_tokens.get(key)
+        if not tokens:
+            return
+        token = min(tokens)
+        tokens.remove(token)
+        if not tokens:
+            del self._key_tokens[key]
+        idx = bisect_left(self._sort_tokens, token)
+        self._sort_tokens.pop(idx)
+        self._sorted_keys.pop(idx)
 
     def __iter__(self):
         """Sorteddict's iter function."""
@@ -133,6 +166,8 @@ class SortedDict(dict):
         """Sorteddict's clear function."""
         super().clear()
         self._sorted_keys = []
+        self._sort_tokens = []
+        self._key_tokens = {}
 
     def pop(self, key, default=NOOP()):
         """Sorteddict's pop function."""
@@ -140,11 +175,7 @@ class SortedDict(dict):
             value = super().pop(key)
         else:
             value = super().pop(key, default)
-
-        for i, (_, key_in, _) in enumerate(self._sorted_keys):
-            if key_in == key:
-                break
-        self._sorted_keys.pop(i)  # pylint: disable=undefined-loop-variable
+        self._remove_sorted_key(key)
 
         return value
 
@@ -236,12 +267,14 @@ class Graph(nx.MultiDiGraph):
                 parents_dict[op_name].append([out_port_id, in_port_id, get_op_name(out_port.get_node())])
 
         # validate graph
+        parent_names = {node: {i[-1] for i in parents} for node, parents in parents_dict.items()}
+        child_names = {node: {i[-1] for i in children} for node, children in children_dict.items()}
         for node, children in children_dict.items():
             for _, _, child in children:
-                assert node in [i[-1] for i in parents_dict[child]], f"{node} is not a parent of {child}"
+                assert node in parent_names[child], f"{node} is not a parent of {child}"
         for node, parents in parents_dict.items():
             for _, _, parent in parents:
-                assert node in [i[-1] for i in children_dict[parent]], f"{node} is not a child of {parent}"
+                assert node in child_names[parent], f"{node} is not a child of {parent}"
 
         # add edges
         for src, tgts in children_dict.items():
@@ -325,13 +358,10 @@ class Graph(nx.MultiDiGraph):
         if out_port is None:
             out_port = 0
 
+        occupied = [edge["in_port"] for edges in self._pred[node_to].values() for edge in edges.values()]
+        assert len(occupied) == len(set(occupied))
+
         if in_port is None:
-            occupied = [
-                edge["in_port"]
-                for predecessor in self.predecessors(node_to)
-                for edge in self.get_edge_data(predecessor, node_to)
-            ]
-            assert len(occupied) == len(set(occupied))
             if occupied:
                 for i in range(max(occupied)):
                     if i not in occupied:
@@ -341,21 +371,11 @@ class Graph(nx.MultiDiGraph):
                 in_port = len(occupied)
 
         # validate in_port
-        spec = inspect.getfullargspec(node_to.forward)
-        if spec.varargs is None:
-            valid_range = list(range(len(spec.args[1:])))
-            if in_port not in valid_range:
-                raise ValueError(f"in_port {in_port} is not in valid range {valid_range} " f"for {node_to.name}.")
-        occupied = []
-        predecessors = list(self.predecessors(node_to))
-        if predecessors:
-            occupied = [
-                edge["in_port"] for predecessor in predecessors for edge in self.get_edge_data(predecessor, node_to)
-            ]
-            assert len(occupied) == len(set(occupied))
-        if occupied:
-            if in_port in occupied:
-                raise ValueError(f"in_port {in_port} is occupied for {node_to.name}.")
+        valid_range = _get_valid_in_ports(type(node_to))
+        if valid_range is not None and in_port not in valid_range:
+            raise ValueError(f"in_port {in_port} is not in valid range {list(valid_range)} " f"for {node_to.name}.")
+        if in_port in occupied:
+            raise ValueError(f"in_port {in_port} is occupied for {node_to.name}.")
 
         # out_port validation is not able to do
 
@@ -101,6 +101,7 @@ class OVModel(torch.nn.Module):  # pylint: disable=too-many-instance-attributes
 
         # build torch module
         self.model = self.build_torch_module(graph)
+        self._forward_plan = None
 
         if init_weight:
             if not isinstance(init_weight, Callable):
@@ -424,50 +425,65 @@ class OVModel(torch.nn.Module):  # pylint: disable=too-many-instance-attributes
                 inputs[key] = arg
         return inputs
 
+    def build_forward_plan(self):
+        """Function build_forward_plan.
+
+        Resolve the graph into a topologically ordered list of steps once.
+        Each step holds the node, its input slots as (source name, out_port, in_port)
+        and the names of the features which are no longer needed after the step
+        so that forward does not need to traverse the graph on every call.
+        """
+        keep = set(self._features_to_keep) if self._features_to_keep is not None else set()
+
+        steps = []
+        last_consumers = {}
+        for step_idx, (node_name, node) in enumerate(self.model.items()):
+            slots = []
+            for input_node, edges in self._graph.predecessors(node, with_edge_data=True):
+                for edge in edges:
+                    slots.append((input_node.name, edge["out_port"], edge["in_port"]))
+                last_consumers[input_node.name] = step_idx
+
+            if not slots and node.type not in ["Parameter", "Constant"]:
+                raise ValueError(f"Broken graph. Node {node_name} is a type of {node.type} " "but it has no in edges.")
+            in_ports = sorted(in_port for _, _, in_port in slots)
+            if in_ports != list(range(len(in_ports))):
+                raise ValueError(f"Broken graph. Node {node_name} has invalid in_ports {in_ports}.")
+
+            steps.append([node_name, node, tuple(slots), []])
+
+        for input_node_name, step_idx in last_consumers.items():
+            if input_node_name not in keep:
+                steps[step_idx][-1].append(input_node_name)
+
+        return [tuple(step) for step in steps]
+
     def forward(self, *args, **kwargs):
         """Function forward."""
         self._feature_dict.clear()
         inputs = self._build_forward_inputs(*args, **kwargs)
 
-        done = {}
-        for node_name, node in self.model.items():
-            done[node_name] = {node.name: False for node in self._graph.successors(node)}
+        if self._forward_plan is None:
+            self._forward_plan = self.build_forward_plan()
 
-        for node_name, node in self.model.items():
-            predecessors_with_edge = list(self._graph.predecessors(node, with_edge_data=True))
-            if not predecessors_with_edge:
+        feature_dict = self._feature_dict
+        for node_name, node, slots, releases in self._forward_plan:
+            if not slots:
                 if node.type == "Parameter":
-                    self._feature_dict[node_name] = node(inputs[node_name])
-                elif node.type == "Constant":
-                    self._feature_dict[node_name] = node()
+                    feature_dict[node_name] = node(inputs[node_name])
                 else:
-                    raise ValueError(
-                        f"Broken graph. Node {node_name} is a type of {node.type} " "but it has no in edges."
-                    )
-            else:
-                input_nodes, edges = list(map(list, zip(*predecessors_with_edge)))
-                input_node_names = [input_node.name for input_node in input_nodes]
-
-                input_features = [edge["in_port"] for edges_ in edges for edge in edges_]
-                assert len(input_features) == len(set(input_features))
-                input_features = [None for _ in input_features]
-                for idx, input_node_name in enumerate(input_node_names):
-                    if self._features_to_keep is not None and input_node_name in self._features_to_keep:
-                        input_feature = self._feature_dict.get(input_node_name)
-                    else:
-                        input_feature = self._feature_dict.pop(input_node_name)
-                        done[input_node_name][node_name] = True
-                        if not all(done[input_node_name].values()):
-                            self._feature_dict[input_node_name] = input_feature
-
-                    if isinstance(input_feature, tuple):
-                        for edges_ in edges[idx]:
-                            input_features[edges_["in_port"]] = input_feature[edges_["out_port"]]
-                    else:
-                        for edges_ in edges[idx]:
-                            input_features[edges_["in_port"]] = input_feature
-                assert all(input_feature is not None for input_feature in input_features)
-                self._feature_dict[node_name] = node(*input_features)
+                    feature_dict[node_name] = node()
+                continue
+
+            input_features = [None] * len(slots)
+            for input_node_name, out_port, in_port in slots:
+                input_feature = feature_dict[input_node_name]
+                if isinstance(input_feature, tuple):
+                    input_feature = input_feature[out_port]
+                input_features[in_port] = input_feature
+            for input_node_name in releases:
+                del feature_dict[input_node_name]
+            feature_dict[node_name] = node(*input_features)
 
         outputs = OrderedDict()
         for output_name in self._outputs:
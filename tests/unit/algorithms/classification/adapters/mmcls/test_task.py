@@ -356,6 +356,24 @@ class TestMMClassificationTask:
         for output in outputs:
             assert output.get_annotations()[-1].get_labels()[0].probability == 0.7
 
+    @e2e_pytest_unit
+    def test_get_batch_labels_hierarchical(self) -> None:
+        """Test decoding of hierarchical predictions with the label tables."""
+
+        all_groups = self.hl_cls_task._hierarchical_info["all_groups"]
+        predictions = np.array([[0.1, 0.7, 0.2, 0.9, 0.1], [0.6, 0.3, 0.1, 0.2, 0.8]], dtype=np.float32)
+        batch_labels = self.hl_cls_task._get_batch_labels(predictions, pos_thr=0.5)
+
+        expected = [{all_groups[0][1]: 0.7, all_groups[1][0]: 0.9}, {all_groups[0][0]: 0.6, all_groups[2][0]: 0.8}]
+        for item_labels, item_expected in zip(batch_labels, expected):
+            assert {label.name: label.probability for label in item_labels} == pytest.approx(item_expected)
+
+        head_labels, _ = self.hl_cls_task._get_hierarchical_label_tables()
+        assert self.hl_cls_task._get_hierarchical_label_tables()[0] is head_labels
+        # the tables are rebuilt for new hierarchical info
+        self.hl_cls_task._hierarchical_info = dict(self.hl_cls_task._hierarchical_info)
+        assert self.hl_cls_task._get_hierarchical_label_tables()[0] is not head_labels
+
     @e2e_pytest_unit
     def test_cls_evaluate(self) -> None:
         """Test evaluate function for classification."""
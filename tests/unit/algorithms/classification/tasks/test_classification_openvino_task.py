@@ -21,6 +21,7 @@ from otx.api.entities.annotation import (
     AnnotationSceneKind,
 )
 from otx.api.entities.datasets import DatasetEntity
+from otx.api.entities.explain_parameters import ExplainParameters
 from otx.api.entities.inference_parameters import InferenceParameters
 from otx.api.entities.label_schema import LabelSchemaEntity
 from otx.api.entities.metrics import Performance, ScoreMetric
@@ -181,11 +182,40 @@ class TestOpenVINOClassificationTask:
                 self.fake_input,
             ),
         )
-        updpated_dataset = self.cls_ov_task.explain(self.dataset)
+        updpated_dataset = self.cls_ov_task.explain(self.dataset, ExplainParameters(enable_async_inference=False))
 
         assert updpated_dataset is not None
         assert updpated_dataset.get_labels() == self.dataset.get_labels()
 
+    @e2e_pytest_unit
+    def test_explain_async(self, mocker):
+        fake_saliency_map = np.random.randint(255, size=(2, 7, 7), dtype=np.uint8)
+
+        def fake_enqueue_prediciton(obj, x, idx, result_handler):
+            result_handler(idx, self.fake_ann_scene, (None, fake_saliency_map, None, 0))
+
+        mocker.patch.object(ClassificationOpenVINOInferencer, "enqueue_prediction", fake_enqueue_prediciton)
+        mocker.patch.object(ClassificationOpenVINOInferencer, "await_all")
+
+        updated_dataset = self.cls_ov_task.explain(
+            self.dataset, ExplainParameters(process_saliency_maps=True, explain_predicted_classes=False)
+        )
+
+        for updated in updated_dataset:
+            assert updated.annotation_scene.contains_any(self.labels)
+            saliency_maps = updated.get_metadata()
+            assert len(saliency_maps) > 0
+            for metadata in saliency_maps:
+                assert metadata.data.raw_numpy.shape == (7, 7)
+                assert metadata.data.numpy.shape == (updated.height, updated.width, 3)
+
+        def fake_enqueue_without_saliency_map(obj, x, idx, result_handler):
+            result_handler(idx, self.fake_ann_scene, (None, None, None, 0))
+
+        mocker.patch.object(ClassificationOpenVINOInferencer, "enqueue_prediction", fake_enqueue_without_saliency_map)
+        with pytest.raises(RuntimeError):
+            self.cls_ov_task.explain(self.dataset)
+
     @e2e_pytest_unit
     def test_evaluate(self, mocker):
         result_set = ResultSetEntity(
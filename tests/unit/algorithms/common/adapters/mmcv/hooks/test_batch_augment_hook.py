@@ -0,0 +1,74 @@
+"""Unit test for otx.algorithms.common.adapters.mmcv.hooks.batch_augment_hook."""
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import random
+
+import numpy as np
+import torch
+from mmcv.parallel import DataContainer
+
+from otx.algorithms.common.adapters.mmcv.hooks.batch_augment_hook import (
+    BatchRandAugmentHook,
+)
+from otx.algorithms.common.adapters.mmcv.pipelines.transforms.augments import (
+    BatchAugments,
+)
+from tests.test_suite.e2e_test_system import e2e_pytest_unit
+
+MEAN = (123.675, 116.28, 103.53)
+STD = (58.395, 57.12, 57.375)
+
+
+class MockRunner:
+    def __init__(self, imgs):
+        self.data_batch = {"img": imgs}
+
+
+class TestBatchRandAugmentHook:
+    def setup_method(self):
+        random.seed(0)
+        self.imgs = np.random.randint(0, 256, (4, 32, 40, 3), dtype=np.uint8)
+        normalized = (self.imgs.astype(np.float32) - np.array(MEAN, dtype=np.float32)) / np.array(STD, dtype=np.float32)
+        self.batch = torch.from_numpy(normalized).permute(0, 3, 1, 2).contiguous()
+
+    @e2e_pytest_unit
+    def test_sample_ops(self):
+        """Test sample_ops draws BatchAugments ops within the RandAugment ranges."""
+        hook = BatchRandAugmentHook(num_aug=3, magnitude=10, prob=1.0)
+        ops = hook.sample_ops(100)
+        assert len(ops) == 100
+        for sample_ops in ops:
+            assert len(sample_ops) <= 3
+            for name, value in sample_ops:
+                assert name in BatchAugments.GEOMETRIC_OPS + BatchAugments.PIXEL_OPS
+                if name == "rotate":
+                    assert -30 < value < 30
+                elif name == "posterize":
+                    assert 4 <= value < 8
+        assert all(not sample_ops for sample_ops in BatchRandAugmentHook(prob=0.0).sample_ops(10))
+
+    @e2e_pytest_unit
+    def test_before_train_iter(self, mocker):
+        """Test before_train_iter augments the normalized batch in place with BatchAugments.apply."""
+        hook = BatchRandAugmentHook(mean=MEAN, std=STD)
+        ops = [[("brightness", 0.5)], [], [("rotate", 10), ("solarize", 128)], [("shear_x", 0.1)]]
+        mocker.patch.object(hook, "sample_ops", return_value=ops)
+        spy_apply = mocker.spy(BatchAugments, "apply")
+        runner = MockRunner(DataContainer([self.batch], stack=True))
+        hook.before_train_iter(runner)
+
+        spy_apply.assert_called_once()
+        np.testing.assert_array_equal(spy_apply.call_args[0][0], self.imgs)
+        expected = BatchAugments.apply(self.imgs, ops)
+        result = self.batch.permute(0, 2, 3, 1).numpy() * np.array(STD) + np.array(MEAN)
+        np.testing.assert_allclose(result, expected, atol=1e-3)
+
+    @e2e_pytest_unit
+    def test_before_train_iter_bgr(self):
+        """Test before_train_iter keeps a BGR batch unchanged when no op is drawn."""
+        hook = BatchRandAugmentHook(mean=MEAN, std=STD, to_rgb=False, prob=0.0)
+        expected = self.batch.clone()
+        hook.before_train_iter(MockRunner(self.batch))
+        assert torch.allclose(self.batch, expected, atol=1e-5)
@@ -7,11 +7,14 @@ from __future__ import annotations
 
 from typing import Any
 
+import cv2
+import numpy as np
 import pytest
 from PIL import Image
 
 from otx.algorithms.common.adapters.mmcv.pipelines.transforms.augments import (
     Augments,
+    BatchAugments,
     CythonAugments,
 )
 
@@ -100,3 +103,85 @@ class TestCythonAugments:
         """Test that it raises an assertion error if dst is not a numpy array."""
         with pytest.raises(AssertionError):
             CythonAugments.blend(image, image, 0.5)
+
+
+@pytest.fixture
+def images() -> np.ndarray:
+    return np.random.default_rng(0).integers(0, 256, (4, 32, 24, 3), dtype=np.uint8)
+
+
+class TestBatchAugments:
+    @pytest.mark.parametrize(
+        "augmentation_str, args, tolerance",
+        [
+            ("solarize", [0, 64, 128, 256], 0),
+            ("posterize", [1, 4, 7, 8], 0),
+            ("color", [0.0, 0.5, 1.0, 1.7], 2),
+            ("contrast", [0.0, 0.5, 1.0, 1.5], 1),
+            ("brightness", [0.0, 0.5, 1.0, 1.8], 0),
+            ("sharpness", [0.0, 0.5, 1.0, 1.8], 1),
+        ],
+    )
+    def test_pixel_augmentation_equals_to_pil(
+        self, images: np.ndarray, augmentation_str: str, args: list, tolerance: int
+    ) -> None:
+        """Test that each sample gets the result of PIL with its own parameter."""
+        result = getattr(BatchAugments, augmentation_str)(images, args)
+        assert result.dtype == np.uint8
+        assert result.shape == images.shape
+        for img, arg, output in zip(images, args, result):
+            expected = np.asarray(getattr(Augments, augmentation_str)(Image.fromarray(img), arg))
+            assert np.abs(output.astype(np.int32) - expected).max() <= tolerance
+
+    @pytest.mark.parametrize(
+        "augmentation_str, arg, matrix",
+        [
+            ("rotate", 30, cv2.getRotationMatrix2D((12.0, 16.0), 30, 1.0)),
+            ("shear_x", 0.3, np.array([[1, -0.3, 0], [0, 1, 0]])),
+            ("shear_y", -0.3, np.array([[1, 0, 0], [0.3, 1, 0]])),
+            ("translate_x_rel", 0.25, np.array([[1, 0, -6], [0, 1, 0]])),
+            ("translate_y_rel", -0.25, np.array([[1, 0, 0], [0, 1, 8]])),
+        ],
+    )
+    def test_geometric_augmentation_equals_to_warp_affine(
+        self, images: np.ndarray, augmentation_str: str, arg: float, matrix: np.ndarray
+    ) -> None:
+        """Test that geometric ops are the affine warps of the Cython ops."""
+        result = getattr(BatchAugments, augmentation_str)(images, arg)
+        for img, output in zip(images, result):
+            expected = cv2.warpAffine(img, matrix.astype(np.float64), (24, 32), flags=cv2.INTER_LINEAR)
+            assert np.array_equal(output, expected)
+
+    def test_apply(self, images: np.ndarray) -> None:
+        """Test that ops are applied per sample, with a single warp for the geometric ops."""
+        ops = [
+            [("solarize", 100), ("brightness", 0.5)],
+            [("translate_x_rel", 0.25), ("translate_y_rel", 0.25)],
+            [],
+            [("posterize", 2), ("rotate", 0.0)],
+        ]
+        result = BatchAugments.apply(images, ops)
+        assert np.array_equal(result[0], BatchAugments.brightness(BatchAugments.solarize(images[:1], 100), 0.5)[0])
+        expected = BatchAugments.translate_y_rel(BatchAugments.translate_x_rel(images[1:2], 0.25), 0.25)
+        assert np.array_equal(result[1], expected[0])
+        assert np.array_equal(result[2], images[2])
+        assert np.array_equal(result[3], BatchAugments.posterize(images[3:], 2)[0])
+
+        # The order of pixel and geometric ops is kept
+        ops = [
+            [("contrast", 0.3), ("rotate", 30.0)],
+            [("rotate", 30.0), ("contrast", 0.3)],
+            [("shear_x", 0.1), ("brightness", 0.5), ("shear_y", 0.1)],
+            [("solarize", 100)],
+        ]
+        result = BatchAugments.apply(images, ops)
+        expected = BatchAugments.rotate(BatchAugments.contrast(images[:1], 0.3), 30.0)
+        assert np.array_equal(result[0], expected[0])
+        expected = BatchAugments.contrast(BatchAugments.rotate(images[1:2], 30.0), 0.3)
+        assert np.array_equal(result[1], expected[0])
+        expected = BatchAugments.shear_y(BatchAugments.brightness(BatchAugments.shear_x(images[2:3], 0.1), 0.5), 0.1)
+        assert np.array_equal(result[2], expected[0])
+        assert np.array_equal(result[3], BatchAugments.solarize(images[3:], 100)[0])
+
+        with pytest.raises(ValueError):
+            BatchAugments.apply(images, [[("unknown", 1.0)]] * 4)
@@ -1,4 +1,5 @@
 import pytest
+from copy import deepcopy
 from math import sqrt
 
 from otx.algorithms.common.adapters.mmcv.utils import automatic_bs
@@ -11,7 +12,7 @@ TRAINSET_SIZE = 100
 
 
 class MockBsSearchAlgo:
-    def __init__(self, train_func, default_bs: int, max_bs: int):
+    def __init__(self, train_func, default_bs: int, max_bs: int, mem_budget=None):
         self.train_func = train_func
         self.default_bs = default_bs
         self.max_bs = max_bs
@@ -154,3 +155,14 @@ class TestSubDataset:
 
     def test_flag(self):
         assert len(self.sub_dataset.flag) == self.num_samples
+
+
+def test_get_deepcopy_memo(mocker):
+    otx_dataset = mocker.MagicMock()
+    cfg = {"data": {"train": {"otx_dataset": otx_dataset, "pipeline": [{"type": "LoadImageFromOTXDataset"}]}}}
+
+    copied_cfg = deepcopy(cfg, automatic_bs._get_deepcopy_memo(cfg))
+
+    assert copied_cfg == cfg
+    assert copied_cfg["data"]["train"]["otx_dataset"] is otx_dataset
+    assert copied_cfg["data"]["train"]["pipeline"] is not cfg["data"]["train"]["pipeline"]
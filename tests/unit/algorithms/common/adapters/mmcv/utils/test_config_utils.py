@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from otx.algorithms.common.adapters.mmcv.utils import config_utils
+from otx.algorithms.common.adapters.mmcv.utils.config_utils import MPAConfig
+from tests.test_suite.e2e_test_system import e2e_pytest_unit
+
+
+class TestMPAConfig:
+    @pytest.fixture(autouse=True)
+    def setup(self, mocker, tmp_path):
+        mocker.patch.object(config_utils, "_parsed_configs", {})
+        mocker.patch.object(MPAConfig, "cache_dir", str(tmp_path / "cache"))
+        self.base_path = tmp_path / "base.py"
+        self.base_path.write_text("model = dict(type='Base', depth=18)\n")
+        self.config_path = tmp_path / "config.py"
+        self.config_path.write_text("_base_ = ['./base.py']\nmodel = dict(depth=50)\nwork_dir = '{{ fileDirname }}'\n")
+        self.parse_spy = mocker.spy(MPAConfig, "_parse_file")
+
+    @e2e_pytest_unit
+    def test_fromfile_cached(self, mocker):
+        cfg = MPAConfig.fromfile(str(self.config_path))
+        assert cfg.model == dict(type="Base", depth=50)
+        assert cfg.work_dir == str(self.config_path.parent)
+        assert self.parse_spy.call_count == 2
+
+        # in-process cache returns copies
+        cfg.model.depth = 101
+        assert MPAConfig.fromfile(str(self.config_path)).model.depth == 50
+        assert self.parse_spy.call_count == 2
+
+        # on-disk cache is used by new processes
+        mocker.patch.object(config_utils, "_parsed_configs", {})
+        assert MPAConfig.fromfile(str(self.config_path)).model.depth == 50
+        assert self.parse_spy.call_count == 2
+
+    @e2e_pytest_unit
+    def test_fromfile_without_disk_cache(self, mocker, monkeypatch):
+        mocker.patch.object(MPAConfig, "cache_dir", None)
+        monkeypatch.delenv("OTX_CACHES", raising=False)
+        get_cache_dir = mocker.spy(config_utils, "get_cache_dir")
+
+        MPAConfig.fromfile(str(self.config_path))
+        mocker.patch.object(config_utils, "_parsed_configs", {})
+        MPAConfig.fromfile(str(self.config_path))
+
+        get_cache_dir.assert_called_with("config")
+        assert self.parse_spy.call_count == 4
+
+    @e2e_pytest_unit
+    def test_fromfile_base_modified(self):
+        MPAConfig.fromfile(str(self.config_path))
+        self.base_path.write_text("model = dict(type='Modified', depth=18)\n")
+        stat = os.stat(self.base_path)
+        os.utime(self.base_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        cfg = MPAConfig.fromfile(str(self.config_path))
+
+        assert cfg.model == dict(type="Modified", depth=50)
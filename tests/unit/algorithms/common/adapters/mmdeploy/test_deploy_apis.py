@@ -58,6 +58,96 @@ class TestNaiveExporter:
             assert [f for f in os.listdir(tempdir) if f.endswith(".xml")]
             assert [f for f in os.listdir(tempdir) if f.endswith(".bin")]
 
+    @e2e_pytest_unit
+    def test_export2backend_cache(self, mocker):
+        from otx.algorithms.classification.adapters.mmcls.utils.builder import (
+            build_classifier,
+        )
+
+        config = create_config()
+        create_model("mmcls")
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            cache_dir = os.path.join(tempdir, "cache")
+            output_dir = os.path.join(tempdir, "first")
+            os.makedirs(output_dir)
+            timings = NaiveExporter.export2backend(
+                output_dir,
+                build_classifier,
+                config,
+                {"img": [torch.zeros((50, 50, 3))], "img_metas": []},
+                export_type="ONNX",
+                cache_dir=cache_dir,
+            )
+            assert set(timings) == {"build", "trace"}
+            assert len(os.listdir(cache_dir)) == 1
+
+            spy = mocker.spy(NaiveExporter, "torch2onnx")
+            output_dir = os.path.join(tempdir, "second")
+            os.makedirs(output_dir)
+            timings = NaiveExporter.export2backend(
+                output_dir,
+                build_classifier,
+                config,
+                {"img": [torch.zeros((50, 50, 3))], "img_metas": []},
+                precision=["FP32", "FP16"],
+                cache_dir=cache_dir,
+            )
+            spy.assert_not_called()
+            assert set(timings) == {"build", "trace", "mo"}
+            assert os.path.exists(os.path.join(output_dir, "model.onnx"))
+            for precision in ("FP32", "FP16"):
+                assert os.path.exists(os.path.join(output_dir, precision, "model.xml"))
+                assert os.path.exists(os.path.join(output_dir, precision, "model.bin"))
+
+    @e2e_pytest_unit
+    def test_get_cache_key(self, mocker):
+        from otx.algorithms.classification.adapters.mmcls.utils.builder import (
+            build_classifier,
+        )
+
+        config = create_config()
+        create_model("mmcls")
+        model = build_classifier(config).cpu().eval()
+        input_data = {"img": [torch.zeros((1, 3, 50, 50))]}
+
+        key = NaiveExporter.get_cache_key(model, config, input_data)
+        assert NaiveExporter.get_cache_key(model, config, input_data) == key
+        assert NaiveExporter.get_cache_key(model, config, input_data, opset_version=13) != key
+
+        mocker.patch(
+            "otx.algorithms.common.adapters.mmdeploy.apis._get_package_versions", return_value={"mmcv-full": "0.0.0"}
+        )
+        assert NaiveExporter.get_cache_key(model, config, input_data) != key
+
+    @e2e_pytest_unit
+    def test_export2backend_cache_eviction(self, mocker):
+        from otx.algorithms.classification.adapters.mmcls.utils.builder import (
+            build_classifier,
+        )
+
+        config = create_config()
+        create_model("mmcls")
+        mocker.patch("otx.algorithms.common.adapters.mmdeploy.apis.EXPORT_CACHE_SIZE", 1)
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            cache_dir = os.path.join(tempdir, "cache")
+            for opset_version in (11, 12):
+                output_dir = os.path.join(tempdir, str(opset_version))
+                os.makedirs(output_dir)
+                NaiveExporter.export2backend(
+                    output_dir,
+                    build_classifier,
+                    config,
+                    {"img": [torch.zeros((50, 50, 3))], "img_metas": []},
+                    opset_version=opset_version,
+                    export_type="ONNX",
+                    cache_dir=cache_dir,
+                )
+                assert os.path.exists(os.path.join(output_dir, "model.onnx"))
+                # the cache never grows beyond the size limit
+                assert os.listdir(cache_dir) == []
+
 
 if is_mmdeploy_enabled():
     from mmdeploy.core import FUNCTION_REWRITER, mark
@@ -42,3 +42,13 @@ class TestClsIncrSampler:
             count += 1
 
         assert count == len(sampler)
+
+    @e2e_pytest_unit
+    def test_sampler_iter_old_new_per_trial(self):
+        sampler = ClsIncrSampler(self.mock_dataset, 4, efficient_mode=True, drop_last=True)
+        indices = list(iter(sampler))
+
+        assert len(indices) == len(sampler)
+        for trial in range(len(indices) // 2):
+            new, old = indices[trial * 2 : trial * 2 + 2]
+            assert 6 <= new < 10 and 0 <= old < 6
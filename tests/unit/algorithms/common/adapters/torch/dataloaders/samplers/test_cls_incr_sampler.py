@@ -38,3 +38,13 @@ class TestBalancedSampler:
             count += 1
 
         assert count == len(sampler)
+
+    @e2e_pytest_unit
+    def test_sampler_iter_balanced_per_trial(self):
+        sampler = BalancedSampler(self.mock_dataset, 4)
+        indices = list(iter(sampler))
+
+        assert len(indices) == sampler.num_trials * sampler.num_cls
+        for trial in range(sampler.num_trials):
+            foo, bar = indices[trial * 2 : trial * 2 + 2]
+            assert 0 <= foo < 6 and 6 <= bar < 10
@@ -0,0 +1,52 @@
+import pytest
+
+from otx.algorithms.common.adapters.torch.dataloaders import ComposedDL
+from tests.test_suite.e2e_test_system import e2e_pytest_unit
+
+
+class TestComposedDL:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.labeled = [{"img": i} for i in range(5)]
+        self.unlabeled = list(range(3))
+        self.extra = list(range(100, 102))
+
+    @e2e_pytest_unit
+    @pytest.mark.parametrize("num_prefetch", [0, 2])
+    def test_iter(self, num_prefetch):
+        cdl = ComposedDL([self.labeled, self.unlabeled, self.extra], ratios=[2, 1], num_prefetch=num_prefetch)
+
+        for _ in range(2):
+            batches = list(cdl)
+
+            assert len(batches) == len(cdl) == 5
+            assert [batch["img"] for batch in batches] == list(range(5))
+            assert [batch["extra_0"] for batch in batches] == [[0, 1], [2, 0], [1, 2], [0, 1], [2, 0]]
+            assert [batch["extra_1"] for batch in batches] == [100, 101, 100, 101, 100]
+            assert len(cdl.wait_times) == 3
+
+    @e2e_pytest_unit
+    def test_iter_with_loader_error(self):
+        def failing_loader():
+            yield 0
+            raise RuntimeError("failed")
+
+        class FailingLoader:
+            def __iter__(self):
+                return failing_loader()
+
+        cdl = ComposedDL([self.labeled, FailingLoader()], num_prefetch=1)
+        with pytest.raises(RuntimeError):
+            list(cdl)
+
+    @e2e_pytest_unit
+    @pytest.mark.parametrize("num_prefetch", [0, 2])
+    def test_iter_with_empty_extra_loader(self, num_prefetch):
+        cdl = ComposedDL([self.labeled, []], num_prefetch=num_prefetch)
+        with pytest.raises(RuntimeError):
+            list(cdl)
+
+    @e2e_pytest_unit
+    def test_init_with_wrong_ratios(self):
+        with pytest.raises(ValueError):
+            ComposedDL([self.labeled, self.unlabeled], ratios=[0])
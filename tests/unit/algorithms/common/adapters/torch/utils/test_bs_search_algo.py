@@ -1,3 +1,5 @@
+import time
+
 import pytest
 
 from otx.algorithms.common.adapters.torch.utils import BsSearchAlgo
@@ -121,3 +123,44 @@ class TestBsSearchAlgo:
         adapted_bs = bs_search_algo.find_big_enough_batch_size(True)
 
         assert adapted_bs == 100
+
+    def test_auto_decrease_batch_size_cpu(self, mocker):
+        self.mock_torch.cuda.is_available.return_value = False
+        mocker.patch.object(bs_search_algo.psutil, "virtual_memory").return_value.available = 10**9
+        mocker.patch.object(bs_search_algo, "_get_process_tree_rss", return_value=1000)
+        mock_rss_monitor = mocker.patch.object(bs_search_algo, "_PeakRssMonitor").return_value
+
+        def mock_train_func(batch_size):
+            if batch_size > 100:
+                raise RuntimeError("DefaultCPUAllocator: can't allocate memory")
+            mock_rss_monitor.peak_rss = 100 * batch_size
+
+        bs_search_algo_cpu = BsSearchAlgo(mock_train_func, 128, 1000, mem_budget=10000)
+        adapted_bs = bs_search_algo_cpu.auto_decrease_batch_size()
+
+        assert adapted_bs == 84
+        self.mock_torch.cuda.max_memory_allocated.assert_not_called()
+
+    def test_auto_decrease_batch_size_cpu_sequential_trials(self, mocker):
+        self.mock_torch.cuda.is_available.return_value = False
+        mocker.patch.object(bs_search_algo.psutil, "virtual_memory").return_value.available = 9000
+        base_rss = 1000
+        process = {"rss": base_rss}
+        mocker.patch.object(bs_search_algo, "_get_process_tree_rss", side_effect=lambda: process["rss"])
+
+        def required_rss(batch_size):
+            return base_rss + 100 * batch_size
+
+        def mock_train_func(batch_size):
+            process["rss"] = max(process["rss"], required_rss(batch_size))
+            time.sleep(0.2)
+            # Half of the memory used by the trial isn't returned to the OS
+            process["rss"] = base_rss + (process["rss"] - base_rss) // 2
+
+        bs_search_algo_cpu = BsSearchAlgo(mock_train_func, 128, 1000, mem_budget=10000)
+        adapted_bs = bs_search_algo_cpu.auto_decrease_batch_size()
+
+        assert adapted_bs == 74
+        assert len(bs_search_algo_cpu._bs_try_history) > 1
+        for batch_size, mem_usage in bs_search_algo_cpu._bs_try_history.items():
+            assert mem_usage >= required_rss(batch_size)
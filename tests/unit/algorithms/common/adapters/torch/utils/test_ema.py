@@ -0,0 +1,19 @@
+import torch
+
+from otx.algorithms.common.adapters.torch.utils import ema_update_
+from tests.test_suite.e2e_test_system import e2e_pytest_unit
+
+
+@e2e_pytest_unit
+def test_ema_update():
+    src = [torch.rand(3, 4), torch.rand(5), torch.tensor(10)]
+    dst = [torch.rand(3, 4), torch.rand(5), torch.tensor(0)]
+    expected = [d * 0.9 + s * 0.1 for d, s in zip(dst, src)]
+    dst_ids = [id(d) for d in dst]
+
+    ema_update_(dst, src, 0.1)
+
+    assert [id(d) for d in dst] == dst_ids
+    assert torch.allclose(dst[0], expected[0])
+    assert torch.allclose(dst[1], expected[1])
+    assert dst[2].dtype == torch.int64 and dst[2].item() == 1
@@ -0,0 +1,118 @@
+import os
+
+import numpy as np
+import pytest
+
+from otx.algorithms.common.utils.calibration import CalibrationDataLoader
+from otx.algorithms.common.utils.data import get_stratified_indices
+from otx.api.entities.annotation import (
+    Annotation,
+    AnnotationSceneEntity,
+    AnnotationSceneKind,
+)
+from otx.api.entities.dataset_item import DatasetItemEntity
+from otx.api.entities.datasets import DatasetEntity
+from otx.api.entities.image import Image
+from otx.api.entities.label import Domain, LabelEntity
+from otx.api.entities.scored_label import ScoredLabel
+from otx.api.entities.shapes.rectangle import Rectangle
+from tests.test_suite.e2e_test_system import e2e_pytest_unit
+
+
+class FakeInferencer:
+    def __init__(self):
+        self.model = None
+        self.num_calls = 0
+
+    def pre_process(self, image):
+        self.num_calls += 1
+        return {"image": image[:4, :4].astype(np.float32)}, {"original_shape": image.shape}
+
+
+def generate_dataset(num_items_per_label=(30, 10)) -> DatasetEntity:
+    labels = [LabelEntity(name=f"label_{i}", domain=Domain.CLASSIFICATION, id=str(i)) for i in range(2)]
+    items = []
+    for label, num_items in zip(labels, num_items_per_label):
+        for _ in range(num_items):
+            annotation = Annotation(Rectangle.generate_full_box(), labels=[ScoredLabel(label, probability=1.0)])
+            items.append(
+                DatasetItemEntity(
+                    media=Image(data=np.random.randint(0, 255, (8, 8, 3), dtype=np.uint8)),
+                    annotation_scene=AnnotationSceneEntity([annotation], kind=AnnotationSceneKind.ANNOTATION),
+                )
+            )
+    return DatasetEntity(items)
+
+
+@e2e_pytest_unit
+def test_get_stratified_indices():
+    dataset = generate_dataset()
+
+    indices = get_stratified_indices(dataset, 8)
+    assert indices == sorted(indices)
+    assert len(indices) == 8
+    assert sum(index < 30 for index in indices) == 6
+    assert get_stratified_indices(dataset, 8) == indices
+    assert get_stratified_indices(dataset, 8, seed=1) != indices
+    assert get_stratified_indices(dataset, 100) == list(range(40))
+
+
+class TestCalibrationDataLoader:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.cache_dir = str(tmp_path / "calibration")
+        self.dataset = generate_dataset()
+
+    @e2e_pytest_unit
+    def test_getitem(self):
+        inferencer = FakeInferencer()
+        data_loader = CalibrationDataLoader(self.dataset, inferencer, 8, cache_dir=self.cache_dir)
+        assert len(data_loader) == 8
+        assert inferencer.num_calls == 0
+
+        (index, annotation), inputs, metadata = data_loader[3]
+        item = self.dataset[data_loader.indices[3]]
+        assert index == 3
+        assert annotation is item.annotation_scene
+        assert np.array_equal(inputs["image"], item.numpy[:4, :4])
+        assert metadata == {"original_shape": (8, 8, 3)}
+        assert inferencer.num_calls == 1
+
+    @e2e_pytest_unit
+    def test_cache(self):
+        inferencer = FakeInferencer()
+        expected = CalibrationDataLoader(self.dataset, inferencer, 8, cache_dir=self.cache_dir)[5]
+
+        cached = CalibrationDataLoader(self.dataset, inferencer, 8, cache_dir=self.cache_dir)[5]
+        assert inferencer.num_calls == 1
+        assert np.array_equal(cached[1]["image"], expected[1]["image"])
+        assert cached[2] == expected[2]
+
+        # Other items are preprocessed again
+        CalibrationDataLoader(self.dataset, inferencer, 9, cache_dir=self.cache_dir)[5]
+        assert inferencer.num_calls == 2
+
+        # No cache
+        CalibrationDataLoader(self.dataset, inferencer, 8, cache_dir=None)[5]
+        assert inferencer.num_calls == 3
+
+    @e2e_pytest_unit
+    def test_cache_eviction(self, mocker):
+        inferencer = FakeInferencer()
+        CalibrationDataLoader(self.dataset, inferencer, 8, cache_dir=self.cache_dir)[0]
+        CalibrationDataLoader(self.dataset, inferencer, 9, cache_dir=self.cache_dir)[0]
+        assert len(os.listdir(self.cache_dir)) == 2
+
+        mocker.patch("otx.algorithms.common.utils.calibration.CALIBRATION_CACHE_SIZE", 0)
+        CalibrationDataLoader(self.dataset, inferencer, 8, cache_dir=self.cache_dir)
+        assert os.listdir(self.cache_dir) == []
+
+    @e2e_pytest_unit
+    def test_uncached_metadata(self, mocker):
+        inferencer = FakeInferencer()
+        mocker.patch.object(
+            inferencer, "pre_process", side_effect=lambda image: ({"image": image}, {"object": object()})
+        )
+        CalibrationDataLoader(self.dataset, inferencer, 8, cache_dir=self.cache_dir)[0]
+        CalibrationDataLoader(self.dataset, inferencer, 8, cache_dir=self.cache_dir)[0]
+        assert inferencer.pre_process.call_count == 2
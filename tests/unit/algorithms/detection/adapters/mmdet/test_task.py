@@ -306,6 +306,50 @@ class TestMMDetectionTask:
         self.iseg_task.evaluate(resultset)
         assert resultset.performance.score.value == 1.0
 
+    @e2e_pytest_unit
+    def test_det_add_predictions_to_dataset(self) -> None:
+        """Test boxes are thresholded, clipped and filtered in one shot."""
+
+        all_results = [
+            np.array([[-10, 10, 50, 60, 0.9], [10, 10, 10, 60, 0.9]], dtype=np.float32),
+            np.zeros((0, 5), dtype=np.float32),
+            np.array([[0, 0, 100, 200, 0.3], [20, 20, 40, 40, 0.6]], dtype=np.float32),
+        ]
+        shapes = self.det_task._det_add_predictions_to_dataset(all_results, 100, 100, 0.5)
+
+        assert len(shapes) == 2
+        assert [shape.get_labels()[0].label for shape in shapes] == [self.det_task._labels[0], self.det_task._labels[2]]
+        assert shapes[0].shape.x1 == 0.0 and shapes[0].shape.y2 == 0.6
+        assert shapes[1].get_labels()[0].probability == pytest.approx(0.6)
+
+    @e2e_pytest_unit
+    def test_ins_seg_add_predictions_to_dataset(self) -> None:
+        """Test contours of the cropped masks are the same as contours of the full masks."""
+        import cv2
+        import pycocotools.mask as mask_util
+
+        masks = np.zeros((4, 64, 80), dtype=bool)
+        masks[0, 10:30, 20:50] = True
+        masks[1, 40:64, 0:10] = True
+        masks[1, 45:50, 3:6] = False
+        masks[2, 5:9, 60:80] = True
+        boxes = np.array([[0, 0, 1, 1, 0.9], [0, 0, 1, 1, 0.8], [0, 0, 1, 1, 0.1], [0, 0, 1, 1, 0.7]])
+        rle_masks = [mask_util.encode(np.asfortranarray(mask.astype(np.uint8))) for mask in masks]
+        all_results = ([boxes], [list(masks)])
+        rle_results = ([boxes], [rle_masks])
+
+        for mask in masks[:2]:
+            cropped, offset = self.iseg_task._crop_mask(mask)
+            contours, _ = cv2.findContours(cropped, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE, offset=offset)
+            full_contours, _ = cv2.findContours(mask.astype(np.uint8), cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE)
+            assert all(np.array_equal(c, f) for c, f in zip(contours, full_contours))
+        assert self.iseg_task._crop_mask(masks[3]) is None
+
+        shapes = self.iseg_task._ins_seg_add_predictions_to_dataset(all_results, 80, 64, 0.5)
+        rle_shapes = self.iseg_task._ins_seg_add_predictions_to_dataset(rle_results, 80, 64, 0.5)
+        assert len(shapes) == 2
+        assert [shape.shape.points for shape in shapes] == [shape.shape.points for shape in rle_shapes]
+
     @pytest.mark.parametrize("precision", [ModelPrecision.FP16, ModelPrecision.FP32])
     @e2e_pytest_unit
     def test_export(self, mocker, precision: ModelPrecision, export_type: ExportType = ExportType.OPENVINO) -> None:
@@ -4,18 +4,33 @@
 import os
 import tempfile
 
+import cv2
+import numpy as np
 import pytest
 
 from otx.algorithms.detection.utils import generate_label_schema
 from otx.algorithms.detection.utils.data import (
+    adaptive_tile_params,
     find_label_by_name,
     format_list_to_str,
     get_anchor_boxes,
+    get_dataset_profile,
     get_sizes_from_dataset_entity,
+    get_sizes_from_profile,
     load_dataset_items_coco_format,
 )
-from otx.api.entities.label import Domain
+from otx.api.entities.annotation import (
+    Annotation,
+    AnnotationSceneEntity,
+    AnnotationSceneKind,
+)
+from otx.api.entities.dataset_item import DatasetItemEntity
+from otx.api.entities.datasets import DatasetEntity
+from otx.api.entities.image import Image
+from otx.api.entities.label import Domain, LabelEntity
 from otx.api.entities.model_template import TaskType, task_type_to_label_domain
+from otx.api.entities.scored_label import ScoredLabel
+from otx.api.entities.shapes.rectangle import Rectangle
 from otx.api.entities.subset import Subset
 from tests.test_suite.e2e_test_system import e2e_pytest_unit
 from tests.unit.algorithms.detection.test_helpers import (
@@ -79,6 +94,76 @@ def test_get_anchor_boxes():
     assert out == expected_out
 
 
+@e2e_pytest_unit
+def test_get_dataset_profile():
+    dataset, _ = generate_det_dataset(task_type=TaskType.DETECTION, number_of_images=5)
+    wh_stats = get_sizes_from_dataset_entity(dataset, [1, 1])
+    with tempfile.TemporaryDirectory() as cache_dir:
+        profile = get_dataset_profile(dataset, Domain.DETECTION, cache_dir=cache_dir)
+        assert len(os.listdir(cache_dir)) == 1
+        cached_profile = get_dataset_profile(dataset, Domain.DETECTION, cache_dir=cache_dir)
+
+    assert profile.keys() == cached_profile.keys()
+    for key, value in profile.items():
+        assert np.array_equal(value, cached_profile[key])
+
+    areas = [w * h * 640 * 480 for w, h in wh_stats]
+    assert int(profile["num_boxes"]) == len(areas)
+    assert np.isclose(profile["area_min"], min(areas))
+    assert np.isclose(profile["area_max"], max(areas))
+    assert profile["box_count_hist"].sum() == 5
+    assert np.array_equal(profile["image_wh_max"], [640, 480])
+
+    sizes, counts = get_sizes_from_profile(profile, [640, 480])
+    assert counts.sum() == len(wh_stats)
+    assert len(sizes) == len(counts)
+
+
+@e2e_pytest_unit
+def test_get_dataset_profile_cache_invalidation(tmp_path):
+    label = LabelEntity(name="box", domain=Domain.DETECTION)
+    image_path = str(tmp_path / "image.png")
+    cv2.imwrite(image_path, np.zeros((10, 20, 3), dtype=np.uint8))
+    annotation = Annotation(Rectangle(x1=0.0, y1=0.0, x2=0.5, y2=0.5), labels=[ScoredLabel(label)])
+    item = DatasetItemEntity(
+        media=Image(file_path=image_path),
+        annotation_scene=AnnotationSceneEntity(annotations=[annotation], kind=AnnotationSceneKind.ANNOTATION),
+    )
+    cache_dir = str(tmp_path / "cache")
+    profile = get_dataset_profile(DatasetEntity([item]), Domain.DETECTION, cache_dir=cache_dir)
+    assert np.isclose(profile["area_max"], 50)
+
+    # The same annotations on a larger image of the same path should not hit the cache
+    cv2.imwrite(image_path, np.zeros((100, 200, 3), dtype=np.uint8))
+    item = DatasetItemEntity(media=Image(file_path=image_path), annotation_scene=item.annotation_scene)
+    profile = get_dataset_profile(DatasetEntity([item]), Domain.DETECTION, cache_dir=cache_dir)
+    assert np.isclose(profile["area_max"], 5000)
+    assert len(os.listdir(cache_dir)) == 2
+
+
+@e2e_pytest_unit
+def test_adaptive_tile_params_without_objects(mocker):
+    dataset, _ = generate_det_dataset(task_type=TaskType.DETECTION, number_of_images=2)
+    for item in dataset:
+        item.annotation_scene.annotations = []
+    tiling_parameters = mocker.MagicMock(tile_size=400, tile_overlap=0.2, tile_max_number=1500)
+
+    adaptive_tile_params(tiling_parameters, dataset)
+
+    assert (tiling_parameters.tile_size, tiling_parameters.tile_overlap, tiling_parameters.tile_max_number) == (
+        400,
+        0.2,
+        1500,
+    )
+
+
+@e2e_pytest_unit
+def test_get_anchor_boxes_weighted():
+    out = get_anchor_boxes([(100, 120), (10, 12), (12, 10)], [1, 1], weights=[5, 1, 1])
+    expected_out = ([[11.0], [100.0]], [[11.0], [120.0]])
+    assert out == expected_out
+
+
 @e2e_pytest_unit
 def test_format_list_to_str():
     out = format_list_to_str([[0.1839128319, 0.47398123]])
@@ -95,6 +95,23 @@ class TestOTXSegmentationTask:
         )
         assert predicted_dataset[0].annotation_scene.annotations[0]
 
+    @e2e_pytest_unit
+    def test_infer_soft_prediction(self):
+        dataset = generate_otx_dataset(5)
+        predicted_dataset = self.seg_task.infer(
+            dataset.with_empty_annotations(), inference_parameters=InferenceParameters(is_evaluation=False)
+        )
+        soft_predictions = [
+            metadata.data
+            for metadata in predicted_dataset[0].get_metadata()
+            if getattr(metadata.data, "type", None) == "soft_prediction"
+        ]
+        assert len(soft_predictions) == 3
+        for soft_prediction in soft_predictions:
+            assert soft_prediction.raw_numpy.dtype == np.uint8
+            assert soft_prediction.raw_numpy.shape == (128, 128)
+            assert soft_prediction.numpy.shape == (128, 128, 3)
+
     @e2e_pytest_unit
     def test_evaluate(self, mocker):
         class _MockScoreMetric:
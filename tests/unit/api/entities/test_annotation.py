@@ -268,6 +268,40 @@ class TestAnnotation:
         assert "name=person" in str(annotation.get_labels())
         assert "name=car" not in str(annotation.get_labels())  # car_label is empty
 
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_annotation_memory_layout(self):
+        """
+        <b>Description:</b>
+        Check Annotation and its shapes and labels are slotted and share labels and timestamps
+
+        <b>Expected results:</b>
+        Test passes if the entities have no instance dictionary, deep copies keep the label entities
+        and shapes created together share their modification date object
+
+        <b>Steps</b>
+        1. Create Annotation instances
+        2. Check instance dictionaries
+        3. Deep copy the annotation and check labels
+        """
+        import copy
+
+        polygon = Polygon(points=[Point(0.1, 0.2), Point(0.5, 0.3), Point(0.3, 0.8)])
+        ellipse = Ellipse(x1=0.5, y1=0.1, x2=0.8, y2=0.3)
+        annotation = Annotation(shape=self.rectangle, labels=self.labels2)
+        entities = [annotation, annotation.get_labels()[0], annotation.id_, self.rectangle, polygon, ellipse]
+        for entity in entities:
+            assert not hasattr(entity, "__dict__")
+
+        annotation_copy = copy.deepcopy(annotation)
+        assert annotation_copy == annotation
+        assert annotation_copy.get_labels()[0].label is annotation.get_labels()[0].label
+
+        shapes = [Rectangle(x1=0.1, y1=0.1, x2=0.2, y2=0.2) for _ in range(2)]
+        if shapes[0].modification_date == shapes[1].modification_date:
+            assert shapes[0].modification_date is shapes[1].modification_date
+
 
 @pytest.mark.components(OtxSdkComponent.OTX_API)
 class TestAnnotationSceneKind:
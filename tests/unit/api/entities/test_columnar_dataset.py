@@ -0,0 +1,200 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import copy
+
+import numpy as np
+import pytest
+
+from otx.api.entities.annotation import (
+    Annotation,
+    AnnotationSceneEntity,
+    AnnotationSceneKind,
+)
+from otx.api.entities.columnar_dataset import (
+    ColumnarAnnotations,
+    ColumnarDatasetEntity,
+    ColumnarDatasetItemEntity,
+)
+from otx.api.entities.dataset_item import DatasetItemEntity
+from otx.api.entities.datasets import DatasetEntity, DatasetPurpose
+from otx.api.entities.scored_label import ScoredLabel
+from otx.api.entities.shapes.ellipse import Ellipse
+from otx.api.entities.shapes.polygon import Point, Polygon
+from otx.api.entities.shapes.rectangle import Rectangle
+from otx.api.entities.subset import Subset
+from tests.unit.api.constants.components import OtxSdkComponent
+from tests.unit.api.constants.requirements import Requirements
+from tests.unit.api.entities.test_dataset_item import DatasetItemParameters
+
+
+@pytest.mark.components(OtxSdkComponent.OTX_API)
+class TestColumnarDatasetEntity:
+    @staticmethod
+    def dataset() -> DatasetEntity:
+        parameters = DatasetItemParameters()
+        labels = parameters.labels()
+        items = [parameters.default_values_dataset_item(), parameters.dataset_item()]
+        polygon = Polygon(points=[Point(0.1, 0.2), Point(0.5, 0.3), Point(0.3, 0.8)])
+        annotations = [
+            Annotation(polygon, labels=[ScoredLabel(labels[0], probability=0.5)]),
+            Annotation(Ellipse(x1=0.1, y1=0.1, x2=0.4, y2=0.3), labels=[ScoredLabel(labels[0])]),
+            Annotation(Rectangle.generate_full_box(), labels=[ScoredLabel(labels[0])]),
+        ]
+        items.append(
+            DatasetItemEntity(
+                media=parameters.generate_random_image(),
+                annotation_scene=AnnotationSceneEntity(annotations, kind=AnnotationSceneKind.PREDICTION),
+                metadata=parameters.metadata(),
+                subset=Subset.VALIDATION,
+            )
+        )
+        return DatasetEntity(items, DatasetPurpose.TEMPORARY_DATASET)
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_columnar_annotations(self):
+        """
+        <b>Description:</b>
+        Check ColumnarAnnotations encodes shapes and labels into arrays and builds them back
+
+        <b>Expected results:</b>
+        Test passes if arrays have expected offsets and the built annotations match the original ones
+        """
+        dataset = self.dataset()
+        columns = ColumnarAnnotations.from_annotation_lists(item.annotation_scene.annotations for item in dataset)
+        assert columns.num_items == 3
+        assert len(columns) == 7
+        assert columns.item_offsets.tolist() == [0, 2, 4, 7]
+        assert columns.boxes.dtype == np.float32
+        assert columns.points.shape == (3, 2)
+        assert columns.point_offsets.tolist() == [0, 0, 0, 0, 0, 3, 3, 3]
+
+        all_annotations = [annotation for item in dataset for annotation in item.annotation_scene.annotations]
+        for row, annotation in enumerate(all_annotations):
+            built = columns.annotation(row)
+            assert type(built.shape) is type(annotation.shape)
+            assert built.get_labels(include_empty=True) == annotation.get_labels(include_empty=True)
+        assert columns.annotation(4).shape.points[1].x == pytest.approx(0.5)
+
+        taken = columns.take(np.array([2]))
+        assert taken.item_offsets.tolist() == [0, 3]
+        assert taken.points.shape == (3, 2)
+        assert ColumnarAnnotations.concatenate([columns, taken]).item_offsets.tolist() == [0, 2, 4, 7, 10]
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_columnar_dataset_items(self):
+        """
+        <b>Description:</b>
+        Check items of ColumnarDatasetEntity are served as DatasetItemEntity views
+
+        <b>Expected results:</b>
+        Test passes if the views have the media, subset, ROI, metadata and labels of the original items
+        """
+        dataset = self.dataset()
+        columnar_dataset = ColumnarDatasetEntity.from_dataset(dataset)
+        assert len(columnar_dataset) == len(dataset)
+        assert columnar_dataset.purpose == DatasetPurpose.TEMPORARY_DATASET
+        assert ColumnarDatasetEntity.from_dataset(columnar_dataset) is columnar_dataset
+
+        for item, view in zip(dataset, columnar_dataset):
+            assert view.media is item.media
+            assert view.subset == item.subset
+            assert view.annotation_scene.kind == item.annotation_scene.kind
+            assert view.annotation_scene.get_labels(include_empty=True) == item.annotation_scene.get_labels(
+                include_empty=True
+            )
+            assert view.roi.get_labels(include_empty=True) == item.roi.get_labels(include_empty=True)
+            assert view.roi.shape.x1 == item.roi.shape.x1 and view.roi.shape.y2 == item.roi.shape.y2
+            assert len(view.get_metadata()) == len(item.get_metadata())
+        assert columnar_dataset[0] == columnar_dataset[0]
+
+        last = columnar_dataset[-1]
+        assert last.roi is last.annotation_scene.annotations[2]
+        with pytest.raises(IndexError):
+            columnar_dataset[3]
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_columnar_dataset_queries(self):
+        """
+        <b>Description:</b>
+        Check bulk queries and modifications of ColumnarDatasetEntity
+
+        <b>Expected results:</b>
+        Test passes if subsets, labels and label counts match the ones of DatasetEntity
+        """
+        dataset = self.dataset()
+        columnar_dataset = ColumnarDatasetEntity.from_dataset(dataset)
+        labels = DatasetItemParameters.labels()
+
+        for subset in (Subset.NONE, Subset.VALIDATION, Subset.TESTING):
+            columnar_subset = columnar_dataset.get_subset(subset)
+            assert isinstance(columnar_subset, ColumnarDatasetEntity)
+            assert [item.media for item in columnar_subset] == [item.media for item in dataset.get_subset(subset)]
+
+        assert set(columnar_dataset.get_labels()) == set(dataset.get_labels())
+        assert set(columnar_dataset.get_labels(include_empty=True)) == set(dataset.get_labels(include_empty=True))
+        assert columnar_dataset.get_label_counts() == {labels[0]: 5}
+        assert columnar_dataset.get_label_counts(include_empty=True) == {labels[0]: 5, labels[1]: 2}
+
+        empty_dataset = columnar_dataset.with_empty_annotations()
+        assert len(empty_dataset) == 3
+        assert all(len(item.annotation_scene.annotations) == 0 for item in empty_dataset)
+
+        merged = columnar_dataset + columnar_dataset.get_subset(Subset.VALIDATION)
+        assert isinstance(merged, ColumnarDatasetEntity)
+        assert len(merged) == 4
+        assert merged.get_label_counts() == {labels[0]: 8}
+
+        merged.remove_at_indices([0, 3])
+        assert [item.subset for item in merged] == [Subset.TESTING, Subset.VALIDATION]
+        merged.append(dataset[0])
+        assert len(merged) == 3
+        merged.remove(merged[1])
+        assert [item.subset for item in merged] == [Subset.TESTING, Subset.NONE]
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_columnar_dataset_read_only_items(self):
+        """
+        <b>Description:</b>
+        Check items of ColumnarDatasetEntity can't be edited
+
+        <b>Expected results:</b>
+        Test passes if editing the annotations or the subset of a view raises a TypeError, without changing the
+        dataset, and a wrapped or copied view is a regular editable DatasetItemEntity
+        """
+        columnar_dataset = ColumnarDatasetEntity.from_dataset(self.dataset())
+        view = columnar_dataset[0]
+        assert isinstance(view, ColumnarDatasetItemEntity)
+        num_annotations = len(view.annotation_scene.annotations)
+
+        with pytest.raises(TypeError):
+            view.subset = Subset.TRAINING
+        with pytest.raises(TypeError):
+            view.annotation_scene = AnnotationSceneEntity(annotations=[], kind=AnnotationSceneKind.PREDICTION)
+        with pytest.raises(TypeError):
+            view.roi = None
+        with pytest.raises(TypeError):
+            view.ignored_labels = set()
+        with pytest.raises(TypeError):
+            view.annotation_scene.append_annotation(view.annotation_scene.annotations[0])
+        with pytest.raises(TypeError):
+            view.annotation_scene.kind = AnnotationSceneKind.PREDICTION
+        view.annotation_scene.annotations.clear()
+        assert len(view.annotation_scene.annotations) == num_annotations
+        assert columnar_dataset[0].subset == view.subset
+
+        for item in (view.wrap(subset=Subset.TRAINING), copy.deepcopy(view)):
+            assert type(item) is DatasetItemEntity
+            item.subset = Subset.VALIDATION
+            assert item.subset == Subset.VALIDATION
+            assert item.annotation_scene is view.annotation_scene
+        assert columnar_dataset[0].subset == view.subset
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import copy
 from typing import List
 
 import pytest
@@ -9,7 +10,7 @@ import pytest
 from otx.api.entities.annotation import AnnotationSceneEntity, AnnotationSceneKind
 from otx.api.entities.dataset_item import DatasetItemEntity
 from otx.api.entities.datasets import DatasetEntity, DatasetPurpose
-from otx.api.entities.label import LabelEntity
+from otx.api.entities.label import Domain, LabelEntity
 from otx.api.entities.subset import Subset
 from tests.unit.api.constants.components import OtxSdkComponent
 from tests.unit.api.constants.requirements import Requirements
@@ -629,3 +630,101 @@ class TestDatasetEntity:
         assert isinstance(actual_empty_labels, list)
         assert segmentation_empty_label in actual_empty_labels
         assert detection_label in actual_empty_labels
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_dataset_entity_get_item_indices_with_labels(self):
+        """
+        <b>Description:</b>
+        Check DatasetEntity "get_item_indices_with_labels" method returns the items containing any of the labels
+
+        <b>Input data:</b>
+        DatasetEntity class object with specified "items" and "purpose" parameters
+
+        <b>Expected results:</b>
+        Test passes if "get_item_indices_with_labels" and "get_labels" return the same results as scanning the items,
+        after adding and removing items, and after "reindex" when items are modified in place
+
+        <b>Steps</b>
+        1. Check queries on initial dataset
+        2. Check queries after "append", "remove" and "remove_at_indices"
+        3. Check queries after changing annotations and labels of items in place and calling "reindex"
+        """
+
+        def check_queries(dataset):
+            for include_empty in (False, True):
+                for label in labels:
+                    assert dataset.get_item_indices_with_labels([label], include_empty) == [
+                        i
+                        for i, item in enumerate(dataset)
+                        if label in item.annotation_scene.get_labels(include_empty=include_empty)
+                    ]
+            assert dataset.get_item_indices_with_labels(labels, include_empty=True) == [
+                i for i, item in enumerate(dataset) if item.annotation_scene.contains_any(labels)
+            ]
+
+        labels = self.labels()
+        dataset = self.dataset()
+        # Checking queries on initial dataset
+        check_queries(dataset)
+        # Checking queries after "append", "remove" and "remove_at_indices"
+        dataset.append(self.dataset_item())
+        dataset.append(self.default_values_dataset_item())
+        check_queries(dataset)
+        dataset.remove(dataset[1])
+        check_queries(dataset)
+        dataset.remove_at_indices([0, 2])
+        assert len(dataset) == 2
+        check_queries(dataset)
+        # Checking queries after changing annotations and labels of items in place
+        dataset[0].annotation_scene = AnnotationSceneEntity(annotations=[], kind=AnnotationSceneKind.ANNOTATION)
+        dataset.reindex()
+        check_queries(dataset)
+        dataset[0].annotation_scene.annotations.extend(self.annotations_entity().annotations)
+        dataset.reindex()
+        assert set(dataset.get_labels()) == set(dataset[0].annotation_scene.get_labels()) | set(
+            dataset[1].annotation_scene.get_labels()
+        )
+        check_queries(dataset)
+        scored_label = dataset[0].annotation_scene.annotations[0].get_labels()[0]
+        new_label = LabelEntity(name="new_label", domain=Domain.DETECTION)
+        scored_label.label = new_label
+        assert new_label not in dataset.get_labels()
+        dataset.reindex()
+        assert new_label in dataset.get_labels()
+        assert dataset.get_item_indices_with_labels([new_label]) == [0]
+        check_queries(dataset)
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_dataset_entity_reindex(self):
+        """
+        <b>Description:</b>
+        Check DatasetEntity "reindex" method updates the index after items are modified in place
+
+        <b>Input data:</b>
+        DatasetEntity class object with specified "items" and "purpose" parameters
+
+        <b>Expected results:</b>
+        Test passes if "get_subset" and "remove" use the index, which is updated by "reindex"
+
+        <b>Steps</b>
+        1. Check "get_subset" before and after changing the subset of an item and calling "reindex"
+        2. Check "remove" removes the given item rather than an equal one
+        """
+        dataset = self.dataset()
+        assert len(dataset.get_subset(Subset.VALIDATION)) == 1
+        # Checking "get_subset" before and after changing the subset of an item and calling "reindex"
+        dataset[0].subset = Subset.VALIDATION
+        assert list(dataset.get_subset(Subset.VALIDATION)) == [dataset[2]]
+        dataset.reindex()
+        assert list(dataset.get_subset(Subset.VALIDATION)) == [dataset[0], dataset[2]]
+        # Checking "remove" removes the given item rather than an equal one
+        item = copy.copy(dataset[2])
+        assert item == dataset[2]
+        dataset.append(item)
+        dataset.remove(item)
+        assert len(dataset) == 3
+        assert dataset[2] is not item
@@ -0,0 +1,218 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import os
+
+import numpy as np
+import pytest
+
+from otx.api.entities.annotation import AnnotationSceneEntity, AnnotationSceneKind
+from otx.api.entities.dataset_item import DatasetItemEntity
+from otx.api.entities.image import Image
+from otx.api.entities.label import Domain, LabelEntity
+from otx.api.entities.prediction_store import (
+    FeatureVectorStore,
+    PredictionStore,
+    SaliencyMapStore,
+    StoredResultMediaEntity,
+    StoredTensorEntity,
+)
+from otx.api.entities.scored_label import ScoredLabel
+from otx.api.utils.dataset_utils import (
+    add_feature_vector_to_dataset_item,
+    add_saliency_maps_to_dataset_item,
+)
+from tests.unit.api.constants.components import OtxSdkComponent
+from tests.unit.api.constants.requirements import Requirements
+
+
+@pytest.mark.components(OtxSdkComponent.OTX_API)
+class TestPredictionStore:
+    @staticmethod
+    def dataset_item() -> DatasetItemEntity:
+        return DatasetItemEntity(
+            media=Image(data=np.zeros((32, 64, 3), dtype=np.uint8)),
+            annotation_scene=AnnotationSceneEntity(annotations=[], kind=AnnotationSceneKind.PREDICTION),
+        )
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    @pytest.mark.parametrize("in_memory", [True, False])
+    def test_feature_vector_store(self, tmp_path, in_memory):
+        """
+        <b>Description:</b>
+        Check FeatureVectorStore keeps the feature vectors as rows of one float16 matrix
+
+        <b>Input data:</b>
+        FeatureVectorStore in memory or memory-mapped to a file, feature vectors
+
+        <b>Expected results:</b>
+        Test passes if the vectors are returned as float32 rows, the matrix is saved to the file and
+        appending more vectors than the capacity or vectors of another size raises an error
+        """
+        path = None if in_memory else str(tmp_path / "features.npy")
+        store = FeatureVectorStore(3, path=path)
+        assert len(store) == 0
+        assert store.matrix.shape == (0, 0)
+
+        feature_vectors = np.random.rand(3, 16).astype(np.float32)
+        assert [store.append(feature_vector) for feature_vector in feature_vectors] == [0, 1, 2]
+        assert len(store) == 3
+        assert store.matrix.dtype == np.float16
+        assert store.get(1).dtype == np.float32
+        assert np.allclose(store.get(1), feature_vectors[1], atol=1e-3)
+        with pytest.raises(IndexError):
+            store.get(3)
+        with pytest.raises(IndexError):
+            store.append(feature_vectors[0])
+
+        store.flush()
+        if path is not None:
+            assert np.array_equal(np.load(path), store.matrix)
+
+        store = FeatureVectorStore(3)
+        store.append(np.zeros(16))
+        with pytest.raises(ValueError):
+            store.append(np.zeros(8))
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    @pytest.mark.parametrize("in_memory", [True, False])
+    def test_saliency_map_store(self, tmp_path, in_memory):
+        """
+        <b>Description:</b>
+        Check SaliencyMapStore stacks saliency maps into chunks
+
+        <b>Input data:</b>
+        SaliencyMapStore in memory or saving its chunks to a directory, saliency maps of two shapes
+
+        <b>Expected results:</b>
+        Test passes if the saliency maps and their class-wise maps are returned by their keys, a chunk is completed
+        when it is full or when the shape changes, a saliency map larger than a chunk makes a chunk on its own and
+        complete chunks are saved to the directory
+        """
+        directory = None if in_memory else str(tmp_path / "saliency_maps")
+        # 2 saliency maps of 3 * 7 * 7 bytes per chunk
+        store = SaliencyMapStore(directory=directory, chunk_bytes=300)
+        saliency_maps = [np.random.randint(0, 255, (3, 7, 7), dtype=np.uint8) for _ in range(3)]
+        saliency_maps.append(np.random.randint(0, 255, (3, 5, 5), dtype=np.uint8))
+        saliency_maps.extend(np.random.randint(0, 255, (2, 3, 10, 10), dtype=np.uint8))
+
+        keys = [store.append(saliency_map) for saliency_map in saliency_maps]
+        assert keys == [(0, 0), (0, 1), (1, 0), (2, 0), (3, 0), (4, 0)]
+        assert len(store) == 6
+        assert store.num_chunks == 5
+        for key, saliency_map in zip(keys, saliency_maps):
+            assert np.array_equal(store.get(key), saliency_map)
+            assert np.array_equal(store.get(key, 1), saliency_map[1])
+        with pytest.raises(IndexError):
+            store.get((4, 1))
+
+        store.flush()
+        for key, saliency_map in zip(keys, saliency_maps):
+            assert np.array_equal(store.get(key), saliency_map)
+            assert np.array_equal(store.get(key, 2), saliency_map[2])
+        if directory is not None:
+            assert sorted(os.listdir(directory)) == [f"chunk_{i:06d}.npy" for i in range(5)]
+
+        with pytest.raises(ValueError):
+            SaliencyMapStore(chunk_bytes=0)
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_stored_entities(self):
+        """
+        <b>Description:</b>
+        Check the metadata entities referring to a PredictionStore read their data from the store
+
+        <b>Input data:</b>
+        PredictionStore, feature vector and class-wise saliency maps
+
+        <b>Expected results:</b>
+        Test passes if "numpy" of the entities returns the stored data, processed for the result media, until it is set
+        """
+        prediction_store = PredictionStore(2, chunk_bytes=1024)
+        feature_vector = np.arange(8, dtype=np.float32)
+        tensor = prediction_store.add_feature_vector(feature_vector)
+        assert isinstance(tensor, StoredTensorEntity)
+        assert tensor.name == "representation_vector"
+        assert tensor.shape == (8,)
+        assert np.array_equal(tensor.numpy, feature_vector)
+        tensor.numpy = np.ones(2)
+        assert np.array_equal(tensor.numpy, np.ones(2))
+        tensor.numpy = None
+        with pytest.raises(ValueError):
+            tensor.numpy
+
+        saliency_map = np.random.randint(0, 255, (2, 4, 8), dtype=np.uint8)
+        key = prediction_store.add_saliency_map(saliency_map)
+        annotation_scene = AnnotationSceneEntity(annotations=[], kind=AnnotationSceneKind.PREDICTION)
+        raw_media = StoredResultMediaEntity(
+            "raw", "saliency_map", annotation_scene, store=prediction_store.saliency_maps, key=key, index=1
+        )
+        assert np.array_equal(raw_media.numpy, saliency_map[1])
+        assert (raw_media.width, raw_media.height) == (8, 4)
+
+        processed_media = StoredResultMediaEntity(
+            "processed",
+            "saliency_map",
+            annotation_scene,
+            store=prediction_store.saliency_maps,
+            key=key,
+            process=lambda data: np.repeat(np.repeat(data, 2, axis=1), 2, axis=2),
+            width=16,
+            height=8,
+        )
+        assert np.array_equal(processed_media.raw_numpy, saliency_map)
+        assert processed_media.numpy.shape == (2, 8, 16)
+        assert (processed_media.width, processed_media.height) == (16, 8)
+        processed_media.numpy = saliency_map[0]
+        assert np.array_equal(processed_media.numpy, saliency_map[0])
+        assert (processed_media.width, processed_media.height) == (8, 4)
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_add_predictions_to_dataset_item(self, tmp_path):
+        """
+        <b>Description:</b>
+        Check feature vectors and saliency maps added to a dataset item with a PredictionStore are kept in the store
+
+        <b>Input data:</b>
+        Dataset item, PredictionStore saving to a directory, feature vector and class-wise saliency maps
+
+        <b>Expected results:</b>
+        Test passes if the metadata of the item refer to the store, saliency maps of the predicted class only are
+        added and they are stored once per item
+        """
+        labels = [LabelEntity(name=f"label_{i}", domain=Domain.CLASSIFICATION, id=str(i)) for i in range(3)]
+        prediction_store = PredictionStore(1, directory=str(tmp_path))
+        dataset_item = self.dataset_item()
+        feature_vector = np.random.rand(1, 16).astype(np.float32)
+        saliency_map = np.random.randint(0, 255, (3, 4, 8), dtype=np.uint8)
+
+        add_feature_vector_to_dataset_item(dataset_item, feature_vector, None, prediction_store)
+        add_saliency_maps_to_dataset_item(
+            dataset_item,
+            saliency_map,
+            None,
+            labels,
+            predicted_scored_labels=[ScoredLabel(labels[2], probability=0.9)],
+            process_saliency_maps=True,
+            prediction_store=prediction_store,
+        )
+        prediction_store.flush()
+
+        tensor, saliency_media = [metadata.data for metadata in dataset_item.get_metadata()]
+        assert isinstance(tensor, StoredTensorEntity)
+        assert np.allclose(tensor.numpy, feature_vector.reshape(-1), atol=1e-3)
+        assert isinstance(saliency_media, StoredResultMediaEntity)
+        assert saliency_media.label == labels[2]
+        assert np.array_equal(saliency_media.raw_numpy, saliency_map[2])
+        assert saliency_media.numpy.shape == (32, 64, 3)
+        assert len(prediction_store.saliency_maps) == 1
+        assert os.path.exists(tmp_path / "feature_vectors.npy")
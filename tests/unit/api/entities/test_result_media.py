@@ -15,7 +15,7 @@ from otx.api.entities.annotation import (
 from otx.api.entities.color import Color
 from otx.api.entities.id import ID
 from otx.api.entities.label import Domain, LabelEntity
-from otx.api.entities.result_media import ResultMediaEntity
+from otx.api.entities.result_media import LazyResultMediaEntity, ResultMediaEntity
 from otx.api.entities.scored_label import ScoredLabel
 from otx.api.entities.shapes.rectangle import Rectangle
 from tests.unit.api.constants.components import OtxSdkComponent
@@ -245,3 +245,43 @@ class TestResultMediaEntity:
             assert result_media != unequal_result_media
         # Comparing ResultMediaEntity with different type object
         assert result_media != str
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_lazy_result_media(self):
+        """
+        <b>Description:</b>
+        Check LazyResultMediaEntity generates its media from the raw data on access
+
+        <b>Input data:</b>
+        LazyResultMediaEntity class object with a low resolution raw data and a function upsampling it
+
+        <b>Expected results:</b>
+        Test passes if "numpy", "width" and "height" properties return the generated media until "numpy" is set,
+        and the raw data if no function is given
+        """
+        raw_numpy = np.random.randint(low=0, high=255, size=(4, 8), dtype=np.uint8)
+        initialization_params = self.default_result_media_parameters()
+        initialization_params["numpy"] = raw_numpy
+        result_media = LazyResultMediaEntity(
+            **initialization_params,
+            process=lambda data: np.repeat(np.repeat(data, 8, axis=0), 8, axis=1),
+            width=64,
+            height=32,
+        )
+        assert np.array_equal(result_media.raw_numpy, raw_numpy)
+        assert result_media.width == 64
+        assert result_media.height == 32
+        assert result_media.numpy.shape == (32, 64)
+        assert np.array_equal(result_media.numpy[::8, ::8], raw_numpy)
+
+        result_media.numpy = RANDOM_IMAGE
+        assert np.array_equal(result_media.numpy, RANDOM_IMAGE)
+        assert result_media.width == 64
+        assert result_media.height == 32
+
+        result_media = LazyResultMediaEntity(**initialization_params, process=None, width=0, height=0)
+        assert np.array_equal(result_media.numpy, raw_numpy)
+        assert result_media.width == 8
+        assert result_media.height == 4
@@ -2,10 +2,13 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import pickle
+
 import pytest
 
 from otx.api.usecases.adapters.model_adapter import (
     ExportableCodeAdapter,
+    FileDataSource,
     IDataSource,
     ModelAdapter,
 )
@@ -42,6 +45,48 @@ class DummyDataSource(IDataSource):
         return self._data
 
 
+@pytest.mark.components(OtxSdkComponent.OTX_API)
+class TestFileDataSource:
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_file_data_source(self, tmp_path):
+        """
+        <b>Description:</b>
+        Check FileDataSource class
+
+        <b>Input data:</b>
+        FileDataSource object pointing to a file on disk
+
+        <b>Expected results:</b>
+        Test passes if the data is read from the file on demand
+
+        <b>Steps</b>
+        1. Check "path" and "data" properties of FileDataSource object
+        2. Check that changes of the file are visible through "data" property
+        3. Check that FileDataSource object can be pickled
+        4. Check ModelAdapter properties initialized with FileDataSource object
+        """
+        file_path = tmp_path / "openvino.bin"
+        file_path.write_bytes(b"weights")
+        data_source = FileDataSource(str(file_path))
+        assert data_source.path == str(file_path)
+        assert data_source.data == b"weights"
+        # Checking that data is read on demand
+        file_path.write_bytes(b"new weights")
+        assert data_source.data == b"new weights"
+        # Checking pickling
+        restored = pickle.loads(pickle.dumps(data_source))
+        assert restored == data_source
+        assert restored.data == b"new weights"
+        # Checking ModelAdapter initialized with FileDataSource
+        model_adapter = ModelAdapter(data_source=data_source)
+        assert model_adapter.file_path == str(file_path)
+        assert model_adapter.from_file_storage
+        assert model_adapter.data == b"new weights"
+        assert ModelAdapter(data_source=b"weights").file_path is None
+
+
 @pytest.mark.components(OtxSdkComponent.OTX_API)
 class TestModelAdapter:
     @pytest.mark.priority_medium
@@ -0,0 +1,151 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import random
+import threading
+import time
+
+import numpy as np
+import pytest
+from openvino.inference_engine.constants import OK
+
+from otx.api.usecases.exportable_code.inference.inference import (
+    AsyncOpenVINOTask,
+    _CompletedRequests,
+)
+from tests.unit.api.constants.components import OtxSdkComponent
+from tests.unit.api.constants.requirements import Requirements
+
+
+class MockOutputBlob:
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+
+class MockInferRequest:
+    def __init__(self, model):
+        self.model = model
+        self.idle = True
+        self.output_blobs = {}
+
+    def set_completion_callback(self, py_callback, py_data):
+        self.callback = py_callback
+        self.data = py_data
+
+    def async_infer(self, inputs):
+        self.idle = False
+
+        def _complete():
+            time.sleep(random.uniform(0, 0.01))
+            self.output_blobs = {"output": MockOutputBlob(inputs)}
+            self.idle = True
+            self.callback(OK, self.data)
+
+        threading.Thread(target=_complete, daemon=True).start()
+
+
+class MockModel:
+    def __init__(self, num_requests):
+        self.requests = [MockInferRequest(self) for _ in range(num_requests)]
+
+    def get_idle_request_id(self):
+        for i, request in enumerate(self.requests):
+            if request.idle:
+                return i
+        return -1
+
+
+class MockInferencer:
+    def __init__(self, num_requests):
+        self.num_requests = num_requests
+        self.model = MockModel(num_requests)
+
+    def pre_process(self, image):
+        return image, {}
+
+    def post_process(self, prediction, metadata):
+        return int(prediction["output"])
+
+
+@pytest.mark.components(OtxSdkComponent.OTX_API)
+class TestAsyncOpenVINOTask:
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_ordered_results(self):
+        """
+        <b>Description:</b>
+        Check that AsyncOpenVINOTask yields every result in the input order when ordered is set
+
+        <b>Input data:</b>
+        Mock inferencer whose requests complete in random order
+
+        <b>Expected results:</b>
+        Test passes if all results are returned in order and latency percentiles are reported
+
+        <b>Steps</b>
+        1. Run AsyncOpenVINOTask with ordered=True and an unbounded buffer
+        2. Check results order and latency percentiles
+        """
+        task = AsyncOpenVINOTask(range(50), MockInferencer(num_requests=4), drop_output=0, ordered=True)
+
+        results = [output for _, output in task]
+
+        assert results == list(range(50))
+        percentiles = task.get_latency_percentiles((50, 99))
+        assert set(percentiles) == {50, 99}
+        assert 0 <= percentiles[50] <= percentiles[99]
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_unordered_results(self):
+        """
+        <b>Description:</b>
+        Check that AsyncOpenVINOTask yields every result with the block policy
+
+        <b>Input data:</b>
+        Mock inferencer whose requests complete in random order
+
+        <b>Expected results:</b>
+        Test passes if no result is lost
+
+        <b>Steps</b>
+        1. Run AsyncOpenVINOTask with the block policy and a small buffer
+        2. Check that all results are returned
+        """
+        task = AsyncOpenVINOTask(range(50), MockInferencer(num_requests=4), drop_output=2, drop_policy="block")
+
+        results = [output for _, output in task]
+
+        assert sorted(results) == list(range(50))
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_drop_policies(self):
+        """
+        <b>Description:</b>
+        Check the drop policies of the completed requests buffer
+
+        <b>Input data:</b>
+        Results of three requests and a buffer of size 2
+
+        <b>Expected results:</b>
+        Test passes if the oldest or the newest result is dropped depending on the policy
+
+        <b>Steps</b>
+        1. Fill the buffer with drop_oldest and drop_newest policies
+        2. Check the remaining results
+        """
+        for drop_policy, expected in (("drop_oldest", [1, 2]), ("drop_newest", [0, 1])):
+            buffer = _CompletedRequests(maxsize=2, drop_policy=drop_policy, ordered=False)
+            for i in range(3):
+                buffer.put(buffer.reserve(), i)
+            assert [buffer.get(timeout=0), buffer.get(timeout=0)] == expected
+            assert buffer.num_dropped == 1
+            assert len(buffer.latencies) == 3
+
+        with pytest.raises(ValueError):
+            AsyncOpenVINOTask(range(1), MockInferencer(num_requests=2), drop_policy="drop_random")
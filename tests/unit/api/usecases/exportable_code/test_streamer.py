@@ -3,6 +3,7 @@
 #
 
 import tempfile
+import threading
 from pathlib import Path
 from time import sleep
 
@@ -78,6 +79,42 @@ class TestStreamer:
             streamer = DirStreamer(path)
             self.assert_streamer_element(streamer)
 
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_dir_streamer_with_prefetch(self):
+        """
+        <b>Description:</b>
+        Test that DirStreamer decoding ahead on a thread pool returns the same images
+
+        <b>Input data:</b>
+        Folder with 10 random images
+
+        <b>Expected results:</b>
+        Test passes if ordered prefetching returns the images in the same order as serial decoding,
+        unordered prefetching returns the same images and reduce_factor downscales the images
+
+        <b>Steps</b>
+        1. Create DirStreamer with and without num_workers
+        2. Compare images from streamers
+        3. Create DirStreamer with reduce_factor and check the image size
+        """
+        with generate_random_image_folder(height=360, width=480) as path:
+            expected = list(DirStreamer(path))
+            ordered = list(DirStreamer(path, num_workers=4, prefetch=3))
+            unordered = list(DirStreamer(path, num_workers=4, ordered=False))
+
+            assert len(ordered) == len(unordered) == len(expected) == 10
+            for frame, expected_frame in zip(ordered, expected):
+                assert (frame == expected_frame).all()
+            assert sorted(frame.tobytes() for frame in unordered) == sorted(frame.tobytes() for frame in expected)
+
+            for frame in DirStreamer(path, num_workers=2, reduce_factor=2):
+                assert frame.shape == (180, 240, 3)
+
+            with pytest.raises(ValueError):
+                DirStreamer(path, reduce_factor=3)
+
     @pytest.mark.priority_medium
     @pytest.mark.unit
     @pytest.mark.reqids(Requirements.REQ_1)
@@ -351,3 +388,109 @@ class TestStreamer:
                     break
 
             assert frame_count == 5
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    @pytest.mark.timeout(30)
+    @pytest.mark.parametrize(
+        "use_thread, copy_frames",
+        [(False, True), (False, False), (True, True)],
+    )
+    def test_threaded_streamer_modes(self, use_thread, copy_frames):
+        """
+        <b>Description:</b>
+        Check that ThreadedStreamer keeps the order of frames through shared memory slots and on a thread
+
+        <b>Input data:</b>
+        Folder with images
+
+        <b>Expected results:</b>
+        Test passes if ThreadedStreamer returns the same frames as the internal streamer in the same order
+
+        <b>Steps</b>
+        1. Create ThreadedStreamer with a buffer smaller than the number of images
+        2. Retrieve frames from ThreadedStreamer and compare them with DirStreamer frames
+        """
+        with generate_random_image_folder(height=360, width=480) as path:
+            expected = [frame.copy() for frame in DirStreamer(path)]
+            streamer = ThreadedStreamer(
+                DirStreamer(path), buffer_size=2, use_thread=use_thread, copy_frames=copy_frames
+            )
+
+            frame_count = 0
+            for frame, expected_frame in zip(streamer, expected):
+                assert frame.shape == expected_frame.shape
+                assert (frame == expected_frame).all()
+                frame_count += 1
+
+            assert frame_count == len(expected)
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    @pytest.mark.timeout(30)
+    def test_threaded_streamer_early_stop(self):
+        """
+        <b>Description:</b>
+        Check that the streaming thread of ThreadedStreamer exits when the consumer stops early
+
+        <b>Input data:</b>
+        Folder with images
+
+        <b>Expected results:</b>
+        Test passes if get_streamer creates a ThreadedStreamer running on a thread and its streaming thread exits
+        after the consumer stops iterating while the buffer is full
+
+        <b>Steps</b>
+        1. Create ThreadedStreamer running on a thread with get_streamer
+        2. Retrieve one frame from ThreadedStreamer and stop iterating
+        3. Check the streaming thread exits
+        """
+        with generate_random_image_folder() as path:
+            streamer = get_streamer(path, loop=True, threaded=True, use_thread=True, copy_frames=False)
+            assert isinstance(streamer, ThreadedStreamer)
+            assert streamer.use_thread and not streamer.copy_frames
+            streamer.buffer_size = 1
+
+            threads = set(threading.enumerate())
+            frames = iter(streamer)
+            next(frames)
+            streaming_threads = set(threading.enumerate()) - threads
+            sleep(0.5)
+            frames.close()
+
+            for thread in streaming_threads:
+                thread.join(timeout=5)
+                assert not thread.is_alive()
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_get_streamer_decoding_options(self):
+        """
+        <b>Description:</b>
+        Check that get_streamer passes the decoding options to the streamers of images
+
+        <b>Input data:</b>
+        Folder with images, single image
+
+        <b>Expected results:</b>
+        Test passes if the streamers decode images with the given number of workers and reduce factor
+
+        <b>Steps</b>
+        1. Call get_streamer with a folder of images and decoding options
+        2. Call get_streamer with an image file and a reduce factor
+        """
+        with generate_random_image_folder(height=360, width=480) as path:
+            streamer = get_streamer(path, num_workers=2, prefetch=3, ordered=False, reduce_factor=2)
+            assert isinstance(streamer, DirStreamer)
+            assert (streamer.num_workers, streamer.prefetch, streamer.ordered) == (2, 3, False)
+            frames = list(streamer)
+            assert len(frames) == len(streamer.names)
+            assert all(frame.shape == (180, 240, 3) for frame in frames)
+
+        with generate_random_single_image(height=360, width=480) as path:
+            streamer = get_streamer(path, reduce_factor=4)
+            assert isinstance(streamer, ImageStreamer)
+            assert streamer.image.shape == (90, 120, 3)
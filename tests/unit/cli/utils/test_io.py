@@ -9,7 +9,7 @@ import numpy as np
 import pytest
 
 from otx.api.entities.model import ModelOptimizationType
-from otx.api.usecases.adapters.model_adapter import ModelAdapter
+from otx.api.usecases.adapters.model_adapter import FileDataSource, ModelAdapter
 from otx.cli.utils import io as target_package
 from otx.cli.utils.io import (
     get_explain_dataset_from_filelist,
@@ -53,6 +53,24 @@ def test_save_model_data(mocker, tmp_dir):
         assert f.readline() == b"fake"
 
 
+@e2e_pytest_unit
+def test_save_model_data_from_file(mocker, tmp_dir):
+    src_path = osp.join(tmp_dir, "src.bin")
+    with open(src_path, "wb") as f:
+        f.write(b"fake")
+    mock_model = mocker.MagicMock()
+    mock_model.model_adapters = {"model.bin": ModelAdapter(FileDataSource(src_path))}
+    output_dir = osp.join(tmp_dir, "output")
+
+    save_model_data(mock_model, output_dir)
+    # saving again to the same file should be a no-op
+    mock_model.model_adapters = {"model.bin": ModelAdapter(FileDataSource(osp.join(output_dir, "model.bin")))}
+    save_model_data(mock_model, output_dir)
+
+    with open(osp.join(output_dir, "model.bin"), "rb") as f:
+        assert f.readline() == b"fake"
+
+
 @e2e_pytest_unit
 def test_read_binary(tmp_dir):
     file_path = osp.join(tmp_dir, "test.txt")
@@ -93,8 +111,10 @@ def test_read_xml_bin_model(mocker, model_adapter_keys, tmp_dir):
     model_adapters = model.model_adapters
     assert model_adapters["openvino.xml"].data == b"xml_model"
     assert model_adapters["openvino.bin"].data == b"bin_model"
+    assert model_adapters["openvino.bin"].file_path == str(bin_model_path)
     for key in model_adapter_keys:
         assert model_adapters[key].data == bytes(key, "utf-8")
+    assert model_adapters["tile_classifier.xml"].data == b""
 
 
 @e2e_pytest_unit
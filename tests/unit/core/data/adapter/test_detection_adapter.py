@@ -63,6 +63,31 @@ class TestOTXDetectionDatasetAdapter:
         assert isinstance(det_test_dataset_adapter.get_otx_dataset(), DatasetEntity)
         assert isinstance(det_test_dataset_adapter.get_label_schema(), LabelSchemaEntity)
 
+    @e2e_pytest_unit
+    def test_convert_items(self):
+        class MockDatumDataset:
+            def __init__(self, items):
+                self._items = items
+
+            def subsets(self):
+                return {"default": self._items}
+
+        adapter = DetectionDatasetAdapter.__new__(DetectionDatasetAdapter)
+        adapter.dataset = {
+            Subset.TRAINING: MockDatumDataset([[2, 0], [0], []]),
+            Subset.VALIDATION: MockDatumDataset([[1, 2]]),
+        }
+
+        def convert_item(subset, labels, used_labels):
+            for label in labels:
+                used_labels[label] = None
+            return (subset, labels) if labels else None
+
+        dataset_items, used_labels = adapter._convert_items_with_labels(convert_item)
+        assert dataset_items == [(Subset.TRAINING, [2, 0]), (Subset.TRAINING, [0]), (Subset.VALIDATION, [1, 2])]
+        # labels of every subset in first-seen order
+        assert used_labels == [2, 0, 1]
+
     @e2e_pytest_unit
     def test_get_subset_data(self):
         class MockDatumDataset:
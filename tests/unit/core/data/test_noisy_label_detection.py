@@ -0,0 +1,47 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import numpy as np
+
+from otx.core.data.noisy_label_detection import LossDynamicsStore
+from tests.test_suite.e2e_test_system import e2e_pytest_unit
+
+
+class TestLossDynamicsStore:
+    @e2e_pytest_unit
+    def test_append_and_group_by_key(self):
+        store = LossDynamicsStore(initial_capacity=4)
+        expected = {}
+        for iter in range(5):
+            keys = [("item", i) for i in range(iter, iter + 3)]
+            values = [0.5 * iter + i for i in range(3)]
+            store.append(iter, keys, values)
+            for key, value in zip(keys, values):
+                expected.setdefault(key, []).append((iter, value))
+
+        assert len(store) == 15
+        assert store.keys == sorted(expected.keys())
+
+        for key, iters, values in store.group_by_key():
+            assert iters.tolist() == [iter for iter, _ in expected[key]]
+            assert values.dtype == np.float16
+            assert np.allclose(values, [value for _, value in expected[key]], atol=1e-2)
+
+    @e2e_pytest_unit
+    def test_geometric_growth(self):
+        store = LossDynamicsStore(initial_capacity=4)
+        capacities = set()
+        for iter in range(1000):
+            store.append(iter, [("item", iter % 7)], [0.1])
+            capacities.add(len(store._iters))
+
+        assert len(store) == 1000
+        assert sorted(capacities) == [4 * 2**i for i in range(9)]
+
+    @e2e_pytest_unit
+    def test_empty(self):
+        store = LossDynamicsStore()
+        store.append(0, [], [])
+        assert len(store) == 0
+        assert list(store.group_by_key()) == []
@@ -83,6 +83,25 @@ class TestSortedDict:
         instance.clear()
         assert len(instance) == 0
 
+    @e2e_pytest_unit
+    def test_ties_and_removal(self):
+        instance = SortedDict("key")
+        instance["b"] = {"edge": {"key": 1}}
+        instance["a"] = {"edge": {"key": 0}}
+        instance["c"] = {"edge": {"key": 1}}
+        instance["d"] = {"edge": {}}
+        instance["e"] = {"edge": {"key": 0}}
+        assert list(instance) == ["a", "e", "b", "c", "d"]
+
+        del instance["e"]
+        assert instance.pop("x", None) is None
+        assert instance.pop("b") == {"edge": {"key": 1}}
+        assert list(instance) == ["a", "c", "d"]
+        assert list(reversed(instance)) == ["d", "c", "a"]
+
+        instance["b"] = {"edge": {"key": 1}}
+        assert list(instance) == ["a", "c", "b", "d"]
+
 
 class TestGraph:
     @pytest.fixture(autouse=True)
@@ -181,3 +200,25 @@ class TestGraph:
         self.graph.clean_up()
 
         assert n_nodes > len(self.graph)
+
+    @e2e_pytest_unit
+    def test_from_ov_large_graph(self):
+        param = ov.opset10.parameter([1, 8, 16, 16], ov.Type.f32, name="in")
+        node = param
+        n_blocks = 200
+        for _ in range(n_blocks):
+            branch = ov.opset10.relu(node)
+            branch = ov.opset10.clamp(branch, 0, 6)
+            node = ov.opset10.add(node, branch, "numpy")
+        result = ov.opset10.result(node, name="out")
+        ov_model = ov.Model([result], [param], "model")
+
+        graph = Graph.from_ov(ov_model)
+        assert len(graph) == len(ov_model.get_ordered_ops())
+        for add_node in graph.get_nodes_by_types(["Add"]):
+            in_ports = [
+                edge["in_port"] for _, edges in graph.predecessors(add_node, with_edge_data=True) for edge in edges
+            ]
+            assert sorted(in_ports) == [0, 1]
+            assert list(graph._pred[add_node].keys()) == list(graph.predecessors(add_node))
+            assert graph._pred[add_node]._sorted_keys[0][0] == 0
@@ -43,3 +43,27 @@ class TestOVModel:
             shape = [1 if i == -1 else i for i in shape]
             data[key] = torch.randn(shape)
         model(**data)
+
+    @e2e_pytest_unit
+    def test_forward_plan(self):
+
+        param = ov.opset10.parameter([1, 3, 8, 8], ov.Type.f32, name="in")
+        node = ov.opset10.relu(param)
+        branch = ov.opset10.clamp(node, 0, 6)
+        node = ov.opset10.add(node, branch, "numpy")
+        result = ov.opset10.result(node, name="out")
+        ov_model = ov.Model([result], [param], "model")
+
+        model = OVModel(model_path_or_model=ov_model, merge_bn=False, paired_bn=False)
+        plan = model.build_forward_plan()
+        assert [step[0] for step in plan] == list(model.model.keys())
+        released = [name for _, _, _, releases in plan for name in releases]
+        assert len(released) == len(set(released))
+        assert "out" not in released
+
+        data = torch.randn(1, 3, 8, 8)
+        outputs = model(data)
+        expected = torch.relu(data) + torch.clamp(torch.relu(data), 0, 6)
+        assert torch.allclose(outputs["out"], expected)
+        assert list(model.features.keys()) == ["out"]
+        assert model._forward_plan is not None